@@ -69,6 +69,7 @@ class Settings(BaseSettings):
     conversation_openai_model: str = "gpt-4o-mini"
     conversation_deepseek_model: str = "deepseek-chat"
     conversation_history_messages: int = 6
+    conversation_max_history_tokens: int = 2000
     conversation_max_tokens: int = 350
     conversation_temperature: float = 0.6
     conversation_timeout_seconds: float = 20.0
@@ -99,6 +100,8 @@ class Settings(BaseSettings):
     # Session store (Redis)
     redis_enabled: bool = False
     redis_url: str = ""
+    redis_max_connections: int = 32
+    redis_socket_timeout_seconds: float = 5.0
     session_ttl_seconds: int = 6 * 60 * 60
 
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, DateTime, ForeignKey, Float
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Float, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 
@@ -11,6 +11,9 @@ class UserProgress(Base):
     Usado para implementar o algoritmo de spaced repetition.
     """
     __tablename__ = "user_progress"
+    __table_args__ = (
+        Index("ix_up_user_reps", "user_id", "repetitions"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
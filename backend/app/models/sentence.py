@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Float, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 
@@ -57,6 +57,9 @@ class SentenceReview(Base):
 class UserSentenceProgress(Base):
     """Progresso do usuário em frases específicas"""
     __tablename__ = "user_sentence_progress"
+    __table_args__ = (
+        Index("ix_usp_user_sentence", "user_id", "sentence_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import enum
 from typing import Optional
 
-from sqlalchemy import Integer, String, Text
+from sqlalchemy import Boolean, Index, Integer, String, Text, and_, false, func, or_
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -45,6 +45,54 @@ class Word(Base):
     tags: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)  # Tags separadas por vírgula: "comida,viagem,negócios"
     audio_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)  # URL do áudio (futuro)
 
+    # Free Dictionary API respondeu 404 (enrich_words_api não consulta de novo)
+    dict_en_404: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, server_default=false())
+
     # Relationships
     reviews: Mapped[list["Review"]] = relationship("Review", back_populates="word")
     progress: Mapped[list["UserProgress"]] = relationship("UserProgress", back_populates="word")
+
+
+# Buscas case-insensitive (ex.: RAGService) filtram por lower(english).
+Index("ix_words_lower_english", func.lower(Word.english))
+
+# Campos cujo vazio (NULL ou '') marca a palavra como pendente de enriquecimento
+# (filtro padrão de enrich_words_api.enrich_all_words).
+ENRICHMENT_FIELDS = ("word_type", "definition_en", "synonyms", "antonyms", "collocations", "usage_notes", "ipa")
+
+
+def missing_enrichment_filters() -> list:
+    columns = [getattr(Word, field) for field in ENRICHMENT_FIELDS]
+    return [(column == None) | (column == "") for column in columns]  # noqa: E711
+
+
+# Índice parcial só com as palavras pendentes: o script pagina por id dentro dele
+# em vez de varrer a tabela. O predicado precisa ser o mesmo OR usado na query.
+Index(
+    "ix_words_needs_enrichment",
+    Word.id,
+    postgresql_where=or_(*missing_enrichment_filters()),
+)
+
+
+# Headwords que vale consultar na Free Dictionary API: a mesma regra de
+# enrich_words_api.is_headword_candidate_for_english_dictionary (uma palavra
+# ASCII, até 60 caracteres), como regex do PostgreSQL.
+HEADWORD_SQL_PATTERN = "^[[:space:]]*[A-Za-z][A-Za-z'-]{0,59}[[:space:]]*$"
+
+
+def headword_candidate_filter():
+    return Word.english.op("~")(HEADWORD_SQL_PATTERN)
+
+
+def not_dict_404_filter():
+    return Word.dict_en_404 == False  # noqa: E712
+
+
+# Candidatos ao dicionário ainda sem 404: o script filtra no banco em vez de
+# trazer as linhas para descartá-las em Python. Mesmo predicado da query.
+Index(
+    "ix_words_dictionary_candidates",
+    Word.id,
+    postgresql_where=and_(headword_candidate_filter(), not_dict_404_filter()),
+)
@@ -1,6 +1,6 @@
 from datetime import datetime, timedelta, timezone
 import logging
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
@@ -39,6 +39,14 @@ from app.schemas.user import (
 
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 logger = logging.getLogger(__name__)
+
+
+def _send_link_email(send, to_email: str, url: str) -> None:
+    """Envia o email após a resposta (BackgroundTasks); falhas só podem ser logadas."""
+    try:
+        send(to_email, url)
+    except Exception:
+        logger.exception("Falha ao enviar email (%s) para %s", send.__name__, to_email)
 
 
 @router.post("/register", response_model=UserResponse)
@@ -267,7 +275,12 @@ def change_password(
 
 
 @router.post("/forgot-password")
-def forgot_password(request: Request, payload: PasswordResetRequest, db: Session = Depends(get_db)):
+def forgot_password(
+    request: Request,
+    payload: PasswordResetRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+):
     """Solicitar redefinicao de senha"""
     settings = get_settings()
     client_ip = get_client_ip(request)
@@ -291,20 +304,21 @@ def forgot_password(request: Request, payload: PasswordResetRequest, db: Session
     reset_url = f"{base_url}/reset-password?token={reset_token}"
 
     if is_smtp_configured():
+        if settings.environment.lower() == "production":
+            # Responde sem esperar o SMTP; também evita diferença de tempo entre
+            # emails cadastrados e não cadastrados.
+            background_tasks.add_task(_send_link_email, send_password_reset_email, user.email, reset_url)
+            return {"message": default_message}
         try:
             send_password_reset_email(user.email, reset_url)
             return {"message": default_message}
         except Exception:
             logger.exception("Falha ao enviar email de redefinicao para %s", user.email)
-            if settings.environment.lower() != "production":
-                return {
-                    "message": "Falha no envio de email (dev). Use o link abaixo.",
-                    "reset_url": reset_url,
-                }
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Nao foi possivel enviar o email de redefinicao agora. Tente novamente em instantes.",
-            )
+            # Produção já retornou acima (envio em background): aqui é sempre dev.
+            return {
+                "message": "Falha no envio de email (dev). Use o link abaixo.",
+                "reset_url": reset_url,
+            }
 
     if settings.environment.lower() != "production":
         return {"message": "Reset gerado (ambiente de desenvolvimento).", "reset_url": reset_url}
@@ -316,7 +330,12 @@ def forgot_password(request: Request, payload: PasswordResetRequest, db: Session
 
 
 @router.post("/resend-verification")
-def resend_verification_email(request: Request, payload: PasswordResetRequest, db: Session = Depends(get_db)):
+def resend_verification_email(
+    request: Request,
+    payload: PasswordResetRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+):
     """Reenviar email de confirmacao"""
     settings = get_settings()
     require_email_verification = bool(getattr(settings, "auth_require_email_verification", True))
@@ -351,14 +370,7 @@ def resend_verification_email(request: Request, payload: PasswordResetRequest, d
 
     verify_token = create_email_verification_token(user.id)
     verify_url = f"{settings.frontend_base_url.rstrip('/')}/verify-email?token={verify_token}"
-    try:
-        send_email_verification_email(user.email, verify_url)
-    except Exception:
-        logger.exception("Falha ao reenviar email de confirmacao para %s", user.email)
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Nao foi possivel reenviar o email de confirmacao agora. Tente novamente em instantes.",
-        )
+    background_tasks.add_task(_send_link_email, send_email_verification_email, user.email, verify_url)
 
     return {"message": default_message}
 
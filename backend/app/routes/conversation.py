@@ -7,7 +7,6 @@ from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile,
 from fastapi.responses import StreamingResponse, JSONResponse
 from sqlalchemy.orm import Session
 from typing import Optional
-import io
 import uuid
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
@@ -18,7 +17,7 @@ from app.core.database import get_db
 from app.core.security import get_current_user
 from app.models.user import User
 from app.services.openai_tts_service import openai_tts_service
-from app.services.conversation_ai_service import conversation_ai_service
+from app.services.conversation_ai_service import ConversationAIService, get_conversation_ai_service
 from app.services.ai_teacher import ai_teacher_service
 from app.models.conversation_lesson import ConversationLessonAttempt
 from app.models.audio_attempt import AudioAttempt
@@ -49,8 +48,13 @@ router = APIRouter(prefix="/api/conversation", tags=["Conversation"])
 
 logger = logging.getLogger(__name__)
 
-def _ensure_conversation_owner(conversation_id: str, current_user: User) -> None:
-    conversation = conversation_ai_service.get_conversation(conversation_id)
+def _ensure_conversation_owner(
+    conversation_id: str,
+    current_user: User,
+    conversation_service: Optional[ConversationAIService] = None,
+) -> None:
+    service = conversation_service or get_conversation_ai_service()
+    conversation = service.get_conversation(conversation_id, include_messages=False)
     if not conversation or conversation.get("user_id") != current_user.id:
         # Avoid leaking whether the conversation exists for another user.
         raise HTTPException(
@@ -71,16 +75,16 @@ async def text_to_speech(
     Retorna o áudio em formato MP3
     """
     try:
-        audio_data = openai_tts_service.text_to_speech(
+        audio_chunks = await openai_tts_service.text_to_speech_stream(
             text=request.text,
             voice_id=request.voice_id,
             model_id=request.model_id,
             voice_settings=request.voice_settings
         )
         
-        # Retorna o áudio como stream
+        # Retorna o áudio como stream, repassando os chunks conforme chegam
         return StreamingResponse(
-            io.BytesIO(audio_data),
+            audio_chunks,
             media_type="audio/mpeg",
             headers={
                 "Content-Disposition": "attachment; filename=speech.mp3"
@@ -180,14 +184,15 @@ async def list_voices(
 async def start_conversation(
     request: ConversationCreateRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    conversation_service: ConversationAIService = Depends(get_conversation_ai_service),
 ):
     """
     Inicia uma nova conversação com IA
     """
     try:
         # Cria conversação usando o serviço híbrido (LLM + ElevenLabs TTS)
-        result = conversation_ai_service.create_conversation(
+        result = conversation_service.create_conversation(
             user_id=current_user.id,
             system_prompt=request.system_prompt,
         )
@@ -196,7 +201,7 @@ async def start_conversation(
 
         # Se houver mensagem inicial, adiciona ao histórico e gera resposta (sem áudio)
         if request.initial_message:
-            conversation_ai_service.send_message(
+            conversation_service.send_message(
                 conversation_id=conversation_id,
                 user_message=request.initial_message,
                 generate_audio=False,
@@ -227,14 +232,15 @@ async def start_conversation(
 async def start_lesson(
     request: LessonStartRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    conversation_service: ConversationAIService = Depends(get_conversation_ai_service),
 ):
     """Inicia uma lição baseada em perguntas fixas"""
     try:
         questions = request.questions
         if request.num_questions:
             questions = questions[: max(1, int(request.num_questions))]
-        result = conversation_ai_service.create_lesson(
+        result = conversation_service.create_lesson(
             user_id=current_user.id,
             questions=questions,
             native_language=request.native_language,
@@ -261,11 +267,12 @@ async def start_lesson(
 async def generate_lesson_questions(
     request: LessonGenerateRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    conversation_service: ConversationAIService = Depends(get_conversation_ai_service),
 ):
     """Gera perguntas para uma lição baseada em um tema"""
     try:
-        questions = conversation_ai_service.generate_lesson_questions(
+        questions = conversation_service.generate_lesson_questions(
             topic=request.topic,
             num_questions=request.num_questions,
             db=db,
@@ -287,15 +294,16 @@ async def send_message(
     conversation_id: str,
     request: MessageRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    conversation_service: ConversationAIService = Depends(get_conversation_ai_service),
 ):
     """
     Envia uma mensagem na conversação e recebe resposta da IA com áudio
     """
     try:
-        _ensure_conversation_owner(conversation_id, current_user)
+        _ensure_conversation_owner(conversation_id, current_user, conversation_service)
         # Envia mensagem e recebe resposta (texto) e opcionalmente áudio (bytes)
-        result = conversation_ai_service.send_message(
+        result = conversation_service.send_message(
             conversation_id=conversation_id,
             user_message=request.message,
             generate_audio=False,
@@ -336,18 +344,20 @@ async def send_lesson_message(
     conversation_id: str,
     request: LessonMessageRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    conversation_service: ConversationAIService = Depends(get_conversation_ai_service),
 ):
     """Envia resposta do aluno na lição e recebe resposta da IA"""
     try:
-        _ensure_conversation_owner(conversation_id, current_user)
-        result = conversation_ai_service.send_lesson_message(
+        _ensure_conversation_owner(conversation_id, current_user, conversation_service)
+        result = conversation_service.send_lesson_message(
             conversation_id=conversation_id,
             user_message=request.message,
             db=db,
             user_id=current_user.id,
         )
         db.commit()
+        lesson = result.pop("lesson", None) or {}
 
         if result.get("is_final"):
             score = None
@@ -360,8 +370,6 @@ async def send_lesson_message(
                 except Exception:
                     score = None
 
-            conversation = conversation_ai_service.get_conversation(conversation_id) or {}
-            lesson = conversation.get("lesson") or {}
             attempt = ConversationLessonAttempt(
                 user_id=current_user.id,
                 native_language=lesson.get("native_language") or "pt-BR",
@@ -523,14 +531,15 @@ async def transcribe_conversation_audio(
 async def get_conversation_history(
     conversation_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    conversation_service: ConversationAIService = Depends(get_conversation_ai_service),
 ):
     """
     Obtém o histórico completo de uma conversação
     """
     try:
-        _ensure_conversation_owner(conversation_id, current_user)
-        messages = conversation_ai_service.get_conversation_history(conversation_id)
+        _ensure_conversation_owner(conversation_id, current_user, conversation_service)
+        messages = conversation_service.get_conversation_history(conversation_id)
         
         return ConversationHistoryResponse(
             conversation_id=conversation_id,
@@ -555,14 +564,15 @@ async def end_conversation(
     conversation_id: str,
     request: Optional[ConversationEndRequest] = None,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    conversation_service: ConversationAIService = Depends(get_conversation_ai_service),
 ):
     """
     Encerra uma conversação
     """
     try:
-        _ensure_conversation_owner(conversation_id, current_user)
-        summary = conversation_ai_service.end_conversation(conversation_id)
+        _ensure_conversation_owner(conversation_id, current_user, conversation_service)
+        summary = conversation_service.end_conversation(conversation_id)
         
         return ConversationEndResponse(
             conversation_id=conversation_id,
@@ -586,13 +596,14 @@ async def end_conversation(
 @router.get("/active/list")
 async def list_active_conversations(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    conversation_service: ConversationAIService = Depends(get_conversation_ai_service),
 ):
     """
     Lista todas as conversações ativas do usuário atual
     """
     try:
-        user_conversations = conversation_ai_service.list_active_conversations(
+        user_conversations = conversation_service.list_active_conversations(
             user_id=current_user.id
         )
         
@@ -23,6 +23,7 @@ from app.models.progress import UserProgress
 from app.models.gamification import UserStats, GameSession
 from app.models.sentence import Sentence
 from app.services.spaced_repetition import calculate_next_review
+from app.services.rag_service import invalidate_user_stats
 from app.services.achievements import check_and_unlock_achievements
 from app.services.ai_teacher import ai_teacher_service
 from app.services.session_store import get_session_store
@@ -2472,6 +2473,7 @@ def submit_matching(
     )
     db.add(game_session)
     db.commit()
+    invalidate_user_stats(current_user.id)
     new_achievements = check_achievements(db, current_user.id, stats)
     
     _delete_session(request.session_id)
@@ -26,7 +26,7 @@ from app.schemas.sentence import (
     AIConversationResponse
 )
 from app.services.ai_teacher import ai_teacher_service
-from app.services.rag_service import rag_service
+from app.services.rag_service import invalidate_user_stats, rag_service
 from app.services.spaced_repetition import calculate_next_review
 
 router = APIRouter(prefix="/api/sentences", tags=["sentences"])
@@ -377,6 +377,7 @@ def submit_sentence_review(
     progress.next_review = datetime.utcnow() + timedelta(days=next_review_data["interval"])
 
     db.commit()
+    invalidate_user_stats(current_user.id)
     db.refresh(db_review)
 
     return db_review
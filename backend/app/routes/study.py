@@ -12,6 +12,7 @@ from app.models.word import Word
 from app.models.review import Review
 from app.models.progress import UserProgress
 from app.services.spaced_repetition import calculate_next_review
+from app.services.rag_service import invalidate_user_stats
 from app.schemas.review import ReviewCreate, ReviewResponse, StudySession, StudyCard, ProgressStats
 from app.schemas.word import WordResponse
 from app.services.word_examples import get_best_word_example, needs_example_regeneration
@@ -204,6 +205,7 @@ def submit_review(
         stats.longest_streak = current_user.current_streak  # type: ignore[assignment]
     
     db.commit()
+    invalidate_user_stats(current_user.id)
     check_and_unlock_achievements(db, current_user.id)
     db.refresh(review)
     
@@ -5,11 +5,12 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from app.core.security import get_current_user, require_admin
 from app.models.user import User
 from app.schemas.support import SupportAdminEmailRequest, SupportContactRequest
+from app.services import email_queue
 from app.services.email_service import (
+    build_support_acknowledgement,
+    build_support_message_to_team,
     is_smtp_configured,
-    send_support_acknowledgement,
     send_support_email_to_student,
-    send_support_message_to_team,
 )
 
 router = APIRouter(prefix="/api/support", tags=["Support"])
@@ -17,7 +18,7 @@ logger = logging.getLogger(__name__)
 
 
 @router.post("/contact")
-def contact_support(
+async def contact_support(
     payload: SupportContactRequest,
     current_user: User = Depends(get_current_user),
 ):
@@ -28,7 +29,7 @@ def contact_support(
         )
 
     try:
-        send_support_message_to_team(
+        team_msg = build_support_message_to_team(
             student_name=current_user.name,
             student_email=current_user.email,
             student_phone=current_user.phone_number,
@@ -37,11 +38,14 @@ def contact_support(
             category=payload.category,
             context_url=payload.context_url,
         )
-        send_support_acknowledgement(
+        ack_msg = build_support_acknowledgement(
             student_email=current_user.email,
             student_name=current_user.name,
             subject=payload.subject,
         )
+        # A confirmação ao aluno só sai depois que a equipe recebeu a mensagem.
+        await email_queue.submit(team_msg)
+        await email_queue.submit(ack_msg)
     except Exception:
         logger.exception("Falha ao enviar mensagem de suporte do usuario %s", current_user.email)
         raise HTTPException(
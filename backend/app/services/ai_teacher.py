@@ -812,7 +812,10 @@ Always respond in Portuguese unless the student practices in English."""
                     provider = "lemonfox"
                     model = "tts"
             else:
-                response = self.openai_client.audio.speech.create(
+                # Cliente síncrono: roda numa thread para não travar o event loop
+                # (permite gerar vários áudios em paralelo).
+                response = await asyncio.to_thread(
+                    self.openai_client.audio.speech.create,
                     model="tts-1",  # Modelo mais rápido e barato
                     voice=voice,
                     input=safe_text,  # Limite de caracteres do OpenAI TTS
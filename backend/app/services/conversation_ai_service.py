@@ -6,6 +6,7 @@
 import uuid
 import json
 import re
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from sqlalchemy.orm import Session
@@ -75,12 +76,16 @@ class ConversationAIService:
             # NOTE: legacy SDK timeout/retry behavior depends on requests; keep defaults.
         else:
             raise ValueError("Biblioteca OpenAI não está instalada no backend")
+        # Resolve the SDK variant once instead of branching on every call.
+        self._chat = self._chat_v1 if self.client is not None else self._chat_legacy
 
         self.history_messages = max(1, int(settings.conversation_history_messages))
+        self.max_history_tokens = max(100, int(settings.conversation_max_history_tokens))
         self.max_tokens = max(50, int(settings.conversation_max_tokens))
         self.temperature = float(settings.conversation_temperature)
         self.store = get_session_store()
         self._prefix = "conversation:"
+        self._messages_prefix = "conversation-messages:"
         ttl = int(getattr(settings, "session_ttl_seconds", 0) or 0)
         self.session_ttl_seconds = ttl if ttl > 0 else 6 * 60 * 60
 
@@ -111,28 +116,99 @@ class ConversationAIService:
             meta_json=meta_json,
         )
     
+    def _chat_v1(
+        self, messages: List[Dict[str, str]], *, max_tokens: int, temperature: float
+    ) -> tuple[str, Optional[str], Dict[str, int]]:
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        content = (response.choices[0].message.content or "").strip()
+        return content, parse_model_name(response, self.model), parse_usage_tokens(getattr(response, "usage", None))
+
+    def _chat_legacy(
+        self, messages: List[Dict[str, str]], *, max_tokens: int, temperature: float
+    ) -> tuple[str, Optional[str], Dict[str, int]]:
+        # SDK antigo
+        response = openai_legacy.ChatCompletion.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        content = response.choices[0].message.content.strip()
+        usage = parse_usage_tokens(response.get("usage") if isinstance(response, dict) else None)
+        return content, parse_model_name(response, self.model), usage
+
+    @staticmethod
+    def _est_tokens(message: Dict[str, Any]) -> int:
+        # Rough heuristic (~4 chars per token); good enough to keep the prompt within budget.
+        return (len(message["content"]) + len(message["role"])) // 4
+
+    def _recent_history(self, history: List[Dict[str, Any]], max_messages: int) -> List[Dict[str, Any]]:
+        """Mensagens mais recentes que cabem no orçamento de tokens (sempre inclui a última)."""
+        recent: List[Dict[str, Any]] = []
+        budget = self.max_history_tokens
+        for msg in reversed(history[-max_messages:]):
+            budget -= self._est_tokens(msg)
+            if budget < 0 and recent:
+                break
+            recent.append({"role": msg["role"], "content": msg["content"]})
+        recent.reverse()
+        return recent
+
     def _key(self, conversation_id: str) -> str:
         return f"{self._prefix}{conversation_id}"
 
-    def get_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
-        return self.store.get(self._key(conversation_id))
+    def _messages_key(self, conversation_id: str) -> str:
+        return f"{self._messages_prefix}{conversation_id}"
+
+    def get_conversation(
+        self, conversation_id: str, *, include_messages: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        metadata = self.store.get(self._key(conversation_id))
+        if metadata is None:
+            return None
+        conversation = dict(metadata)
+        if include_messages:
+            conversation["messages"] = self.store.get_list(self._messages_key(conversation_id))
+        return conversation
 
     def _save_conversation(self, conversation_id: str, conversation: Dict[str, Any]) -> None:
-        self.store.set(self._key(conversation_id), conversation, ttl_seconds=self.session_ttl_seconds)
+        # Messages live in their own append-only list; only metadata is rewritten here.
+        metadata = {key: value for key, value in conversation.items() if key != "messages"}
+        self.store.set(self._key(conversation_id), metadata, ttl_seconds=self.session_ttl_seconds)
+
+    def _append_messages(self, conversation_id: str, messages: List[Dict[str, Any]]) -> None:
+        self.store.append_list(
+            self._messages_key(conversation_id),
+            messages,
+            ttl_seconds=self.session_ttl_seconds,
+        )
+
+    def _save_turn(
+        self,
+        conversation_id: str,
+        conversation: Dict[str, Any],
+        new_messages: List[Dict[str, Any]],
+    ) -> None:
+        self._append_messages(conversation_id, new_messages)
+        conversation["message_count"] = len(conversation["messages"])
+        conversation["last_message"] = new_messages[-1]["content"][:50] + "..."
+        self._save_conversation(conversation_id, conversation)
 
     def _delete_conversation(self, conversation_id: str) -> None:
         self.store.delete(self._key(conversation_id))
+        self.store.delete(self._messages_key(conversation_id))
 
     @property
     def active_conversations(self) -> Dict[str, Dict[str, Any]]:
-        conversations: Dict[str, Dict[str, Any]] = {}
-        for key in self.store.list_keys(self._prefix):
-            conversation = self.store.get(key)
-            if not isinstance(conversation, dict):
-                continue
-            conv_id = key[len(self._prefix) :]
-            conversations[conv_id] = conversation
-        return conversations
+        return {
+            key[len(self._prefix) :]: conversation
+            for key, conversation in self.store.get_by_prefix(self._prefix).items()
+        }
 
     def create_conversation(
         self,
@@ -265,28 +341,9 @@ class ConversationAIService:
         ]
 
         try:
-            model_name: Optional[str] = self.model
-            usage: Dict[str, int] = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
-            if self.client is not None:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    temperature=0.7,
-                    max_tokens=250,
-                )
-                raw = (response.choices[0].message.content or "").strip()
-                model_name = parse_model_name(response, self.model)
-                usage = parse_usage_tokens(getattr(response, "usage", None))
-            else:
-                response = openai_legacy.ChatCompletion.create(
-                    model=self.model,
-                    messages=messages,
-                    temperature=0.7,
-                    max_tokens=250,
-                )
-                raw = response.choices[0].message.content.strip()
-                model_name = parse_model_name(response, self.model)
-                usage = parse_usage_tokens(response.get("usage") if isinstance(response, dict) else None)
+            raw, model_name, usage = self._chat(
+                messages, max_tokens=250, temperature=0.7
+            )
 
             self._track_usage(
                 db,
@@ -361,26 +418,25 @@ class ConversationAIService:
 
         lesson["answers"].append(user_message)
 
-        conversation["messages"].append({
+        user_entry = {
             "role": "user",
             "content": user_message,
             "timestamp": datetime.utcnow().isoformat(),
-        })
+        }
+        conversation["messages"].append(user_entry)
 
         messages = [
             {"role": "system", "content": conversation["system_prompt"]}
         ]
 
-        recent_messages = conversation["messages"][-min(self.history_messages, 6) :]
-        for msg in recent_messages:
-            messages.append({"role": msg["role"], "content": msg["content"]})
+        messages.extend(self._recent_history(conversation["messages"], min(self.history_messages, 6)))
 
         if is_last:
-            qa_pairs = []
-            for i, question in enumerate(questions):
-                answer = lesson["answers"][i] if i < len(lesson["answers"]) else ""
-                qa_pairs.append(f"Q{i + 1}: {question}\nA{i + 1}: {answer}")
-            qa_block = "\n\n".join(qa_pairs)
+            answers: List[str] = lesson["answers"]
+            transcript = "\n\n".join(
+                f"Q{i + 1}: {question}\nA{i + 1}: {answers[i] if i < len(answers) else ''}"
+                for i, question in enumerate(questions)
+            )
             messages.append({
                 "role": "system",
                 "content": (
@@ -389,7 +445,7 @@ class ConversationAIService:
                     "Include corrections with **bold**, tips, pronunciation advice, and a final score (0-100). "
                     "Add a line exactly like: Score: 85\n\n"
                     "Full lesson transcript (questions and student answers):\n"
-                    f"{qa_block}"
+                    f"{transcript}"
                 ),
             })
         else:
@@ -403,28 +459,9 @@ class ConversationAIService:
             max_tokens = max(120, min(self.max_tokens, 450))
             final_max_tokens = max(300, min(self.max_tokens, 900))
             lesson_max_tokens = final_max_tokens if is_last else max_tokens
-            model_name: Optional[str] = self.model
-            usage: Dict[str, int] = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
-            if self.client is not None:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    temperature=self.temperature,
-                    max_tokens=lesson_max_tokens,
-                )
-                ai_response = (response.choices[0].message.content or "").strip()
-                model_name = parse_model_name(response, self.model)
-                usage = parse_usage_tokens(getattr(response, "usage", None))
-            else:
-                response = openai_legacy.ChatCompletion.create(
-                    model=self.model,
-                    messages=messages,
-                    temperature=self.temperature,
-                    max_tokens=lesson_max_tokens,
-                )
-                ai_response = response.choices[0].message.content.strip()
-                model_name = parse_model_name(response, self.model)
-                usage = parse_usage_tokens(response.get("usage") if isinstance(response, dict) else None)
+            ai_response, model_name, usage = self._chat(
+                messages, max_tokens=lesson_max_tokens, temperature=self.temperature
+            )
 
             self._track_usage(
                 db,
@@ -439,11 +476,13 @@ class ConversationAIService:
         except Exception as e:
             raise ValueError(f"Erro ao gerar resposta da IA: {str(e)}")
 
-        conversation["messages"].append({
+        replied_at = datetime.utcnow().isoformat()
+        ai_entry = {
             "role": "assistant",
             "content": ai_response,
-            "timestamp": datetime.utcnow().isoformat(),
-        })
+            "timestamp": replied_at,
+        }
+        conversation["messages"].append(ai_entry)
 
 
         if is_last:
@@ -451,8 +490,6 @@ class ConversationAIService:
         else:
             lesson["current_index"] = idx + 1
 
-        self._save_conversation(conversation_id, conversation)
-
         result = {
             "conversation_id": conversation_id,
             "user_message": user_message,
@@ -460,10 +497,16 @@ class ConversationAIService:
             "is_final": is_last,
             "current_index": lesson["current_index"],
             "total_questions": len(questions),
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": replied_at,
         }
-        if not is_last:
+        if is_last:
+            # Returned so the route doesn't have to re-read the conversation.
+            result["lesson"] = lesson
+        else:
             result["next_question"] = questions[idx + 1]
+
+        # Synchronous: the next lesson turn depends on the saved current_index.
+        self._save_turn(conversation_id, conversation, [user_entry, ai_entry])
         return result
     
     def send_message(
@@ -491,50 +534,26 @@ class ConversationAIService:
             raise ValueError(f"Conversa nao encontrada: {conversation_id}")
         
         # Adiciona mensagem do usuário
-        conversation["messages"].append({
+        user_entry = {
             "role": "user",
             "content": user_message,
             "timestamp": datetime.utcnow().isoformat()
-        })
+        }
+        conversation["messages"].append(user_entry)
         
         # Prepara mensagens para a IA
         messages = [
             {"role": "system", "content": conversation["system_prompt"]}
         ]
         
-        # Adiciona histórico recente
-        recent_messages = conversation["messages"][-self.history_messages :]
-        for msg in recent_messages:
-            messages.append({
-                "role": msg["role"],
-                "content": msg["content"]
-            })
+        # Adiciona histórico recente (limitado por quantidade e por tokens estimados)
+        messages.extend(self._recent_history(conversation["messages"], self.history_messages))
         
         # Obtém resposta da IA
         try:
-            model_name: Optional[str] = self.model
-            usage: Dict[str, int] = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
-            if self.client is not None:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    temperature=self.temperature,
-                    max_tokens=self.max_tokens,
-                )
-                ai_response = (response.choices[0].message.content or "").strip()
-                model_name = parse_model_name(response, self.model)
-                usage = parse_usage_tokens(getattr(response, "usage", None))
-            else:
-                # SDK antigo
-                response = openai_legacy.ChatCompletion.create(
-                    model=self.model,
-                    messages=messages,
-                    temperature=self.temperature,
-                    max_tokens=self.max_tokens,
-                )
-                ai_response = response.choices[0].message.content.strip()
-                model_name = parse_model_name(response, self.model)
-                usage = parse_usage_tokens(response.get("usage") if isinstance(response, dict) else None)
+            ai_response, model_name, usage = self._chat(
+                messages, max_tokens=self.max_tokens, temperature=self.temperature
+            )
 
             self._track_usage(
                 db,
@@ -550,19 +569,22 @@ class ConversationAIService:
             raise ValueError(f"Erro ao gerar resposta da IA: {str(e)}")
         
         # Adiciona resposta da IA ao histórico
-        conversation["messages"].append({
+        replied_at = datetime.utcnow().isoformat()
+        ai_entry = {
             "role": "assistant",
             "content": ai_response,
-            "timestamp": datetime.utcnow().isoformat()
-        })
+            "timestamp": replied_at
+        }
+        conversation["messages"].append(ai_entry)
 
-        self._save_conversation(conversation_id, conversation)
+        # Salvo antes de responder: a próxima mensagem precisa ler este turno no histórico.
+        self._save_turn(conversation_id, conversation, [user_entry, ai_entry])
         
         result = {
             "conversation_id": conversation_id,
             "user_message": user_message,
             "ai_response": ai_response,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": replied_at
         }
 
         # Audio is handled by /api/conversation/tts (OpenAI TTS).
@@ -602,6 +624,7 @@ class ConversationAIService:
         conversation["status"] = "ended"
         conversation["ended_at"] = datetime.utcnow().isoformat()
         self._save_conversation(conversation_id, conversation)
+        self.store.expire(self._messages_key(conversation_id), self.session_ttl_seconds)
 
         # Mantem em memoria por enquanto (pode ser removido apos migrar para DB)
         summary = {
@@ -635,16 +658,21 @@ class ConversationAIService:
                 active.append({
                     "conversation_id": conv_id,
                     "created_at": conv["created_at"],
-                    "message_count": len(conv["messages"]),
-                    "last_message": (
-                        conv["messages"][-1]["content"][:50] + "..."
-                        if conv["messages"]
-                        else None
-                    )
+                    "message_count": conv.get("message_count", 0),
+                    "last_message": conv.get("last_message"),
                 })
         
         return active
 
 
-# Instância global do serviço
-conversation_ai_service = ConversationAIService()
+@lru_cache(maxsize=1)
+def get_conversation_ai_service() -> ConversationAIService:
+    """Instância compartilhada, criada apenas no primeiro uso (evita criar o cliente LLM no import)."""
+    return ConversationAIService()
+
+
+def __getattr__(name: str) -> Any:
+    # Compatibilidade com `from ... import conversation_ai_service` (scripts/testes).
+    if name == "conversation_ai_service":
+        return get_conversation_ai_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
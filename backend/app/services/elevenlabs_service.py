@@ -4,6 +4,9 @@ Fornece funcionalidades de conversação com IA e text-to-speech
 """
 import requests
 import json
+import time
+import uuid
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 from app.core.config import get_settings
 
@@ -12,6 +15,7 @@ class ElevenLabsService:
     """Serviço para integração com ElevenLabs API"""
     
     BASE_URL = "https://api.elevenlabs.io/v1"
+    VOICES_CACHE_TTL_SECONDS = 3600
     
     def __init__(self):
         settings = get_settings()
@@ -21,6 +25,8 @@ class ElevenLabsService:
             "xi-api-key": self.api_key,
             "Content-Type": "application/json"
         }
+        self._voices_cache: Optional[List[Dict[str, Any]]] = None
+        self._voices_cache_ts = 0.0
     
     def _check_api_key(self):
         """Verifica se a API key está configurada"""
@@ -85,16 +91,32 @@ class ElevenLabsService:
         """
         Lista todas as vozes disponíveis
         
+        O resultado fica em cache no processo por VOICES_CACHE_TTL_SECONDS,
+        já que a lista de vozes raramente muda.
+        
         Returns:
             Lista de vozes com seus metadados
         """
         self._check_api_key()
         
+        if (
+            self._voices_cache is not None
+            and time.monotonic() - self._voices_cache_ts < self.VOICES_CACHE_TTL_SECONDS
+        ):
+            return self._voices_cache
+        
         url = f"{self.BASE_URL}/voices"
         response = requests.get(url, headers=self.headers)
         response.raise_for_status()
         
-        return response.json().get("voices", [])
+        self._voices_cache = response.json().get("voices", [])
+        self._voices_cache_ts = time.monotonic()
+        return self._voices_cache
+    
+    def refresh_voices(self) -> List[Dict[str, Any]]:
+        """Descarta o cache de vozes e consulta a API novamente"""
+        self._voices_cache = None
+        return self.get_voices()
     
     def create_conversation_session(
         self,
@@ -120,7 +142,7 @@ class ElevenLabsService:
         # Para conversação completa, usamos apenas TTS da ElevenLabs
         # e combinamos com IA (OpenAI/DeepSeek) no backend
         return {
-            "conversation_id": f"tts_session_{id(self)}",
+            "conversation_id": f"tts_session_{uuid.uuid4().hex}",
             "status": "active",
             "voice_id": self.voice_id,
             "note": "Using TTS-only mode. AI logic handled by backend."
@@ -220,5 +242,14 @@ class ElevenLabsService:
         )
 
 
-# Instância global do serviço
-elevenlabs_service = ElevenLabsService()
+@lru_cache(maxsize=1)
+def get_elevenlabs_service() -> ElevenLabsService:
+    """Instância compartilhada, criada apenas no primeiro uso"""
+    return ElevenLabsService()
+
+
+def __getattr__(name: str) -> Any:
+    # Compatibilidade com `from ... import elevenlabs_service`
+    if name == "elevenlabs_service":
+        return get_elevenlabs_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,86 @@
+"""Fila assíncrona de emails com flush em lote.
+
+As mensagens enviadas via ``submit`` são acumuladas por até ``MAX_WAIT_SECONDS``
+(ou ``MAX_BATCH`` mensagens) e despachadas juntas pela mesma conexão SMTP,
+numa thread dedicada, para não bloquear o event loop.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from email.message import Message
+from typing import Optional
+
+from app.services import email_service
+
+logger = logging.getLogger(__name__)
+
+MAX_BATCH = 64
+MAX_WAIT_SECONDS = 0.01
+
+
+class EmailQueue:
+    def __init__(self, max_batch: int = MAX_BATCH, max_wait: float = MAX_WAIT_SECONDS):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Uma única thread de envio: o pool SMTP é por thread, então a conexão é reaproveitada.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="email-queue")
+
+    def _ensure_worker(self) -> asyncio.AbstractEventLoop:
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._run())
+        return loop
+
+    def submit(self, msg: Message) -> "asyncio.Future[None]":
+        """Enfileira a mensagem; o future resolve quando o servidor SMTP a aceitar."""
+        loop = self._ensure_worker()
+        fut: asyncio.Future[None] = loop.create_future()
+        self._queue.put_nowait((msg, fut))
+        return fut
+
+    async def _collect(self) -> list:
+        queue = self._queue
+        batch = [await queue.get()]
+        deadline = self._loop.time() + self.max_wait
+        while len(batch) < self.max_batch:
+            timeout = deadline - self._loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            messages = [msg for msg, _ in batch]
+            try:
+                errors = await self._loop.run_in_executor(
+                    self._executor, email_service.send_messages, messages
+                )
+            except Exception as exc:
+                logger.exception("Falha ao enviar lote de %s emails", len(batch))
+                errors = [exc] * len(batch)
+
+            for (_, fut), err in zip(batch, errors):
+                if fut.done():
+                    continue
+                if err is None:
+                    fut.set_result(None)
+                else:
+                    fut.set_exception(err)
+
+
+email_queue = EmailQueue()
+
+
+def submit(msg: Message) -> "asyncio.Future[None]":
+    return email_queue.submit(msg)
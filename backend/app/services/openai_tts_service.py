@@ -8,26 +8,43 @@ Voices supported by OpenAI TTS (as of current SDK): alloy, echo, fable, onyx, no
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Literal, cast
+from collections import OrderedDict
+from contextlib import AsyncExitStack
+from typing import Any, AsyncIterator, Dict, List, Optional, Literal, cast
+import asyncio
+import hashlib
 import math
 
 import httpx
 
 from app.core.config import get_settings
+from app.services.session_store import RedisSessionStore, get_session_store
 
 try:
-    from openai import OpenAI  # type: ignore
+    from openai import AsyncOpenAI  # type: ignore
     from openai import APIStatusError  # type: ignore
 except Exception:  # pragma: no cover
-    OpenAI = None  # type: ignore
+    AsyncOpenAI = None  # type: ignore
     APIStatusError = None  # type: ignore
 
+try:
+    import h2  # type: ignore  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except Exception:  # pragma: no cover
+    _HTTP2_AVAILABLE = False
+
 
 class OpenAITTSService:
     DEFAULT_MODEL = "tts-1"
     DEFAULT_VOICE = "nova"
     DEFAULT_SPEED = 0.88
     SUPPORTED_VOICES = ["alloy", "echo", "fable", "onyx", "nova", "shimmer"]
+    AUDIO_CACHE_TTL_SECONDS = 7 * 24 * 3600
+    # Without Redis, keep only the most recent clips in process memory.
+    AUDIO_LRU_MAX_ENTRIES = 64
+    MAX_INPUT_CHARS = 4096
+    STREAM_CHUNK_SIZE = 4096
 
     @staticmethod
     def _normalize_speed(value: Any, default: float = DEFAULT_SPEED) -> float:
@@ -55,20 +72,33 @@ class OpenAITTSService:
         self.default_model = (getattr(settings, "openai_tts_model", "") or self.DEFAULT_MODEL).strip()
 
         self.client = (
-            OpenAI(
+            AsyncOpenAI(
                 api_key=self.api_key,
                 base_url=self.base_url,
                 timeout=30.0,
                 max_retries=2,
             )
-            if (OpenAI is not None and self.api_key)
+            if (AsyncOpenAI is not None and self.api_key)
             else None
         )
+        self._http: Optional[httpx.AsyncClient] = None
+        self._audio_lru: "OrderedDict[str, bytes]" = OrderedDict()
+
+    def _http_client(self) -> httpx.AsyncClient:
+        # Shared keep-alive client for the Lemonfox endpoint (HTTP/2 when h2 is installed).
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                base_url=self.lemonfox_base_url,
+                http2=_HTTP2_AVAILABLE,
+                timeout=httpx.Timeout(60.0, connect=5.0),
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            )
+        return self._http
 
     def _check_ready(self) -> None:
         if self.lemonfox_enabled and self.lemonfox_api_key:
             return
-        if OpenAI is None:
+        if AsyncOpenAI is None:
             raise ValueError("Biblioteca OpenAI não está instalada no backend")
         if not self.api_key:
             raise ValueError("TTS requer LEMONFOX_API_KEY ou OPENAI_API_KEY configurada no .env")
@@ -103,7 +133,50 @@ class OpenAITTSService:
         # OpenAI TTS voices are currently fixed strings.
         return [{"voice_id": v, "name": v} for v in self.SUPPORTED_VOICES]
 
-    def text_to_speech(
+    def _audio_cache_key(self, provider: str, model: str, voice: str, text: str) -> str:
+        raw = f"{provider}|{model}|{voice}|{self.default_speed}|{text}"
+        return "tts:" + hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    async def _cache_get(self, key: str) -> Optional[bytes]:
+        try:
+            store = get_session_store()
+            if not isinstance(store, RedisSessionStore):
+                audio = self._audio_lru.get(key)
+                if audio is not None:
+                    self._audio_lru.move_to_end(key)
+                return audio
+            # The Redis client is blocking; keep it off the event loop.
+            return await asyncio.to_thread(store.get_bytes, key)
+        except Exception:
+            return None
+
+    async def _cache_set(self, key: str, audio: bytes) -> None:
+        try:
+            store = get_session_store()
+            if not isinstance(store, RedisSessionStore):
+                self._audio_lru[key] = audio
+                self._audio_lru.move_to_end(key)
+                while len(self._audio_lru) > self.AUDIO_LRU_MAX_ENTRIES:
+                    self._audio_lru.popitem(last=False)
+                return
+            await asyncio.to_thread(store.set_bytes, key, audio, self.AUDIO_CACHE_TTL_SECONDS)
+        except Exception:
+            pass
+
+    @classmethod
+    def _truncate_text(cls, text: str) -> str:
+        # The TTS APIs cap the input length; cut at the last word boundary instead of mid-word.
+        text = text.strip()
+        if len(text) <= cls.MAX_INPUT_CHARS:
+            return text
+        cut = text[: cls.MAX_INPUT_CHARS]
+        if not text[cls.MAX_INPUT_CHARS].isspace():
+            head, sep, _ = cut.rpartition(" ")
+            if sep and head.strip():
+                cut = head
+        return cut.rstrip()
+
+    async def text_to_speech(
         self,
         *,
         text: str,
@@ -111,6 +184,27 @@ class OpenAITTSService:
         model_id: Optional[str] = None,
         voice_settings: Optional[Dict[str, Any]] = None,
     ) -> bytes:
+        chunks = await self.text_to_speech_stream(
+            text=text,
+            voice_id=voice_id,
+            model_id=model_id,
+            voice_settings=voice_settings,
+        )
+        return b"".join([chunk async for chunk in chunks])
+
+    async def text_to_speech_stream(
+        self,
+        *,
+        text: str,
+        voice_id: Optional[str] = None,
+        model_id: Optional[str] = None,
+        voice_settings: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[bytes]:
+        """Open the upstream TTS response and return an iterator over its MP3 chunks.
+
+        Validation and upstream errors are raised here, before any byte is sent,
+        so callers can still map them to HTTP status codes.
+        """
         # voice_settings not used by OpenAI TTS today; kept for compatibility with existing schema.
         _ = voice_settings
 
@@ -125,26 +219,38 @@ class OpenAITTSService:
                 f"Voz inválida '{voice}'. Use uma de: {', '.join(self.SUPPORTED_VOICES)}"
             )
 
+        safe_text = self._truncate_text(text)
+        stack = AsyncExitStack()
+
         # Lemonfox path (OpenAI-compatible HTTP but no SDK required here)
         if self.lemonfox_enabled and self.lemonfox_api_key:
-            safe_text = text.strip()[:4096]
-            response = httpx.post(
-                f"{self.lemonfox_base_url}/audio/speech",
-                headers={
-                    "Authorization": f"Bearer {self.lemonfox_api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "input": safe_text,
-                    "voice": voice,
-                    "response_format": "mp3",
-                    "language": "en-us",
-                    "speed": self.default_speed,
-                },
-                timeout=60.0,
-            )
-            response.raise_for_status()
-            return response.content
+            cache_key = self._audio_cache_key("lemonfox", "", voice, safe_text)
+            cached = await self._cache_get(cache_key)
+            if cached:
+                return self._single_chunk(cached)
+            try:
+                response = await stack.enter_async_context(
+                    self._http_client().stream(
+                        "POST",
+                        "/audio/speech",
+                        headers={
+                            "Authorization": f"Bearer {self.lemonfox_api_key}",
+                            "Content-Type": "application/json",
+                        },
+                        json={
+                            "input": safe_text,
+                            "voice": voice,
+                            "response_format": "mp3",
+                            "language": "en-us",
+                            "speed": self.default_speed,
+                        },
+                    )
+                )
+                response.raise_for_status()
+            except BaseException:
+                await stack.aclose()
+                raise
+            return self._relay(stack, response.aiter_bytes(self.STREAM_CHUNK_SIZE), cache_key)
 
         # Help type-checkers: voice is guaranteed to be one of the supported literals.
         voice_literal = cast(
@@ -159,8 +265,10 @@ class OpenAITTSService:
             if fallback and fallback not in models_to_try:
                 models_to_try.append(fallback)
 
-        # OpenAI TTS has an input length limit; keep it safe.
-        safe_text = text.strip()[:4096]
+        cache_key = self._audio_cache_key("openai", model, voice, safe_text)
+        cached = await self._cache_get(cache_key)
+        if cached:
+            return self._single_chunk(cached)
 
         # Help type-checkers: _check_ready() guarantees client is initialized.
         client = cast(Any, self.client)
@@ -168,15 +276,17 @@ class OpenAITTSService:
         last_exc: Exception | None = None
         for model_name in models_to_try:
             try:
-                response = client.audio.speech.create(
-                    model=model_name,
-                    voice=voice_literal,
-                    input=safe_text,
-                    speed=self.default_speed,
+                response = await stack.enter_async_context(
+                    client.audio.speech.with_streaming_response.create(
+                        model=model_name,
+                        voice=voice_literal,
+                        input=safe_text,
+                        speed=self.default_speed,
+                    )
                 )
-
-                return response.content
+                return self._relay(stack, response.iter_bytes(self.STREAM_CHUNK_SIZE), cache_key)
             except Exception as e:  # Let the route map status codes nicely.
+                await stack.aclose()
                 # If model is not found/available, try the next fallback model.
                 if APIStatusError is not None and isinstance(e, APIStatusError):
                     status_code = getattr(e, "status_code", None)
@@ -190,5 +300,22 @@ class OpenAITTSService:
             raise last_exc
         raise RuntimeError("Falha inesperada ao gerar áudio")
 
+    @staticmethod
+    async def _single_chunk(data: bytes) -> AsyncIterator[bytes]:
+        yield data
+
+    async def _relay(
+        self, stack: AsyncExitStack, chunks: AsyncIterator[bytes], cache_key: str
+    ) -> AsyncIterator[bytes]:
+        received: list[bytes] = []
+        try:
+            async for chunk in chunks:
+                received.append(chunk)
+                yield chunk
+        finally:
+            await stack.aclose()
+        # Only cache audio that was received completely.
+        await self._cache_set(cache_key, b"".join(received))
+
 
 openai_tts_service = OpenAITTSService()
@@ -1,11 +1,38 @@
+import re
+from bisect import bisect_right
 from typing import Optional, Dict, Any, List
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
+from sqlalchemy import func, and_, or_, select, exists
 
 from app.models.sentence import Sentence, UserSentenceProgress
 from app.models.word import Word
 from app.models.user import User
 from app.models.progress import UserProgress
+from app.services.session_store import get_session_store
+
+
+# Limites (exclusivos) de palavras aprendidas para cada nível CEFR
+_LEVEL_THRESHOLDS = (500, 1000, 1500, 2000, 2500)
+_LEVELS = ("A1", "A2", "B1", "B2", "C1", "C2")
+
+USER_STATS_TTL_SECONDS = 60
+
+# Palavras com apóstrofo/hífen internos (don't, well-known) contam como um token;
+# letras acentuadas (café) e dígitos (mp3) fazem parte da palavra
+_WORD_RE = re.compile(r"[^\W_]+(?:['-][^\W_]+)*")
+
+
+def _user_stats_key(user_id: int) -> str:
+    return f"user_stats:{user_id}"
+
+
+def invalidate_user_stats(user_id: int) -> None:
+    """Descarta as estatísticas em cache após uma revisão mudar o progresso."""
+    # Cache é só otimização: store fora do ar não pode quebrar a revisão já salva.
+    try:
+        get_session_store().delete(_user_stats_key(user_id))
+    except Exception:
+        pass
 
 
 class RAGService:
@@ -66,12 +93,12 @@ class RAGService:
     ) -> List[Dict[str, Any]]:
         """Extrai palavras do banco que aparecem na frase"""
 
-        # Tokenizar a frase (simplificado)
-        words = sentence_text.lower().split()
-        # Remover pontuação
-        words = [word.strip('.,!?;:"()[]{}') for word in words]
+        # Tokenizar a frase em uma passada, sem pontuação e sem duplicatas
+        words = set(_WORD_RE.findall(sentence_text.lower()))
+        if not words:
+            return []
 
-        # Buscar palavras no banco
+        # Buscar palavras no banco (usa o índice ix_words_lower_english)
         vocabulary = db.query(Word).filter(
             func.lower(Word.english).in_(words)
         ).limit(10).all()
@@ -92,41 +119,43 @@ class RAGService:
     async def _get_user_stats(db: Session, user_id: int) -> Dict[str, Any]:
         """Obtém estatísticas do usuário para personalizar ensino"""
 
-        # Total de palavras aprendidas
-        total_words = db.query(func.count(UserProgress.id)).filter(
-            and_(
-                UserProgress.user_id == user_id,
-                UserProgress.repetitions > 0
-            )
-        ).scalar() or 0
+        cache_key = _user_stats_key(user_id)
+        try:
+            cached = get_session_store().get(cache_key)
+        except Exception:
+            cached = None
+        if cached:
+            # Cópia: o store em memória devolve o próprio dict guardado
+            return dict(cached)
+
+        # Palavras aprendidas e frases estudadas em uma única ida ao banco
+        words_count = (
+            select(func.count(UserProgress.id))
+            .where(and_(UserProgress.user_id == user_id, UserProgress.repetitions > 0))
+            .scalar_subquery()
+        )
+        sentences_count = (
+            select(func.count(UserSentenceProgress.id))
+            .where(and_(UserSentenceProgress.user_id == user_id, UserSentenceProgress.repetitions > 0))
+            .scalar_subquery()
+        )
+        row = db.execute(select(words_count.label("w"), sentences_count.label("s"))).one()
+        total_words = row.w or 0
+        total_sentences = row.s or 0
 
         # Nível estimado baseado em palavras aprendidas
-        if total_words < 500:
-            estimated_level = "A1"
-        elif total_words < 1000:
-            estimated_level = "A2"
-        elif total_words < 1500:
-            estimated_level = "B1"
-        elif total_words < 2000:
-            estimated_level = "B2"
-        elif total_words < 2500:
-            estimated_level = "C1"
-        else:
-            estimated_level = "C2"
-
-        # Total de frases estudadas
-        total_sentences = db.query(func.count(UserSentenceProgress.id)).filter(
-            and_(
-                UserSentenceProgress.user_id == user_id,
-                UserSentenceProgress.repetitions > 0
-            )
-        ).scalar() or 0
+        estimated_level = _LEVELS[bisect_right(_LEVEL_THRESHOLDS, total_words)]
 
-        return {
+        result = {
             "total_words_learned": total_words,
             "total_sentences_studied": total_sentences,
             "estimated_level": estimated_level
         }
+        try:
+            get_session_store().set(cache_key, dict(result), ttl_seconds=USER_STATS_TTL_SECONDS)
+        except Exception:
+            pass
+        return result
 
     @staticmethod
     async def search_similar_sentences(
@@ -148,7 +177,8 @@ class RAGService:
         if category:
             filters.append(Sentence.category == category)
 
-        # Busca textual simples (pode ser melhorado com FTS ou embeddings)
+        # Busca textual por substring; coberta pelos índices trigram GIN
+        # (migrations/add_sentences_trgm_indexes.sql)
         search_filter = or_(
             Sentence.english.ilike(f"%{query}%"),
             Sentence.portuguese.ilike(f"%{query}%")
@@ -206,17 +236,17 @@ class RAGService:
         user_stats = await RAGService._get_user_stats(db, user_id)
         estimated_level = user_stats["estimated_level"]
 
-        # Buscar frases não estudadas do nível apropriado
-        studied_sentence_ids = db.query(UserSentenceProgress.sentence_id).filter(
-            UserSentenceProgress.user_id == user_id
-        ).all()
-        studied_ids = [sid[0] for sid in studied_sentence_ids]
-
-        # Frases recomendadas
+        # Frases do nível apropriado ainda não estudadas (anti-join no banco)
+        studied = exists().where(
+            and_(
+                UserSentenceProgress.sentence_id == Sentence.id,
+                UserSentenceProgress.user_id == user_id
+            )
+        )
         recommended = db.query(Sentence).filter(
             and_(
                 Sentence.level == estimated_level,
-                ~Sentence.id.in_(studied_ids) if studied_ids else True
+                ~studied
             )
         ).order_by(Sentence.difficulty_score).limit(limit).all()
 
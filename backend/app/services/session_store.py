@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import heapq
 import json
-from datetime import datetime, timedelta, timezone
+import math
+import time
+from datetime import datetime
 from typing import Any, Optional
 
 from app.core.config import get_settings
@@ -11,23 +14,64 @@ try:
 except Exception:  # pragma: no cover
     redis = None  # type: ignore
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
 
 def _json_default(value: Any) -> str:
+    # orjson serializes datetime natively; this only runs for the stdlib json fallback
+    # and for types neither library knows.
     if isinstance(value, datetime):
         return value.isoformat()
     return str(value)
 
 
+def _dumps(value: dict) -> str | bytes:
+    if orjson is not None:
+        return orjson.dumps(value, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, default=_json_default)
+
+
+def _loads(raw: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class SessionStore:
     def get(self, key: str) -> Optional[dict]:
         raise NotImplementedError
 
+    def mget(self, keys: list[str]) -> list[Optional[dict]]:
+        return [self.get(key) for key in keys]
+
+    def get_by_prefix(self, prefix: str) -> dict[str, dict]:
+        keys = self.list_keys(prefix)
+        return {key: value for key, value in zip(keys, self.mget(keys)) if value is not None}
+
     def set(self, key: str, value: dict, ttl_seconds: Optional[float] = None) -> None:
         raise NotImplementedError
 
     def delete(self, key: str) -> None:
         raise NotImplementedError
 
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def set_bytes(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        raise NotImplementedError
+
+    def append_list(self, key: str, items: list[dict], ttl_seconds: Optional[float] = None) -> None:
+        raise NotImplementedError
+
+    def get_list(self, key: str) -> list[dict]:
+        raise NotImplementedError
+
+    def expire(self, key: str, ttl_seconds: float) -> None:
+        raise NotImplementedError
+
     def list_keys(self, prefix: str) -> list[str]:
         raise NotImplementedError
 
@@ -37,14 +81,17 @@ class SessionStore:
 
 class InMemorySessionStore(SessionStore):
     def __init__(self) -> None:
-        self._data: dict[str, dict] = {}
-        self._expires_at: dict[str, Optional[datetime]] = {}
-
-    def _is_expired(self, key: str, now: Optional[datetime] = None) -> bool:
-        now = now or datetime.now(timezone.utc)
-        expires_at = self._expires_at.get(key)
-        if expires_at and expires_at <= now:
+        self._data: dict[str, Any] = {}
+        self._lists: dict[str, list[dict]] = {}
+        # time.monotonic() deadlines; math.inf means no expiry.
+        self._expires_at: dict[str, float] = {}
+        # (deadline, key) min-heap; stale entries are skipped when popped.
+        self._expiry_heap: list[tuple[float, str]] = []
+
+    def _is_expired(self, key: str, now: Optional[float] = None) -> bool:
+        if self._expires_at.get(key, math.inf) <= (time.monotonic() if now is None else now):
             self._data.pop(key, None)
+            self._lists.pop(key, None)
             self._expires_at.pop(key, None)
             return True
         return False
@@ -52,78 +99,187 @@ class InMemorySessionStore(SessionStore):
     def get(self, key: str) -> Optional[dict]:
         if self._is_expired(key):
             return None
-        return self._data.get(key)
+        value = self._data.get(key)
+        return value if isinstance(value, dict) else None
 
     def set(self, key: str, value: dict, ttl_seconds: Optional[float] = None) -> None:
         self._data[key] = value
         if ttl_seconds is not None:
-            ttl_seconds = float(ttl_seconds)
-            if ttl_seconds <= 0:
-                self._expires_at[key] = datetime.now(timezone.utc)
-                return
-            self._expires_at[key] = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+            self.expire(key, ttl_seconds)
         else:
-            self._expires_at[key] = None
+            self._expires_at[key] = math.inf
 
     def delete(self, key: str) -> None:
         self._data.pop(key, None)
+        self._lists.pop(key, None)
         self._expires_at.pop(key, None)
 
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        if self._is_expired(key):
+            return None
+        value = self._data.get(key)
+        return value if isinstance(value, bytes) else None
+
+    def set_bytes(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        self.set(key, value, ttl_seconds=ttl_seconds)  # type: ignore[arg-type]
+
+    def append_list(self, key: str, items: list[dict], ttl_seconds: Optional[float] = None) -> None:
+        self._is_expired(key)
+        self._lists.setdefault(key, []).extend(items)
+        if ttl_seconds is not None:
+            self.expire(key, ttl_seconds)
+
+    def get_list(self, key: str) -> list[dict]:
+        if self._is_expired(key):
+            return []
+        return list(self._lists.get(key, []))
+
+    def expire(self, key: str, ttl_seconds: float) -> None:
+        if key not in self._data and key not in self._lists:
+            return
+        expires_at = time.monotonic() + max(0.0, float(ttl_seconds))
+        self._expires_at[key] = expires_at
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+
     def list_keys(self, prefix: str) -> list[str]:
-        now = datetime.now(timezone.utc)
+        now = time.monotonic()
         keys: list[str] = []
-        for key in list(self._data.keys()):
+        for key in [*self._data.keys(), *self._lists.keys()]:
             if self._is_expired(key, now):
                 continue
             if key.startswith(prefix):
                 keys.append(key)
         return keys
 
+    def get_by_prefix(self, prefix: str) -> dict[str, dict]:
+        now = time.monotonic()
+        return {
+            key: value
+            for key, value in list(self._data.items())
+            if key.startswith(prefix) and isinstance(value, dict) and not self._is_expired(key, now)
+        }
+
     def cleanup(self) -> None:
-        self.list_keys("")
+        now = time.monotonic()
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            if self._expires_at.get(key) == expires_at:
+                self.delete(key)
+
+
+_redis_pools: dict[str, Any] = {}
+
+
+def _get_redis_pool(url: str) -> Any:
+    # One pool per URL, shared by every store/service in the process. Responses stay
+    # raw bytes: orjson parses bytes directly and binary values (audio) pass through.
+    pool = _redis_pools.get(url)
+    if pool is None:
+        settings = get_settings()
+        pool = redis.ConnectionPool.from_url(
+            url,
+            decode_responses=False,
+            max_connections=max(1, int(settings.redis_max_connections)),
+            health_check_interval=30,
+            socket_keepalive=True,
+            socket_timeout=float(settings.redis_socket_timeout_seconds),
+            socket_connect_timeout=float(settings.redis_socket_timeout_seconds),
+        )
+        _redis_pools[url] = pool
+    return pool
 
 
 class RedisSessionStore(SessionStore):
     def __init__(self, url: str) -> None:
         if redis is None:  # pragma: no cover
             raise RuntimeError("redis library is not available")
-        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self.client = redis.Redis(connection_pool=_get_redis_pool(url))
 
-    def get(self, key: str) -> Optional[dict]:
-        raw = self.client.get(key)
+    @staticmethod
+    def _ttl(ttl_seconds: float) -> int:
+        # Whole seconds, rounded up. <= 0 means already expired, as in InMemorySessionStore.
+        return math.ceil(float(ttl_seconds))
+
+    @staticmethod
+    def _decode(raw: Any) -> Optional[dict]:
         if not raw:
             return None
         try:
-            value = json.loads(raw)
+            value = _loads(raw)
         except Exception:
             return None
         return value if isinstance(value, dict) else None
 
+    def get(self, key: str) -> Optional[dict]:
+        return self._decode(self.client.get(key))
+
+    def mget(self, keys: list[str]) -> list[Optional[dict]]:
+        if not keys:
+            return []
+        # Single round-trip instead of one GET per key.
+        return [self._decode(raw) for raw in self.client.mget(keys)]
+
     def set(self, key: str, value: dict, ttl_seconds: Optional[float] = None) -> None:
-        payload = json.dumps(value, default=_json_default)
+        payload = _dumps(value)
         if ttl_seconds is not None:
-            ttl_seconds = int(float(ttl_seconds))
-            if ttl_seconds <= 0:
-                self.client.set(key, payload)
-                self.client.expire(key, 1)
+            ttl = self._ttl(ttl_seconds)
+            if ttl <= 0:
+                self.client.delete(key)
                 return
-            self.client.setex(key, ttl_seconds, payload)
+            self.client.setex(key, ttl, payload)
             return
         self.client.set(key, payload)
 
     def delete(self, key: str) -> None:
         self.client.delete(key)
 
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        raw = self.client.get(key)
+        return raw if raw else None
+
+    def set_bytes(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        if ttl_seconds is not None:
+            ttl = self._ttl(ttl_seconds)
+            if ttl <= 0:
+                self.client.delete(key)
+                return
+            self.client.set(key, value, ex=ttl)
+            return
+        self.client.set(key, value)
+
+    def append_list(self, key: str, items: list[dict], ttl_seconds: Optional[float] = None) -> None:
+        if not items:
+            return
+        if ttl_seconds is not None and self._ttl(ttl_seconds) <= 0:
+            self.client.delete(key)
+            return
+        pipe = self.client.pipeline()
+        pipe.rpush(key, *[_dumps(item) for item in items])
+        if ttl_seconds is not None:
+            pipe.expire(key, self._ttl(ttl_seconds))
+        pipe.execute()
+
+    def get_list(self, key: str) -> list[dict]:
+        items: list[dict] = []
+        for raw in self.client.lrange(key, 0, -1):
+            value = self._decode(raw)
+            if value is not None:
+                items.append(value)
+        return items
+
+    def expire(self, key: str, ttl_seconds: float) -> None:
+        ttl = self._ttl(ttl_seconds)
+        if ttl <= 0:
+            self.client.delete(key)
+            return
+        self.client.expire(key, ttl)
+
     def list_keys(self, prefix: str) -> list[str]:
-        pattern = f"{prefix}*"
-        keys: list[str] = []
-        cursor = 0
-        while True:
-            cursor, batch = self.client.scan(cursor=cursor, match=pattern, count=200)
-            keys.extend(batch)
-            if cursor == 0:
-                break
-        return keys
+        return [
+            key.decode() if isinstance(key, bytes) else key
+            for key in self.client.scan_iter(match=f"{prefix}*", count=1000)
+        ]
 
     def cleanup(self) -> None:
         return None
@@ -1,35 +1,26 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional
 
 from app.models.progress import UserProgress
 
 
-def calculate_next_review(difficulty: str, progress: UserProgress) -> tuple[datetime, int, float, int]:
-    """Calcula próxima revisão usando um modelo inspirado no SM-2.
-
-    Retorna: (next_review_date, new_interval_days, new_ease_factor, new_repetitions)
-    """
-    now = datetime.now(timezone.utc)
-    ease = float(progress.ease_factor or 2.5)
-    interval_days = max(progress.interval or 0, 0)
-    repetitions = progress.repetitions or 0
-
+def _next_review_values(
+    difficulty: str, ease: float, interval_days: int, repetitions: int
+) -> tuple[timedelta, int, float, int]:
+    """Núcleo do cálculo: retorna (atraso até a revisão, intervalo, ease, repetições)."""
     if difficulty == "hard":
-        repetitions = 0
-        ease = max(1.3, ease - 0.3)
-        interval_days = 0
-        next_review = now + timedelta(hours=4)
-    elif difficulty == "medium":
-        repetitions += 1
+        return timedelta(hours=4), 0, max(1.3, ease - 0.3), 0
+
+    repetitions += 1
+    if difficulty == "medium":
         ease = max(1.3, ease - 0.05)
         if repetitions <= 1:
             interval_days = 1
         else:
             interval_days = max(1, round(max(interval_days, 1) * ease))
-        next_review = now + timedelta(days=interval_days)
     else:  # easy
-        repetitions += 1
         ease = min(2.6, ease + 0.1)
         if repetitions == 1:
             interval_days = 1
@@ -37,6 +28,39 @@ def calculate_next_review(difficulty: str, progress: UserProgress) -> tuple[date
             interval_days = 3
         else:
             interval_days = max(3, round(max(interval_days, 1) * ease * 1.2))
-        next_review = now + timedelta(days=interval_days)
+    return timedelta(days=interval_days), interval_days, ease, repetitions
 
-    return next_review, interval_days, ease, repetitions
+
+def calculate_next_review(difficulty: str, progress: UserProgress) -> tuple[datetime, int, float, int]:
+    """Calcula próxima revisão usando um modelo inspirado no SM-2.
+
+    Retorna: (next_review_date, new_interval_days, new_ease_factor, new_repetitions)
+    """
+    delay, interval_days, ease, repetitions = _next_review_values(
+        difficulty,
+        float(progress.ease_factor or 2.5),
+        max(progress.interval or 0, 0),
+        progress.repetitions or 0,
+    )
+    return datetime.now(timezone.utc) + delay, interval_days, ease, repetitions
+
+
+def calculate_next_review_batch(
+    difficulties: Iterable[str],
+    eases: Iterable[Optional[float]],
+    intervals: Iterable[Optional[int]],
+    repetitions: Iterable[Optional[int]],
+    now: Optional[datetime] = None,
+) -> list[tuple[datetime, int, float, int]]:
+    """Versão em lote de calculate_next_review sobre colunas paralelas.
+
+    Usa um único ``now`` para o lote inteiro e evita carregar objetos UserProgress.
+    """
+    now = now or datetime.now(timezone.utc)
+    results: list[tuple[datetime, int, float, int]] = []
+    for difficulty, ease, interval_days, reps in zip(difficulties, eases, intervals, repetitions):
+        delay, new_interval, new_ease, new_reps = _next_review_values(
+            difficulty, float(ease or 2.5), max(interval_days or 0, 0), reps or 0
+        )
+        results.append((now + delay, new_interval, new_ease, new_reps))
+    return results
@@ -1,5 +1,6 @@
 import json
 import re
+from functools import lru_cache
 from typing import Optional, Tuple
 
 from sqlalchemy.orm import Session
@@ -8,68 +9,120 @@ from app.models.word import Word
 from app.services.ai_teacher import ai_teacher_service
 from app.utils.example_generator import generate_example as legacy_generate_example
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Extração direta dos dois campos do schema, sem decodificar o objeto inteiro.
+_EXAMPLE_EN_RE = re.compile(r'"example_en"\s*:\s*"((?:[^"\\]|\\.)*)"')
+_EXAMPLE_PT_RE = re.compile(r'"example_pt"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+_SYSTEM_PROMPT = (
+    "You generate bilingual example sentences for language learning. "
+    "Return ONLY valid JSON (no markdown, no commentary). "
+    "Schema: {\"example_en\": string, \"example_pt\": string}. "
+    "Rules: example_en must be natural English and MUST include the target term exactly (case-insensitive). "
+    "example_pt must be a Brazilian Portuguese translation of example_en. "
+    "Keep both short (<= 14 words), no proper nouns, no slang, no quotes."
+)
+# Mensagem de sistema compartilhada (somente leitura); por chamada só muda o prompt do usuário.
+_SYSTEM_MESSAGE = {"role": "system", "content": _SYSTEM_PROMPT}
+
 
 def _normalize(text: str) -> str:
-    return re.sub(r"\s+", " ", (text or "").strip().lower())
+    # str.split() sem argumento já colapsa e remove espaços das pontas.
+    return " ".join((text or "").lower().split())
 
 
-def _contains_word_or_phrase(example_en: str, english: str) -> bool:
-    ex = _normalize(example_en)
-    term = _normalize(english)
-    if not ex or not term:
+@lru_cache(maxsize=4096)
+def _tokenize_term(english: str) -> tuple[str, ...]:
+    return tuple(_normalize(english).split())
+
+
+def _contains_tokens(ex_norm: str, tokens: tuple[str, ...]) -> bool:
+    """Como _contains_word_or_phrase, mas com exemplo e termo já normalizados."""
+    if not ex_norm or not tokens:
         return False
 
     # If it's a phrase, require each token to appear.
-    tokens = [t for t in re.split(r"\s+", term) if t]
-    if len(tokens) <= 1:
-        return term in ex
+    if len(tokens) == 1:
+        return tokens[0] in ex_norm
 
-    return all(t in ex for t in tokens)
+    return all(t in ex_norm for t in tokens)
+
+
+def _contains_word_or_phrase(example_en: str, english: str) -> bool:
+    # Caso mais comum (palavra simples, sem espaços/pontuação): dispensa a tokenização.
+    if english and english.isalpha():
+        return english.lower() in _normalize(example_en)
+    return _contains_tokens(_normalize(example_en), _tokenize_term(english))
 
 
 def needs_example_regeneration(word: Word) -> bool:
     """Heurística simples: exemplos vazios/curtos ou que não usam a palavra-alvo."""
-    example_en = (word.example_en or "").strip()  # type: ignore[attr-defined]
-    example_pt = (word.example_pt or "").strip()  # type: ignore[attr-defined]
+    example_en = word.example_en or ""  # type: ignore[attr-defined]
+    example_pt = word.example_pt or ""  # type: ignore[attr-defined]
+
+    # Se já é curto sem strip, continua curto depois: decide sem alocar.
+    if len(example_en) < 8 or len(example_pt) < 8:
+        return True
 
+    example_en = example_en.strip()
+    example_pt = example_pt.strip()
     if len(example_en) < 8 or len(example_pt) < 8:
         return True
 
+    # Evitar lixo óbvio (tokens estranhos); substring simples, mais barata que regex.
+    if "ui:d" in example_en.lower() or "ui:d" in example_pt.lower():
+        return True
+
     # Precisa ser um exemplo em inglês que realmente usa a palavra.
     english = (word.english or "").strip()  # type: ignore[attr-defined]
     if english and not _contains_word_or_phrase(example_en, english):
         return True
 
-    # Evitar lixo óbvio (tokens estranhos)
-    if re.search(r"\bui:d\b", example_en, re.IGNORECASE) or re.search(r"\bui:d\b", example_pt, re.IGNORECASE):
-        return True
-
     return False
 
 
 def _extract_json_object(text: str) -> Optional[dict]:
-    if not text:
+    if not text or "{" not in text:
         return None
 
     # 1) Try direct JSON
     try:
-        obj = json.loads(text)
+        obj = _json_loads(text)
         return obj if isinstance(obj, dict) else None
     except Exception:
         pass
 
-    # 2) Try to extract a single {...} block
-    match = re.search(r"\{[\s\S]*\}", text)
-    if not match:
+    # 2) Try the outermost {...} block (first "{" to last "}")
+    start = text.find("{")
+    end = text.rfind("}")
+    if start < 0 or end <= start:
         return None
 
     try:
-        obj = json.loads(match.group(0))
+        obj = _json_loads(text[start : end + 1])
         return obj if isinstance(obj, dict) else None
     except Exception:
         return None
 
 
+def _extract_example_fields(text: str) -> Optional[Tuple[str, str]]:
+    en = _EXAMPLE_EN_RE.search(text)
+    pt = _EXAMPLE_PT_RE.search(text)
+    if not en or not pt:
+        return None
+    try:
+        # Reaproveita o decoder JSON só para tratar os escapes da string.
+        return (_json_loads(f'"{en.group(1)}"'), _json_loads(f'"{pt.group(1)}"'))
+    except Exception:
+        return None
+
+
 async def generate_word_example_ai(word: Word, db: Session) -> Tuple[Optional[str], Optional[str]]:
     """Gera exemplo via IA (com cache), retornando (example_en, example_pt)."""
     english = (word.english or "").strip()  # type: ignore[attr-defined]
@@ -80,15 +133,6 @@ async def generate_word_example_ai(word: Word, db: Session) -> Tuple[Optional[st
     if not english:
         return (None, None)
 
-    system_prompt = (
-        "You generate bilingual example sentences for language learning. "
-        "Return ONLY valid JSON (no markdown, no commentary). "
-        "Schema: {\"example_en\": string, \"example_pt\": string}. "
-        "Rules: example_en must be natural English and MUST include the target term exactly (case-insensitive). "
-        "example_pt must be a Brazilian Portuguese translation of example_en. "
-        "Keep both short (<= 14 words), no proper nouns, no slang, no quotes."
-    )
-
     user_prompt = (
         f"Target term (English): {english}\n"
         f"Meaning (pt-BR): {portuguese}\n"
@@ -98,7 +142,7 @@ async def generate_word_example_ai(word: Word, db: Session) -> Tuple[Optional[st
     )
 
     messages = [
-        {"role": "system", "content": system_prompt},
+        _SYSTEM_MESSAGE,
         {"role": "user", "content": user_prompt},
     ]
 
@@ -109,17 +153,21 @@ async def generate_word_example_ai(word: Word, db: Session) -> Tuple[Optional[st
         cache_scope=f"word:{getattr(word, 'id', 'unknown')}",
     )
 
-    obj = _extract_json_object((ai.get("response") or "").strip())
-    if not obj:
-        return (None, None)
+    raw = (ai.get("response") or "").strip()
+    fields = _extract_example_fields(raw)
+    if fields is None:
+        obj = _extract_json_object(raw)
+        if not obj:
+            return (None, None)
+        fields = (obj.get("example_en") or "", obj.get("example_pt") or "")
 
-    example_en = (obj.get("example_en") or "").strip()
-    example_pt = (obj.get("example_pt") or "").strip()
+    example_en = fields[0].strip()
+    example_pt = fields[1].strip()
 
     if len(example_en) < 8 or len(example_pt) < 8:
         return (None, None)
 
-    if not _contains_word_or_phrase(example_en, english):
+    if not _contains_tokens(_normalize(example_en), _tokenize_term(english)):
         return (None, None)
 
     return (example_en, example_pt)
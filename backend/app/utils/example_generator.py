@@ -2,27 +2,95 @@
 Utilitário para gerar exemplos de frases em contexto
 """
 import requests
-from typing import Optional, Tuple
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional, Tuple
 
 FREE_DICT_API = "https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
+MYMEMORY_API = "https://api.mymemory.translated.net/get"
+
+# Sessão compartilhada: reaproveita conexões TCP/TLS entre chamadas
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
+# Cache em memória (FIFO limitado) das respostas definitivas das APIs externas.
+# Erros de rede e status inesperados não são cacheados, para permitir nova tentativa.
+_CACHE_MAXSIZE = 8192
+_example_cache: Dict[str, Optional[Tuple[str, str]]] = {}
+_translation_cache: Dict[str, Optional[str]] = {}
+
+
+def _remember(cache: dict, key: str, value):
+    if len(cache) >= _CACHE_MAXSIZE:
+        cache.pop(next(iter(cache)))
+    cache[key] = value
+    return value
+
+
+# Sufixos por tipo, na ordem de prioridade usada por detect_word_type
+_VERB_ENDINGS = ('ing', 'ed', 'ate', 'ize', 'ify')
+_ADJ_ENDINGS = ('ful', 'less', 'ous', 'ive', 'able', 'ible', 'al', 'ic')
+
+# Templates por tipo de palavra; só o escolhido é formatado em cada chamada.
+_TEMPLATES = {
+    'verb': (
+        "I {w} every day.",
+        "She usually {w}s in the morning.",
+        "They will {w} tomorrow.",
+        "We should {w} more often.",
+    ),
+    'noun': (
+        "The {w} is very important.",
+        "I saw a beautiful {w} yesterday.",
+        "This {w} is amazing!",
+        "She bought a new {w}.",
+    ),
+    'adjective': (
+        "She is very {w}.",
+        "The weather is {w} today.",
+        "It looks {w} from here.",
+        "This book is quite {w}.",
+    ),
+    'adverb': (
+        "He speaks {w}.",
+        "She smiled {w}.",
+        "They work {w}.",
+    ),
+}
+
+
+def _parse_dictionary_example(data) -> Optional[Tuple[str, str]]:
+    if data and len(data) > 0:
+        for entry in data[0].get('meanings', []):
+            for definition in entry.get('definitions', []):
+                example = definition.get('example')
+                if example and len(example) > 10:
+                    return (example, definition.get('definition', ''))
+    return None
+
+
+def _parse_translation(data, text: str) -> Optional[str]:
+    if data.get('responseStatus') == 200:
+        translation = data['responseData']['translatedText']
+        if translation and translation.lower() != text.lower():
+            return translation
+    return None
+
 
 def get_example_from_api(word: str) -> Optional[Tuple[str, str]]:
     """
     Busca exemplo real de frase da API do dicionário
     Returns: (example_en, definition) ou None
     """
+    if word in _example_cache:
+        return _example_cache[word]
     try:
         url = FREE_DICT_API.format(word=word)
-        response = requests.get(url, timeout=5)
+        response = _SESSION.get(url, timeout=5)
 
         if response.status_code == 200:
-            data = response.json()
-            if data and len(data) > 0:
-                for entry in data[0].get('meanings', []):
-                    for definition in entry.get('definitions', []):
-                        example = definition.get('example')
-                        if example and len(example) > 10:
-                            return (example, definition.get('definition', ''))
+            return _remember(_example_cache, word, _parse_dictionary_example(response.json()))
+        if response.status_code == 404:
+            return _remember(_example_cache, word, None)
         return None
     except Exception:
         return None
@@ -31,17 +99,16 @@ def translate_text(text: str) -> Optional[str]:
     """
     Traduz texto usando MyMemory API
     """
+    if text in _translation_cache:
+        return _translation_cache[text]
     try:
-        url = "https://api.mymemory.translated.net/get"
         params = {'q': text, 'langpair': 'en|pt-br'}
-        response = requests.get(url, params=params, timeout=5)
+        response = _SESSION.get(MYMEMORY_API, params=params, timeout=5)
         data = response.json()
-
+        translation = _parse_translation(data, text)
         if data.get('responseStatus') == 200:
-            translation = data['responseData']['translatedText']
-            if translation and translation.lower() != text.lower():
-                return translation
-        return None
+            _remember(_translation_cache, text, translation)
+        return translation
     except Exception:
         return None
 
@@ -51,66 +118,31 @@ def detect_word_type(word: str) -> str:
     """
     word_lower = word.lower()
 
-    # Verbos
-    verb_endings = ['ing', 'ed', 'ate', 'ize', 'ify']
-    if any(word_lower.endswith(e) for e in verb_endings):
+    if word_lower.endswith(_VERB_ENDINGS):
         return 'verb'
 
-    # Adjetivos
-    adj_endings = ['ful', 'less', 'ous', 'ive', 'able', 'ible', 'al', 'ic']
-    if any(word_lower.endswith(e) for e in adj_endings):
+    if word_lower.endswith(_ADJ_ENDINGS):
         return 'adjective'
 
-    # Advérbios
     if word_lower.endswith('ly'):
         return 'adverb'
 
-    # Substantivos
-    noun_endings = ['tion', 'ness', 'ment', 'ity', 'er', 'or', 'ism', 'ist']
-    if any(word_lower.endswith(e) for e in noun_endings):
-        return 'noun'
+    # Substantivos (sufixos típicos ou padrão)
+    return 'noun'
+
+def _smart_example_en(word: str, word_type: Optional[str] = None) -> str:
+    if not word_type:
+        word_type = detect_word_type(word)
 
-    return 'noun'  # Padrão
+    return _TEMPLATES.get(word_type, _TEMPLATES['noun'])[0].format(w=word)
 
 def generate_smart_example(word: str, word_type: Optional[str] = None) -> Tuple[str, Optional[str]]:
     """
     Gera exemplo inteligente baseado no tipo de palavra
     Returns: (example_en, example_pt)
     """
-    if not word_type:
-        word_type = detect_word_type(word)
-
-    templates = {
-        'verb': [
-            f"I {word} every day.",
-            f"She usually {word}s in the morning.",
-            f"They will {word} tomorrow.",
-            f"We should {word} more often.",
-        ],
-        'noun': [
-            f"The {word} is very important.",
-            f"I saw a beautiful {word} yesterday.",
-            f"This {word} is amazing!",
-            f"She bought a new {word}.",
-        ],
-        'adjective': [
-            f"She is very {word}.",
-            f"The weather is {word} today.",
-            f"It looks {word} from here.",
-            f"This book is quite {word}.",
-        ],
-        'adverb': [
-            f"He speaks {word}.",
-            f"She smiled {word}.",
-            f"They work {word}.",
-        ],
-    }
-
-    template_list = templates.get(word_type, templates['noun'])
-    example_en = template_list[0]
-    example_pt = translate_text(example_en)
-
-    return (example_en, example_pt)
+    example_en = _smart_example_en(word, word_type)
+    return (example_en, translate_text(example_en))
 
 def generate_example(word: str) -> Tuple[Optional[str], Optional[str]]:
     """
@@ -128,3 +160,4 @@ def generate_example(word: str) -> Tuple[Optional[str], Optional[str]]:
 
     # Fallback: gera exemplo inteligente
     return generate_smart_example(word)
+
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+def dumps_json_text(value: Any) -> str:
+    """Serializa para as colunas Text que guardam JSON (example_sentences, collocations).
+
+    Usa orjson quando disponível; o resultado é JSON válido em ambos os casos
+    (orjson grava UTF-8 sem escapes \\uXXXX e sem espaços após separadores).
+    """
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value)
+
+
+def loads_json(data: bytes | str) -> Any:
+    """json.loads com orjson quando disponível (aceita bytes direto da resposta HTTP).
+
+    Erros de parse são ValueError nos dois casos.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
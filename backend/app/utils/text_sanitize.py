@@ -19,13 +19,14 @@ def sanitize_unmatched_brackets(value: Optional[str]) -> Optional[str]:
     if not text:
         return text
 
-    has_open = "[" in text
-    has_close = "]" in text
-
-    if has_open and not has_close:
+    # Varreduras em C com curto-circuito: no caso comum (sem colchetes ou
+    # par completo) nada é alocado.
+    if "[" in text:
+        if "]" in text:
+            return text
         return text.replace("[", "").strip()
 
-    if has_close and not has_open:
+    if "]" in text:
         return text.replace("]", "").strip()
 
     return text
@@ -70,19 +70,23 @@ def list_all_users():
     db = SessionLocal()
 
     try:
-        users = db.query(User).all()
+        # Só as colunas exibidas; saída montada e escrita de uma vez
+        users = db.query(
+            User.id, User.name, User.email, User.is_admin, User.is_active, User.current_streak
+        ).all()
 
         if not users:
             print("ℹ️  Nenhum usuário encontrado no sistema")
             return
 
-        print(f"\n📋 Todos os Usuários ({len(users)}):\n")
-        for user in users:
-            admin_badge = "👑 ADMIN" if user.is_admin else "👤"
-            active_badge = "✅" if user.is_active else "❌"
-            print(f"  {admin_badge} {active_badge} {user.name} ({user.email})")
-            print(f"     ID: {user.id} | Streak: {user.current_streak} dias")
-            print()
+        lines = [f"\n📋 Todos os Usuários ({len(users)}):\n"]
+        for user_id, name, email, is_admin, is_active, streak in users:
+            admin_badge = "👑 ADMIN" if is_admin else "👤"
+            active_badge = "✅" if is_active else "❌"
+            lines.append(f"  {admin_badge} {active_badge} {name} ({email})")
+            lines.append(f"     ID: {user_id} | Streak: {streak} dias")
+            lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     except Exception as e:
         print(f"❌ Erro ao listar usuários: {e}")
@@ -1,7 +1,7 @@
 """
 Script para criar conquistas iniciais no banco de dados.
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, insert
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 from app.models.gamification import Achievement
@@ -53,10 +53,8 @@ def create_achievements():
             print(f"Já existem {existing} conquistas. Pulando criação.")
             return
         
-        for ach_data in ACHIEVEMENTS:
-            achievement = Achievement(**ach_data)
-            db.add(achievement)
-        
+        # Um único INSERT executemany, sem instanciar objetos ORM
+        db.execute(insert(Achievement), ACHIEVEMENTS)
         db.commit()
         print(f"✅ Criadas {len(ACHIEVEMENTS)} conquistas!")
         
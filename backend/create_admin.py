@@ -1,25 +1,35 @@
 #!/usr/bin/env python3
 """Script para criar usuário admin"""
+import os
 from datetime import datetime, timezone
+from sqlalchemy import exists
 from app.core.database import SessionLocal
 from app.models.user import User
-from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Custo do bcrypt para o seed (ex.: ADMIN_BCRYPT_ROUNDS=4 em dev);
+# sem a variável usa o padrão do passlib.
+ADMIN_BCRYPT_ROUNDS = os.getenv("ADMIN_BCRYPT_ROUNDS")
+
+
+def _hash_password(password: str) -> str:
+    # Import tardio: passlib só é carregado quando há hash a fazer
+    from passlib.context import CryptContext
+
+    options = {"bcrypt__rounds": int(ADMIN_BCRYPT_ROUNDS)} if ADMIN_BCRYPT_ROUNDS else {}
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", **options).hash(password)
 
 def create_admin():
     db = SessionLocal()
 
     # Verificar se já existe admin
-    admin = db.query(User).filter(User.email == "admin@idiomasbr.com").first()
-    if admin:
+    if db.query(exists().where(User.email == "admin@idiomasbr.com")).scalar():
         print("✓ Admin já existe!")
         print(f"  Email: admin@idiomasbr.com")
         print(f"  Senha: admin123")
         return
 
     # Criar novo admin
-    hashed_password = pwd_context.hash("admin123")
+    hashed_password = _hash_password("admin123")
 
     new_admin = User(
         email="admin@idiomasbr.com",
@@ -3,289 +3,256 @@ Script para enriquecer palavras com informações detalhadas.
 Adiciona definições, exemplos, sinônimos, e contexto de uso.
 """
 
+import io
 import json
 import os
+from functools import lru_cache
+from typing import Callable, Optional
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
 from app.core.database import SessionLocal, engine
 from app.models.word import Word
+from app.utils.json_text import dumps_json_text
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
 
-# Dados enriquecidos de exemplo para palavras comuns
-ENRICHED_DATA = {
-    # Verbos básicos
-    "be": {
-        "word_type": "verb",
-        "definition_en": "to exist, to have a specified quality or nature",
-        "definition_pt": "existir, ter uma qualidade ou natureza especificada",
-        "synonyms": "exist, remain, live",
-        "example_sentences": json.dumps([
-            {"en": "I am a student.", "pt": "Eu sou um estudante."},
-            {"en": "She is happy today.", "pt": "Ela está feliz hoje."},
-            {"en": "They are from Brazil.", "pt": "Eles são do Brasil."}
-        ]),
-        "usage_notes": "O verbo 'be' é irregular e fundamental. Use 'am/is/are' no presente, 'was/were' no passado. É usado para estados, identificação e características.",
-        "collocations": json.dumps(["be careful", "be ready", "be sure", "be able to"])
-    },
-    "have": {
-        "word_type": "verb",
-        "definition_en": "to possess, own, or hold",
-        "definition_pt": "possuir, ter ou segurar",
-        "synonyms": "possess, own, hold",
-        "example_sentences": json.dumps([
-            {"en": "I have a car.", "pt": "Eu tenho um carro."},
-            {"en": "She has two brothers.", "pt": "Ela tem dois irmãos."},
-            {"en": "We have dinner at 7 PM.", "pt": "Nós jantamos às 19h."}
-        ]),
-        "usage_notes": "Usado para posse, características e ações (have breakfast, have fun). No presente: have/has, passado: had.",
-        "collocations": json.dumps(["have fun", "have a good time", "have breakfast", "have a look"])
-    },
-    "do": {
-        "word_type": "verb",
-        "definition_en": "to perform, execute, or carry out an action",
-        "definition_pt": "realizar, executar ou levar a cabo uma ação",
-        "synonyms": "perform, execute, accomplish",
-        "example_sentences": json.dumps([
-            {"en": "I do my homework every day.", "pt": "Eu faço minha lição de casa todos os dias."},
-            {"en": "What do you do?", "pt": "O que você faz?"},
-            {"en": "She does yoga in the morning.", "pt": "Ela faz yoga de manhã."}
-        ]),
-        "usage_notes": "Verbo auxiliar em perguntas e negativas. Também significa 'fazer'. Presente: do/does, passado: did.",
-        "collocations": json.dumps(["do homework", "do business", "do your best", "do the dishes"])
-    },
-
-    # Substantivos comuns
-    "time": {
-        "word_type": "noun",
-        "definition_en": "the indefinite continued progress of existence and events",
-        "definition_pt": "o progresso contínuo indefinido da existência e eventos",
-        "synonyms": "moment, period, era, duration",
-        "antonyms": "eternity, timelessness",
-        "example_sentences": json.dumps([
-            {"en": "What time is it?", "pt": "Que horas são?"},
-            {"en": "I don't have time now.", "pt": "Não tenho tempo agora."},
-            {"en": "Time flies when you're having fun.", "pt": "O tempo voa quando você está se divertindo."}
-        ]),
-        "usage_notes": "Pode ser contável (times = vezes) ou incontável (time = tempo). Muito usado em expressões idiomáticas.",
-        "collocations": json.dumps(["save time", "waste time", "on time", "in time", "have a good time"])
-    },
-    "person": {
-        "word_type": "noun",
-        "definition_en": "a human being regarded as an individual",
-        "definition_pt": "um ser humano considerado como indivíduo",
-        "synonyms": "individual, human, being",
-        "example_sentences": json.dumps([
-            {"en": "She is a kind person.", "pt": "Ela é uma pessoa gentil."},
-            {"en": "Every person is unique.", "pt": "Cada pessoa é única."},
-            {"en": "Three persons are waiting outside.", "pt": "Três pessoas estão esperando lá fora."}
-        ]),
-        "usage_notes": "Plural: 'people' (informal) ou 'persons' (formal/legal). 'People' é mais comum no dia a dia.",
-        "collocations": json.dumps(["nice person", "important person", "in person"])
-    },
-
-    # Adjetivos
-    "good": {
-        "word_type": "adjective",
-        "definition_en": "to be desired or approved of; having the right qualities",
-        "definition_pt": "desejável ou aprovado; tendo as qualidades certas",
-        "synonyms": "excellent, great, fine, wonderful",
-        "antonyms": "bad, poor, terrible, awful",
-        "example_sentences": json.dumps([
-            {"en": "This is a good book.", "pt": "Este é um bom livro."},
-            {"en": "She is good at math.", "pt": "Ela é boa em matemática."},
-            {"en": "Have a good day!", "pt": "Tenha um bom dia!"}
-        ]),
-        "usage_notes": "Comparativo: better, superlativo: best. Muito usado em expressões e saudações.",
-        "collocations": json.dumps(["good morning", "good luck", "good idea", "feel good", "be good at"])
-    },
-    "new": {
-        "word_type": "adjective",
-        "definition_en": "not existing before; made, introduced, or discovered recently",
-        "definition_pt": "que não existia antes; feito, introduzido ou descoberto recentemente",
-        "synonyms": "fresh, recent, modern, novel",
-        "antonyms": "old, ancient, used, worn",
-        "example_sentences": json.dumps([
-            {"en": "I bought a new car.", "pt": "Comprei um carro novo."},
-            {"en": "What's new?", "pt": "O que há de novo?"},
-            {"en": "She has a new job.", "pt": "Ela tem um novo emprego."}
-        ]),
-        "usage_notes": "Oposto de 'old'. Comparativo: newer, superlativo: newest.",
-        "collocations": json.dumps(["brand new", "new year", "new idea", "something new"])
-    },
-    "happy": {
-        "word_type": "adjective",
-        "definition_en": "feeling or showing pleasure or contentment",
-        "definition_pt": "sentindo ou mostrando prazer ou contentamento",
-        "synonyms": "joyful, cheerful, delighted, pleased",
-        "antonyms": "sad, unhappy, miserable, depressed",
-        "example_sentences": json.dumps([
-            {"en": "I'm happy to see you.", "pt": "Estou feliz em te ver."},
-            {"en": "She looks happy today.", "pt": "Ela parece feliz hoje."},
-            {"en": "Happy birthday!", "pt": "Feliz aniversário!"}
-        ]),
-        "usage_notes": "Comparativo: happier, superlativo: happiest. Muda 'y' para 'i' antes de adicionar -er/-est.",
-        "collocations": json.dumps(["happy birthday", "happy ending", "happy hour", "make someone happy"])
-    },
-
-    # Advérbios
-    "very": {
-        "word_type": "adverb",
-        "definition_en": "used to emphasize an adjective or adverb",
-        "definition_pt": "usado para enfatizar um adjetivo ou advérbio",
-        "synonyms": "extremely, really, quite, highly",
-        "example_sentences": json.dumps([
-            {"en": "It's very hot today.", "pt": "Está muito quente hoje."},
-            {"en": "She is very intelligent.", "pt": "Ela é muito inteligente."},
-            {"en": "Thank you very much.", "pt": "Muito obrigado."}
-        ]),
-        "usage_notes": "Intensificador comum. Não use com adjetivos comparativos (errado: very better).",
-        "collocations": json.dumps(["very much", "very well", "very good", "very important"])
-    },
-    "well": {
-        "word_type": "adverb",
-        "definition_en": "in a good or satisfactory way",
-        "definition_pt": "de maneira boa ou satisfatória",
-        "synonyms": "properly, correctly, satisfactorily",
-        "antonyms": "badly, poorly",
-        "example_sentences": json.dumps([
-            {"en": "She speaks English well.", "pt": "Ela fala inglês bem."},
-            {"en": "I slept well last night.", "pt": "Dormi bem ontem à noite."},
-            {"en": "Well done!", "pt": "Muito bem!"}
-        ]),
-        "usage_notes": "Advérbio de 'good'. Também usado como interjeição no início de frases.",
-        "collocations": json.dumps(["very well", "well done", "as well", "well known"])
-    },
-
-    # Preposições e palavras de função
-    "in": {
-        "word_type": "preposition",
-        "definition_en": "expressing the situation of being enclosed or surrounded",
-        "definition_pt": "expressando a situação de estar cercado ou contido",
-        "example_sentences": json.dumps([
-            {"en": "I live in Brazil.", "pt": "Eu moro no Brasil."},
-            {"en": "She's in the kitchen.", "pt": "Ela está na cozinha."},
-            {"en": "I'll see you in an hour.", "pt": "Te vejo em uma hora."}
-        ]),
-        "usage_notes": "Usado para: locais (países, cidades), tempo futuro (in 2 hours), meses/anos (in January, in 2024).",
-        "collocations": json.dumps(["in time", "in love", "in fact", "in general", "believe in"])
-    },
-    "on": {
-        "word_type": "preposition",
-        "definition_en": "physically in contact with and supported by a surface",
-        "definition_pt": "fisicamente em contato e suportado por uma superfície",
-        "example_sentences": json.dumps([
-            {"en": "The book is on the table.", "pt": "O livro está na mesa."},
-            {"en": "I'll call you on Monday.", "pt": "Vou te ligar na segunda-feira."},
-            {"en": "Turn on the TV.", "pt": "Ligue a TV."}
-        ]),
-        "usage_notes": "Usado para: superfícies, dias da semana, datas, transporte público.",
-        "collocations": json.dumps(["on time", "on purpose", "on sale", "focus on", "depend on"])
-    },
-    "at": {
-        "word_type": "preposition",
-        "definition_en": "expressing location or arrival in a particular place",
-        "definition_pt": "expressando localização ou chegada em um lugar específico",
-        "example_sentences": json.dumps([
-            {"en": "I'm at home.", "pt": "Estou em casa."},
-            {"en": "The meeting is at 3 PM.", "pt": "A reunião é às 15h."},
-            {"en": "She's good at English.", "pt": "Ela é boa em inglês."}
-        ]),
-        "usage_notes": "Usado para: pontos específicos (at home, at the door), horas (at 5 o'clock), habilidades (good at).",
-        "collocations": json.dumps(["at least", "at last", "at home", "good at", "look at"])
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+ENRICHED_FIELDS = (
+    "word_type", "definition_en", "definition_pt", "synonyms",
+    "antonyms", "example_sentences", "usage_notes", "collocations",
+)
+
+# Campos guardados como JSON em colunas Text
+JSON_TEXT_FIELDS = ("example_sentences", "collocations")
+
+# Dados enriquecidos para palavras comuns (editável sem mexer no código)
+ENRICHED_DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "enriched_words.json")
+
+
+@lru_cache(maxsize=None)
+def load_enriched_data() -> dict:
+    """Carrega ENRICHED_DATA_PATH uma vez, normalizado: cada entrada vira um dict
+    coluna -> valor completo (campos ausentes = None, listas já serializadas),
+    pronto para o UPDATE em lote."""
+    with open(ENRICHED_DATA_PATH, "rb") as f:
+        raw = _json_loads(f.read())
+    return {
+        key.lower(): {
+            field: dumps_json_text(data[field]) if field in JSON_TEXT_FIELDS and data.get(field) is not None else data.get(field)
+            for field in ENRICHED_FIELDS
+        }
+        for key, data in raw.items()
     }
+
+
+WORD_TYPE_SUFFIXES = {
+    "verb": ('ing', 'ed', 'ate', 'ize', 'ify', 'en'),
+    "adverb": ('ly',),
+    "noun": ('tion', 'sion', 'ness', 'ment', 'ity', 'er', 'or', 'ism', 'ist', 'ance', 'ence'),
+    "adjective": ('ful', 'less', 'ous', 'ious', 'ive', 'able', 'ible', 'al', 'ic', 'ical'),
 }
 
 
-def detect_word_type(word: str) -> str:
-    """Detecta o tipo da palavra baseado em padrões morfológicos."""
-    word_lower = word.lower()
+def make_suffix_classifier(suffixes_by_type: dict) -> Callable[[str], Optional[str]]:
+    """Classificador palavra -> tipo (ou None) a partir de {tipo: sufixos}."""
+    # Sufixo -> tipo. Nenhum sufixo de uma classe termina com sufixo de outra,
+    # então a primeira correspondência (4, 3 ou 2 letras finais) é a única possível.
+    suffix_type = {
+        suffix: word_type
+        for word_type, suffixes in suffixes_by_type.items()
+        for suffix in suffixes
+    }
+    lookup = suffix_type.get
+
+    def classify(word: str) -> Optional[str]:
+        word_lower = word.lower()
+        return lookup(word_lower[-4:]) or lookup(word_lower[-3:]) or lookup(word_lower[-2:])
 
-    # Verbos
-    if word_lower.endswith(('ing', 'ed', 'ate', 'ize', 'ify', 'en')):
-        return "verb"
+    return classify
 
-    # Advérbios
-    if word_lower.endswith('ly'):
-        return "adverb"
 
-    # Substantivos
-    if word_lower.endswith(('tion', 'sion', 'ness', 'ment', 'ity', 'er', 'or', 'ism', 'ist', 'ance', 'ence')):
-        return "noun"
+_word_type_from_suffix = make_suffix_classifier(WORD_TYPE_SUFFIXES)
 
-    # Adjetivos
-    if word_lower.endswith(('ful', 'less', 'ous', 'ious', 'ive', 'able', 'ible', 'al', 'ic', 'ical')):
-        return "adjective"
 
-    return "other"
+def detect_word_type(word: str) -> str:
+    """Detecta o tipo da palavra baseado em padrões morfológicos."""
+    return _word_type_from_suffix(word) or "other"
+
+
+# Pares (en, pt) por tipo de palavra; "other" é o fallback.
+BASIC_EXAMPLE_TEMPLATES = {
+    "verb": (
+        ("I {en} every day.", "Eu {pt} todos os dias."),
+        ("She {en}s on weekends.", "Ela {pt} aos fins de semana."),
+        ("We should {en} more often.", "Devemos {pt} com mais frequência."),
+    ),
+    "noun": (
+        ("The {en} is very important.", "O/A {pt} é muito importante."),
+        ("I need a {en}.", "Preciso de um/uma {pt}."),
+        ("This {en} looks great!", "Este/Esta {pt} parece ótimo/ótima!"),
+    ),
+    "adjective": (
+        ("She is very {en}.", "Ela é muito {pt}."),
+        ("The weather is {en} today.", "O tempo está {pt} hoje."),
+        ("It looks {en}.", "Parece {pt}."),
+    ),
+    "adverb": (
+        ("He speaks {en}.", "Ele fala {pt}."),
+        ("She smiled {en}.", "Ela sorriu {pt}."),
+        ("They work {en}.", "Eles trabalham {pt}."),
+    ),
+    "other": (
+        ("This is {en}.", "Isto é {pt}."),
+        ("Look {en} that.", "Olhe {pt} aquilo."),
+    ),
+}
+
+# Templates pré-quebrados em (prefixo, sufixo): montar a frase vira só concatenação.
+_BASIC_EXAMPLE_FRAGMENTS = {
+    word_type: tuple(
+        (tuple(en.split("{en}")), tuple(pt.split("{pt}")))
+        for en, pt in templates
+    )
+    for word_type, templates in BASIC_EXAMPLE_TEMPLATES.items()
+}
 
 
-def generate_basic_examples(word_obj: Word) -> list:
+def generate_basic_examples(word_obj: Word, word_type: Optional[str] = None) -> list:
     """Gera exemplos básicos baseados no tipo de palavra."""
-    word_type = word_obj.word_type or detect_word_type(word_obj.english)
+    word_type = word_type or word_obj.word_type or detect_word_type(word_obj.english)
     english = word_obj.english
     portuguese = word_obj.portuguese
 
-    examples = []
-
-    if word_type == "verb":
-        examples = [
-            {"en": f"I {english} every day.", "pt": f"Eu {portuguese} todos os dias."},
-            {"en": f"She {english}s on weekends.", "pt": f"Ela {portuguese} aos fins de semana."},
-            {"en": f"We should {english} more often.", "pt": f"Devemos {portuguese} com mais frequência."}
-        ]
-    elif word_type == "noun":
-        examples = [
-            {"en": f"The {english} is very important.", "pt": f"O/A {portuguese} é muito importante."},
-            {"en": f"I need a {english}.", "pt": f"Preciso de um/uma {portuguese}."},
-            {"en": f"This {english} looks great!", "pt": f"Este/Esta {portuguese} parece ótimo/ótima!"}
-        ]
-    elif word_type == "adjective":
-        examples = [
-            {"en": f"She is very {english}.", "pt": f"Ela é muito {portuguese}."},
-            {"en": f"The weather is {english} today.", "pt": f"O tempo está {portuguese} hoje."},
-            {"en": f"It looks {english}.", "pt": f"Parece {portuguese}."}
-        ]
-    elif word_type == "adverb":
-        examples = [
-            {"en": f"He speaks {english}.", "pt": f"Ele fala {portuguese}."},
-            {"en": f"She smiled {english}.", "pt": f"Ela sorriu {portuguese}."},
-            {"en": f"They work {english}.", "pt": f"Eles trabalham {portuguese}."}
-        ]
-    else:
-        examples = [
-            {"en": f"This is {english}.", "pt": f"Isto é {portuguese}."},
-            {"en": f"Look {english} that.", "pt": f"Olhe {portuguese} aquilo."}
-        ]
-
-    return examples
+    fragments = _BASIC_EXAMPLE_FRAGMENTS.get(word_type, _BASIC_EXAMPLE_FRAGMENTS["other"])
+    return [
+        {"en": en_head + english + en_tail, "pt": pt_head + portuguese + pt_tail}
+        for (en_head, en_tail), (pt_head, pt_tail) in fragments
+    ]
 
 
-def enrich_word(word: Word) -> bool:
-    """Enriquece uma palavra com informações detalhadas."""
+# Colunas necessárias para calcular o enriquecimento (sem carregar a linha inteira)
+SOURCE_COLUMNS = (Word.id, Word.english, Word.portuguese, Word.word_type, Word.example_sentences)
+
+UPDATE_BATCH_SIZE = 1000
+
+
+def enrichment_values(word) -> tuple[dict, bool]:
+    """
+    Calcula as colunas a atualizar para uma palavra (Word ou linha com
+    english/portuguese/word_type/example_sentences).
+    Retorna (valores alterados, se veio de data/enriched_words.json).
+    """
     english_lower = word.english.lower()
 
     # Se temos dados pré-definidos, use-os
-    if english_lower in ENRICHED_DATA:
-        data = ENRICHED_DATA[english_lower]
-        word.word_type = data.get("word_type")
-        word.definition_en = data.get("definition_en")
-        word.definition_pt = data.get("definition_pt")
-        word.synonyms = data.get("synonyms")
-        word.antonyms = data.get("antonyms")
-        word.example_sentences = data.get("example_sentences")
-        word.usage_notes = data.get("usage_notes")
-        word.collocations = data.get("collocations")
-        return True
+    data = load_enriched_data().get(english_lower)
+    if data is not None:
+        return dict(data), True
+
+    values = {}
 
     # Caso contrário, gere informações básicas
-    if not word.word_type:
-        word.word_type = detect_word_type(word.english)
+    word_type = word.word_type
+    if not word_type:
+        word_type = values["word_type"] = detect_word_type(word.english)
 
     # Gere exemplos se não existirem
     if not word.example_sentences:
-        examples = generate_basic_examples(word)
-        word.example_sentences = json.dumps(examples)
+        examples = generate_basic_examples(word, word_type)
+        values["example_sentences"] = dumps_json_text(examples)
 
-    return False
+    return values, False
+
+
+def enrich_word(word: Word) -> bool:
+    """Enriquece uma palavra com informações detalhadas."""
+    values, enriched = enrichment_values(word)
+    for field, value in values.items():
+        setattr(word, field, value)
+    return enriched
+
+
+def _copy_text_value(value) -> str:
+    """Escapa um valor para o formato texto do COPY (NULL = \\N)."""
+    if value is None:
+        return "\\N"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def copy_update_postgres(db: Session, rows: list) -> None:
+    """UPDATE em massa no PostgreSQL: COPY para uma tabela temporária + UPDATE ... FROM.
+
+    Todas as linhas precisam ter as mesmas chaves (id + colunas).
+    """
+    columns = [key for key in rows[0] if key != "id"]
+    quoted = [f'"{column}"' for column in columns]
+    column_defs = ", ".join(f"{column} text" for column in quoted)
+    assignments = ", ".join(f"{column} = s.{column}" for column in quoted)
+
+    buf = io.StringIO()
+    for row in rows:
+        buf.write("\t".join([str(int(row["id"]))] + [_copy_text_value(row[c]) for c in columns]))
+        buf.write("\n")
+    buf.seek(0)
+
+    # Cursor DBAPI (psycopg2) da mesma conexão/transação da sessão
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.execute("DROP TABLE IF EXISTS word_enrichment_stg")
+        cursor.execute(f"CREATE TEMP TABLE word_enrichment_stg (id integer PRIMARY KEY, {column_defs}) ON COMMIT DROP")
+        cursor.copy_expert(f"COPY word_enrichment_stg (id, {', '.join(quoted)}) FROM STDIN", buf)
+        cursor.execute(
+            f"UPDATE {Word.__tablename__} AS w SET {assignments} "
+            "FROM word_enrichment_stg AS s WHERE w.id = s.id"
+        )
+    finally:
+        cursor.close()
+
+
+def flush_updates(db: Session, rows: list) -> None:
+    """Aplica um lote de atualizações (dicts com id + colunas) e faz commit.
+
+    No PostgreSQL usa COPY + UPDATE ... FROM; nos demais bancos, executemany
+    do ORM por chave primária.
+    """
+    if not rows:
+        return
+    # Agrupa por conjunto de colunas: cada executemany/COPY exige chaves uniformes.
+    groups: dict = {}
+    for row in rows:
+        groups.setdefault(frozenset(row), []).append(row)
+    use_copy = db.get_bind().dialect.name == "postgresql"
+    for group in groups.values():
+        if use_copy:
+            copy_update_postgres(db, group)
+        else:
+            db.execute(update(Word), group)
+    db.commit()
+
+
+def iter_source_rows(db: Session, page_size: int = UPDATE_BATCH_SIZE):
+    """Linhas com SOURCE_COLUMNS em páginas por id (keyset), sem carregar a tabela inteira."""
+    last_id = None
+    while True:
+        stmt = select(*SOURCE_COLUMNS).order_by(Word.id).limit(page_size)
+        if last_id is not None:
+            stmt = stmt.where(Word.id > last_id)
+        page = db.execute(stmt).all()
+        if not page:
+            return
+        last_id = page[-1].id
+        yield from page
 
 
 def main():
@@ -295,27 +262,34 @@ def main():
     try:
         print("🚀 Iniciando enriquecimento de palavras...")
 
-        # Buscar todas as palavras
-        words = db.query(Word).all()
-        total = len(words)
+        # Buscar só as colunas usadas, página a página; as alterações vão em
+        # UPDATEs em lote (executemany por chave primária), sem unit-of-work do ORM.
+        total = db.query(func.count(Word.id)).scalar()
         enriched_count = 0
         generated_count = 0
+        pending = []
 
         print(f"📊 Total de palavras: {total}")
 
-        for i, word in enumerate(words, 1):
-            was_enriched = enrich_word(word)
+        for i, word in enumerate(iter_source_rows(db), 1):
+            values, was_enriched = enrichment_values(word)
+            if values:
+                values["id"] = word.id
+                pending.append(values)
 
             if was_enriched:
                 enriched_count += 1
             else:
                 generated_count += 1
 
+            if len(pending) >= UPDATE_BATCH_SIZE:
+                flush_updates(db, pending)
+                pending = []
+
             if i % 100 == 0:
                 print(f"⏳ Processadas: {i}/{total}")
-                db.commit()
 
-        db.commit()
+        flush_updates(db, pending)
 
         print("\n✅ Enriquecimento concluído!")
         print(f"📚 Palavras com dados completos: {enriched_count}")
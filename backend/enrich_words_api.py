@@ -9,32 +9,59 @@ Usa:
 - Datamuse API (gratuita, para sinônimos e colocações)
 """
 
-import json
 import hashlib
 import asyncio
+import functools
 import os
 import sys
 import re
 import traceback
-import urllib.parse
-from time import sleep
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from time import monotonic, sleep
 from sqlalchemy.orm import Session
 from sqlalchemy import func, or_
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from typing import Optional
+from typing import Iterable, Optional
 
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI, OpenAI
 except Exception:  # pragma: no cover
+    AsyncOpenAI = None  # type: ignore[assignment]
     OpenAI = None  # type: ignore[assignment]
 
+try:
+    from tqdm import tqdm
+except Exception:  # pragma: no cover
+    tqdm = None  # type: ignore[assignment]
+
 # Adicionar path do projeto
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from app.core.database import SessionLocal
-from app.models.word import Word
-from services.dictionary_api import enrich_word_from_api
+from app.models.word import (
+    Word,
+    headword_candidate_filter,
+    missing_enrichment_filters,
+    not_dict_404_filter,
+)
+from app.utils.json_text import dumps_json_text, loads_json
+from enrich_words import WORD_TYPE_SUFFIXES, make_suffix_classifier
+from services.dictionary_api import (
+    AdaptiveRate,
+    AsyncRateLimiter,
+    DiskCache,
+    close_thread_loop,
+    enable_disk_cache,
+    enrich_word_from_api,
+    enrich_words_from_api,
+    get_with_limiter,
+    run_async,
+)
 
 
 _HAS_NON_ASCII_RE = re.compile(r"[^\x00-\x7F]")
@@ -44,6 +71,98 @@ _HEADWORD_TOKEN_RE = re.compile(r"^[A-Za-z][A-Za-z'’\-]*$")
 _OPENAI_CLIENT: Optional["OpenAI"] = None
 _DEEPSEEK_CLIENT: Optional["OpenAI"] = None
 
+# Retentativas do SDK da OpenAI (também usado p/ DeepSeek): 408/409/429/5xx e
+# erros de conexão, com backoff exponencial + jitter respeitando Retry-After.
+LLM_MAX_RETRIES = 5
+# Retentativas do MyMemory na variante async (a síncrona usa o Retry do urllib3)
+MYMEMORY_MAX_ATTEMPTS = 3
+MYMEMORY_BACKOFF_MAX_S = 30.0
+
+class _Circuit:
+    """Circuit breaker de um provedor de LLM para tradução.
+
+    Após `threshold` falhas seguidas o provedor é pulado (direto p/ MyMemory)
+    por `cooldown_s`; depois passa uma única tentativa (half-open), que fecha
+    o circuito se der certo ou o reabre se falhar.
+    """
+
+    def __init__(self, threshold: int = 5, cooldown_s: float = 60.0):
+        self.threshold = threshold
+        self.cooldown_s = cooldown_s
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        if self._probing or monotonic() - self.opened_at < self.cooldown_s:
+            return False
+        self._probing = True
+        return True
+
+    def success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+
+    def failure(self) -> None:
+        self.failures += 1
+        self._probing = False
+        if self.opened_at is not None or self.failures >= self.threshold:
+            self.opened_at = monotonic()
+
+
+_LLM_CIRCUITS = {"openai": _Circuit(), "deepseek": _Circuit()}
+
+# ai_teacher_service (TTS), importado na primeira geração; False se falhou
+_AI_TEACHER = None
+
+# Cache persistente das traduções (mesmo SQLite do cache das APIs); ver main()
+_TRANSLATION_CACHE: Optional[DiskCache] = None
+
+_EN_TO_PT_PROMPT = (
+    "You translate English to Brazilian Portuguese (pt-BR). "
+    "Return ONLY the translated text (no quotes, no markdown, no explanations)."
+)
+_PT_TO_EN_PROMPT = (
+    "You translate Brazilian Portuguese (pt-BR) to English. "
+    "Return ONLY the translated text (no quotes, no markdown, no explanations)."
+)
+
+MYMEMORY_API = "https://api.mymemory.translated.net/get"
+
+# Sessão compartilhada: reaproveita conexões HTTPS (sem handshake TLS por chamada)
+# e repete 429/5xx com backoff.
+_HTTP = requests.Session()
+_HTTP.headers["Connection"] = "keep-alive"
+_HTTP.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=50,
+        pool_maxsize=50,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504]),
+    ),
+)
+
+# Lote: vários textos numa só chamada ao LLM (prompt de sistema enviado uma vez)
+TRANSLATE_BATCH_SIZE = 20
+_BATCH_PROMPT = (
+    "You translate {source} to {target}. The user sends numbered items. "
+    "Return ONLY a JSON array of strings with the translations, in the same order "
+    "and with the same number of items (no markdown, no explanations)."
+)
+_BATCH_PROMPTS = {
+    "en-pt": _BATCH_PROMPT.format(source="English", target="Brazilian Portuguese (pt-BR)"),
+    "pt-en": _BATCH_PROMPT.format(source="Brazilian Portuguese (pt-BR)", target="English"),
+}
+
+# Direção -> (prompt do LLM, langpair do MyMemory)
+_TRANSLATION_DIRECTIONS = {
+    "en-pt": (_EN_TO_PT_PROMPT, "en|pt-br"),
+    "pt-en": (_PT_TO_EN_PROMPT, "pt-br|en"),
+}
+
 
 def _words_static_dir() -> str:
     # This script lives in backend/. Static is backend/static (mounted at /static by FastAPI).
@@ -55,16 +174,63 @@ def _word_tts_filename(*, word_id: int, english: str, voice: str) -> str:
     return f"word_{word_id}_{sha}.mp3"
 
 
-def maybe_generate_word_tts_audio_url(
+def _get_ai_teacher_service():
+    global _AI_TEACHER
+    if _AI_TEACHER is None:
+        try:
+            from app.services.ai_teacher import ai_teacher_service
+        except Exception as e:
+            print(f"[WARN] Não foi possível importar ai_teacher_service (TTS): {e}")
+            _AI_TEACHER = False
+        else:
+            _AI_TEACHER = ai_teacher_service
+    return _AI_TEACHER or None
+
+
+def _existing_tts_files(static_dir: str) -> set:
+    """Nomes dos arquivos já gerados (um scandir em vez de um stat por palavra)."""
+    try:
+        with os.scandir(static_dir) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Grava de forma atômica: arquivo .part + os.replace.
+
+    Um processo interrompido no meio deixa só o .part, nunca um mp3 truncado
+    que seria tomado como pronto na próxima execução.
+    """
+    tmp_path = path + ".part"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp_path)
+        raise
+    os.close(fd)
+    os.replace(tmp_path, path)
+
+
+async def generate_word_tts_audio_url_async(
     db: Session,
     word: Word,
     *,
     voice: str = "nova",
     force: bool = False,
+    limiter: Optional[AsyncRateLimiter] = None,
+    existing_files: Optional[set] = None,
 ) -> Optional[str]:
     """Generate and persist a local /static/words/*.mp3 for a Word.
 
     Returns the audio_url to store ("/static/words/<file>") or None.
+    `limiter` (optional) spaces out the actual TTS calls; `existing_files`
+    (optional, from _existing_tts_files) replaces the per-word stat.
     """
 
     english = (word.english or "").strip()
@@ -75,30 +241,33 @@ def maybe_generate_word_tts_audio_url(
         return None
 
     static_dir = _words_static_dir()
-    os.makedirs(static_dir, exist_ok=True)
+    if existing_files is None:
+        os.makedirs(static_dir, exist_ok=True)
 
     filename = _word_tts_filename(word_id=int(word.id), english=english, voice=voice)
     out_path = os.path.join(static_dir, filename)
 
     # If file already exists, just point audio_url to it.
-    if os.path.isfile(out_path):
+    if existing_files is not None:
+        exists = filename in existing_files
+    else:
+        exists = os.path.isfile(out_path)
+    if exists:
         return f"/static/words/{filename}"
 
-    try:
-        from app.services.ai_teacher import ai_teacher_service
-    except Exception as e:
-        print(f"[WARN] Não foi possível importar ai_teacher_service (TTS): {e}")
+    ai_teacher_service = _get_ai_teacher_service()
+    if ai_teacher_service is None:
         return None
 
+    if limiter is not None:
+        await limiter.wait()
     try:
-        audio_bytes = asyncio.run(
-            ai_teacher_service.generate_speech(
-                english,
-                voice=voice,
-                db=db,
-                cache_operation="words.ai.tts",
-                cache_scope="global",
-            )
+        audio_bytes = await ai_teacher_service.generate_speech(
+            english,
+            voice=voice,
+            db=db,
+            cache_operation="words.ai.tts",
+            cache_scope="global",
         )
     except Exception as e:
         msg = str(e)
@@ -109,8 +278,7 @@ def maybe_generate_word_tts_audio_url(
         return None
 
     try:
-        with open(out_path, "wb") as f:
-            f.write(audio_bytes)
+        await asyncio.to_thread(_write_bytes, out_path, audio_bytes)
     except Exception as e:
         print(f"[TTS ERROR] Falha ao salvar arquivo '{out_path}': {e}")
         return None
@@ -118,6 +286,87 @@ def maybe_generate_word_tts_audio_url(
     return f"/static/words/{filename}"
 
 
+def maybe_generate_word_tts_audio_url(
+    db: Session,
+    word: Word,
+    *,
+    voice: str = "nova",
+    force: bool = False,
+) -> Optional[str]:
+    """Síncrono, uma palavra; para lotes use generate_words_tts_audio_urls."""
+    return run_async(generate_word_tts_audio_url_async(db, word, voice=voice, force=force))
+
+
+async def _generate_words_tts_async(
+    db: Session,
+    words: list,
+    *,
+    voice: str,
+    concurrency: int,
+    min_interval: float,
+    delay_after: float,
+) -> dict:
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    limiter = AsyncRateLimiter(1.0 / min_interval if min_interval > 0 else 0)
+    static_dir = _words_static_dir()
+    os.makedirs(static_dir, exist_ok=True)
+    existing_files = _existing_tts_files(static_dir)
+
+    # One TTS call per headword: repeated headwords would miss the AI cache
+    # together and insert the same (UNIQUE) cache_key.
+    groups: dict = {}
+    for word in words:
+        english = (word.english or "").strip()
+        if english and not (word.audio_url or "").strip():
+            groups.setdefault(english, []).append(word)
+
+    # Each generation gets its own session: the AI cache lookups/commits of
+    # concurrent tasks would otherwise interleave (and a rollback in one would
+    # discard the others' pending work) on the caller's session.
+    bind = db.get_bind()
+
+    async def one(group):
+        async with semaphore:
+            with Session(bind=bind) as task_db:
+                url = await generate_word_tts_audio_url_async(
+                    task_db, group[0], voice=voice, limiter=limiter, existing_files=existing_files
+                )
+            if url and delay_after:
+                await asyncio.sleep(delay_after)
+            return group, url
+
+    results = await asyncio.gather(*(one(group) for group in groups.values()))
+    return {word.id: url for group, url in results if url for word in group}
+
+
+def generate_words_tts_audio_urls(
+    db: Session,
+    words: list,
+    *,
+    voice: str = "nova",
+    concurrency: int = 8,
+    min_interval: float = 0.0,
+    delay_after: float = 0.0,
+) -> dict:
+    """Gera o TTS de várias palavras num único event loop; {word.id: audio_url}.
+
+    Até `concurrency` gerações em paralelo, com no mínimo `min_interval`
+    segundos entre o início de cada chamada ao TTS.
+    """
+    if not words:
+        return {}
+    return run_async(
+        _generate_words_tts_async(
+            db,
+            words,
+            voice=voice,
+            concurrency=concurrency,
+            min_interval=min_interval,
+            delay_after=delay_after,
+        )
+    )
+
+
 def _get_openai_client() -> Optional["OpenAI"]:
     global _OPENAI_CLIENT
     if _OPENAI_CLIENT is not None:
@@ -128,7 +377,7 @@ def _get_openai_client() -> Optional["OpenAI"]:
         _OPENAI_CLIENT = None
         return None
 
-    _OPENAI_CLIENT = OpenAI(api_key=api_key)
+    _OPENAI_CLIENT = OpenAI(api_key=api_key, max_retries=LLM_MAX_RETRIES)
     return _OPENAI_CLIENT
 
 
@@ -142,10 +391,58 @@ def _get_deepseek_client() -> Optional["OpenAI"]:
         _DEEPSEEK_CLIENT = None
         return None
 
-    _DEEPSEEK_CLIENT = OpenAI(api_key=api_key, base_url="https://api.deepseek.com")
+    _DEEPSEEK_CLIENT = OpenAI(
+        api_key=api_key, base_url="https://api.deepseek.com", max_retries=LLM_MAX_RETRIES
+    )
     return _DEEPSEEK_CLIENT
 
 
+def enable_translation_cache(cache: Optional[DiskCache]) -> None:
+    """Liga (ou desliga, com None) o cache persistente de traduções."""
+    global _TRANSLATION_CACHE
+    _TRANSLATION_CACHE = cache
+
+
+def _translation_cache_key(direction: str, src: str) -> str:
+    settings = _llm_translation_settings()
+    provider = settings[0] if settings else "mymemory"
+    digest = hashlib.sha256(src.encode("utf-8")).hexdigest()
+    return f"translate:{direction}:{provider}:{digest}"
+
+
+def _cached_translation(direction: str, src: str) -> Optional[str]:
+    if _TRANSLATION_CACHE is None:
+        return None
+    hit = _TRANSLATION_CACHE.get(_translation_cache_key(direction, src))
+    return hit if isinstance(hit, str) else None
+
+
+def _store_translation(direction: str, src: str, out: Optional[str]) -> None:
+    # Só sucessos: uma falha (rede, cota) pode dar certo na próxima execução.
+    if out and _TRANSLATION_CACHE is not None:
+        _TRANSLATION_CACHE.set(_translation_cache_key(direction, src), out)
+
+
+def _with_translation_cache(direction: str):
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(text: str) -> Optional[str]:
+            src = (text or "").strip()
+            if not src or _TRANSLATION_CACHE is None:
+                return fn(text)
+            cached = _cached_translation(direction, src)
+            if cached is not None:
+                return cached
+            out = fn(text)
+            _store_translation(direction, src, out)
+            return out
+
+        return wrapper
+
+    return decorator
+
+
+@_with_translation_cache("en-pt")
 def translate_en_to_pt_br(text: str) -> Optional[str]:
     """Tradução EN -> pt-BR.
 
@@ -169,13 +466,11 @@ def translate_en_to_pt_br(text: str) -> Optional[str]:
         model = os.getenv("DEEPSEEK_TRANSLATE_MODEL", "deepseek-chat")
         provider = "deepseek"
 
-    if client is None:
+    circuit = _LLM_CIRCUITS[provider]
+    if client is None or not circuit.allow():
         return _translate_en_to_pt_mymemory(src)
 
-    system_prompt = (
-        "You translate English to Brazilian Portuguese (pt-BR). "
-        "Return ONLY the translated text (no quotes, no markdown, no explanations)."
-    )
+    system_prompt = _EN_TO_PT_PROMPT
     user_prompt = src
 
     try:
@@ -186,7 +481,9 @@ def translate_en_to_pt_br(text: str) -> Optional[str]:
                 {"role": "user", "content": user_prompt},
             ],
             temperature=0.2,
+            extra_headers=_idempotency_headers(model, system_prompt, user_prompt),
         )
+        circuit.success()
 
         out = (resp.choices[0].message.content or "").strip()
         # Defensive cleanup: strip quotes if model adds them.
@@ -198,6 +495,7 @@ def translate_en_to_pt_br(text: str) -> Optional[str]:
             return None
         return out
     except Exception as e:
+        circuit.failure()
         print(f"[WARN] Translation failed ({provider}): {e}")
         return _translate_en_to_pt_mymemory(src)
 
@@ -208,11 +506,10 @@ def _translate_en_to_pt_mymemory(text: str) -> Optional[str]:
     Evita retornar o próprio texto de entrada e aplica timeouts curtos.
     """
 
-    src = (text or "").strip()
-    if not src:
-        return None
+    return _translate_mymemory(text, "en|pt-br")
 
 
+@_with_translation_cache("pt-en")
 def translate_pt_br_to_en(text: str) -> Optional[str]:
     """Tradução pt-BR -> EN.
 
@@ -233,13 +530,11 @@ def translate_pt_br_to_en(text: str) -> Optional[str]:
         model = os.getenv("DEEPSEEK_TRANSLATE_MODEL", "deepseek-chat")
         provider = "deepseek"
 
-    if client is None:
+    circuit = _LLM_CIRCUITS[provider]
+    if client is None or not circuit.allow():
         return _translate_pt_to_en_mymemory(src)
 
-    system_prompt = (
-        "You translate Brazilian Portuguese (pt-BR) to English. "
-        "Return ONLY the translated text (no quotes, no markdown, no explanations)."
-    )
+    system_prompt = _PT_TO_EN_PROMPT
     user_prompt = src
 
     try:
@@ -250,7 +545,9 @@ def translate_pt_br_to_en(text: str) -> Optional[str]:
                 {"role": "user", "content": user_prompt},
             ],
             temperature=0.2,
+            extra_headers=_idempotency_headers(model, system_prompt, user_prompt),
         )
+        circuit.success()
 
         out = (resp.choices[0].message.content or "").strip()
         out = out.strip().strip('"').strip("'").strip()
@@ -260,112 +557,252 @@ def translate_pt_br_to_en(text: str) -> Optional[str]:
             return None
         return out
     except Exception as e:
+        circuit.failure()
         print(f"[WARN] Translation failed ({provider}): {e}")
         return _translate_pt_to_en_mymemory(src)
 
 
 def _translate_pt_to_en_mymemory(text: str) -> Optional[str]:
+    return _translate_mymemory(text, "pt-br|en")
+
+
+def _translate_mymemory(text: str, langpair: str) -> Optional[str]:
     src = (text or "").strip()
     if not src:
         return None
 
-    url = (
-        "https://api.mymemory.translated.net/get?"
-        + "q="
-        + urllib.parse.quote(src)
-        + "&langpair=pt-br|en"
-    )
-
     try:
-        resp = requests.get(url, timeout=10)
+        resp = _HTTP.get(MYMEMORY_API, params={"q": src, "langpair": langpair}, timeout=10)
         if resp.status_code != 200:
             return None
-        data = resp.json()
-        translated = (
-            ((data or {}).get("responseData") or {}).get("translatedText") or ""
-        ).strip()
-        translated = translated.strip().strip('"').strip("'").strip()
-        if not translated:
-            return None
-        if translated.lower() == src.lower():
-            return None
-        return translated
+        data = loads_json(resp.content)
+        return _clean_translation(((data or {}).get("responseData") or {}).get("translatedText"), src)
     except Exception:
         return None
 
 
-def detect_word_type_simple(word: str) -> Optional[str]:
-    """Heurística simples para preencher word_type quando API falha."""
-    w = (word or "").strip().lower()
-    if not w:
-        return None
+def _idempotency_headers(model: str, system_prompt: str, user_prompt: str) -> dict:
+    """Mesma requisição -> mesma chave, para retentativas não serem cobradas duas vezes."""
+    key = hashlib.sha1(f"{model}|{system_prompt}|{user_prompt}".encode("utf-8")).hexdigest()
+    return {"Idempotency-Key": key}
 
-    if w.endswith(("ing", "ed", "ate", "ize", "ify", "en")):
-        return "verb"
-    if w.endswith("ly"):
-        return "adverb"
-    if w.endswith(("tion", "sion", "ness", "ment", "ity", "er", "or", "ism", "ist", "ance", "ence")):
-        return "noun"
-    if w.endswith(("ful", "less", "ous", "ious", "ive", "able", "ible", "al", "ic", "ical")):
-        return "adjective"
 
-    # Nacionalidades/demônimos e adjetivos comuns
-    if w.endswith(("ian", "ean", "ese")):
-        return "adjective"
+def _clean_translation(out: Optional[str], src: str) -> Optional[str]:
+    out = (out or "").strip().strip('"').strip("'").strip()
+    if not out or out.lower() == src.lower():
+        return None
+    return out
 
+
+def _llm_translation_settings() -> Optional[tuple]:
+    """(provider, model, api_key, base_url) do LLM de tradução; OpenAI antes de DeepSeek."""
+    api_key = os.getenv("OPENAI_API_KEY")
+    if api_key:
+        return "openai", os.getenv("OPENAI_TRANSLATE_MODEL", "gpt-4o-mini"), api_key, None
+    api_key = os.getenv("DEEPSEEK_API_KEY")
+    if api_key:
+        return (
+            "deepseek",
+            os.getenv("DEEPSEEK_TRANSLATE_MODEL", "deepseek-chat"),
+            api_key,
+            "https://api.deepseek.com",
+        )
     return None
 
-    # Endpoint público e simples
-    url = (
-        "https://api.mymemory.translated.net/get?"
-        + "q="
-        + urllib.parse.quote(src)
-        + "&langpair=en|pt-br"
-    )
 
+async def _translate_mymemory_async(http: httpx.AsyncClient, src: str, langpair: str) -> Optional[str]:
     try:
-        resp = requests.get(url, timeout=10)
-        if resp.status_code != 200:
-            return None
-        data = resp.json()
-        translated = (
-            ((data or {}).get("responseData") or {}).get("translatedText") or ""
-        ).strip()
-        translated = translated.strip().strip('"').strip("'").strip()
-        if not translated:
-            return None
-        if translated.lower() == src.lower():
-            return None
-        return translated
+        resp = await get_with_limiter(
+            http,
+            MYMEMORY_API,
+            params={"q": src, "langpair": langpair},
+            max_attempts=MYMEMORY_MAX_ATTEMPTS,
+            backoff_base_s=0.5,
+            backoff_max_s=MYMEMORY_BACKOFF_MAX_S,
+        )
     except Exception:
         return None
+    if resp is None or resp.status_code != 200:
+        return None
+    try:
+        data = loads_json(resp.content)
+    except ValueError:
+        return None
+    return _clean_translation(((data or {}).get("responseData") or {}).get("translatedText"), src)
 
 
+async def _translate_async(client, settings, http: httpx.AsyncClient, direction: str, src: str) -> Optional[str]:
+    """Versão async de translate_en_to_pt_br/translate_pt_br_to_en (mesmos fallbacks)."""
+    system_prompt, langpair = _TRANSLATION_DIRECTIONS[direction]
+    if client is None or not _LLM_CIRCUITS[settings[0]].allow():
+        return await _translate_mymemory_async(http, src, langpair)
+
+    provider, model = settings[0], settings[1]
+    circuit = _LLM_CIRCUITS[provider]
+    try:
+        resp = await client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": src},
+            ],
+            temperature=0.2,
+            extra_headers=_idempotency_headers(model, system_prompt, src),
+        )
+        circuit.success()
+        return _clean_translation(resp.choices[0].message.content, src)
+    except Exception as e:
+        circuit.failure()
+        print(f"[WARN] Translation failed ({provider}): {e}")
+        return await _translate_mymemory_async(http, src, langpair)
+
+
+def _parse_batch_translations(content: Optional[str], texts: list) -> Optional[list]:
+    out = (content or "").strip()
+    if out.startswith("```"):
+        out = out.strip("`").strip()
+        if out.lower().startswith("json"):
+            out = out[4:]
+    try:
+        items = loads_json(out)
+    except ValueError:
+        return None
+    if not isinstance(items, list) or len(items) != len(texts):
+        return None
+    return [_clean_translation(item if isinstance(item, str) else None, src) for item, src in zip(items, texts)]
+
+
+async def _translate_batch_llm_async(client, settings, direction: str, texts: list) -> Optional[list]:
+    """Traduz `texts` numa única chamada ao LLM; None se a resposta não servir."""
+    provider, model = settings[0], settings[1]
+    circuit = _LLM_CIRCUITS[provider]
+    if not circuit.allow():
+        return None
+    numbered = "\n".join(f"{i}) {text}" for i, text in enumerate(texts, 1))
+    try:
+        resp = await client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": _BATCH_PROMPTS[direction]},
+                {"role": "user", "content": numbered},
+            ],
+            temperature=0.2,
+            extra_headers=_idempotency_headers(model, _BATCH_PROMPTS[direction], numbered),
+        )
+    except Exception as e:
+        circuit.failure()
+        print(f"[WARN] Batch translation failed ({provider}): {e}")
+        return None
+    circuit.success()
+    return _parse_batch_translations(resp.choices[0].message.content, texts)
+
+
+async def _translate_texts_async(jobs: list, concurrency: int) -> dict:
+    settings = _llm_translation_settings()
+    client = None
+    if settings is not None and AsyncOpenAI is not None:
+        client = AsyncOpenAI(api_key=settings[2], base_url=settings[3], max_retries=LLM_MAX_RETRIES)
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    results: dict = {}
+    async with httpx.AsyncClient(timeout=10.0) as http:
+
+        async def run(job):
+            async with semaphore:
+                results[job] = await _translate_async(client, settings, http, *job)
+
+        async def run_batch(direction, texts):
+            async with semaphore:
+                translated = await _translate_batch_llm_async(client, settings, direction, texts)
+            if translated is None:
+                # Resposta inválida: um a um (com fallback MyMemory)
+                await asyncio.gather(*(run((direction, text)) for text in texts))
+                return
+            results.update(((direction, text), out) for text, out in zip(texts, translated))
+
+        try:
+            if client is None:
+                await asyncio.gather(*(run(job) for job in jobs))
+            else:
+                batches = []
+                for direction in _TRANSLATION_DIRECTIONS:
+                    texts = [text for d, text in jobs if d == direction]
+                    for start in range(0, len(texts), TRANSLATE_BATCH_SIZE):
+                        batch = texts[start:start + TRANSLATE_BATCH_SIZE]
+                        batches.append(
+                            run_batch(direction, batch) if len(batch) > 1 else run((direction, batch[0]))
+                        )
+                await asyncio.gather(*batches)
+        finally:
+            if client is not None:
+                await client.close()
+    return results
+
+
+def translate_texts(jobs: Iterable[tuple], concurrency: int = 8) -> dict:
+    """Traduz vários textos em paralelo (asyncio.gather, até `concurrency` por vez).
+
+    `jobs` são pares (direção, texto) com direção "en-pt" ou "pt-en".
+    Retorna {(direção, texto): tradução ou None}. Usa o cache persistente
+    de traduções quando ligado.
+    """
+    results = {}
+    pending = []
+    for job in sorted({(direction, (text or "").strip()) for direction, text in jobs if (text or "").strip()}):
+        cached = _cached_translation(*job)
+        if cached is not None:
+            results[job] = cached
+        else:
+            pending.append(job)
+    if pending:
+        fetched = run_async(_translate_texts_async(pending, concurrency))
+        for job, out in fetched.items():
+            _store_translation(*job, out)
+        results.update(fetched)
+    return results
+
+
+def translate_en_to_pt_br_batch(texts: list, concurrency: int = 8) -> list:
+    """Traduz vários textos EN -> pt-BR (em lotes no LLM); mesma ordem de `texts`."""
+    translated = translate_texts((("en-pt", text) for text in texts), concurrency=concurrency)
+    return [translated.get(("en-pt", (text or "").strip())) for text in texts]
+
+
+# Tabela de enrich_words + nacionalidades/demônimos e adjetivos comuns
+SIMPLE_WORD_TYPE_SUFFIXES = {
+    **WORD_TYPE_SUFFIXES,
+    "adjective": WORD_TYPE_SUFFIXES["adjective"] + ("ian", "ean", "ese"),
+}
+_simple_word_type = make_suffix_classifier(SIMPLE_WORD_TYPE_SUFFIXES)
+
+
+@functools.lru_cache(maxsize=65536)
+def detect_word_type_simple(word: str) -> Optional[str]:
+    """Heurística simples para preencher word_type quando API falha."""
+    w = (word or "").strip()
+    if not w:
+        return None
+    return _simple_word_type(w)
+
+
+@functools.lru_cache(maxsize=65536)
 def is_headword_candidate_for_english_dictionary(text: str) -> bool:
     """Heurística conservadora para evitar chamadas inúteis à Free Dictionary API."""
     if not text:
         return False
     t = text.strip()
-    if not t:
-        return False
-
-    # Free Dictionary API trabalha bem com headwords simples; frases tendem a falhar.
-    if re.search(r"\s", t):
-        return False
-
-    # Evita textos em PT com diacríticos / notas.
-    if _HAS_NON_ASCII_RE.search(t):
-        return False
 
-    # Muito longo geralmente é nota ou frase colada.
-    if len(t) > 60:
+    # Vazio, muito longo (nota ou frase colada) ou texto em PT com diacríticos.
+    if not t or len(t) > 60 or not t.isascii():
         return False
 
-    # Evita tokens com parênteses, barras, pontuação etc (tendem a dar 404).
-    if not _HEADWORD_TOKEN_RE.match(t):
-        return False
+    # Caso comum: só letras.
+    if t.isalpha():
+        return True
 
-    return True
+    # Evita frases (tendem a falhar) e tokens com parênteses, barras,
+    # pontuação etc (tendem a dar 404): letra inicial + letras, ' e -.
+    return t[0].isalpha() and all(c.isalpha() or c in "'-" for c in t)
 
 
 def is_probably_rotated_import_row(word: Word) -> bool:
@@ -375,8 +812,13 @@ def is_probably_rotated_import_row(word: Word) -> bool:
     Melhor pular no enriquecimento (para não gerar 404) e tratar via scripts de correção.
     """
 
-    ipa = (word.ipa or "").strip()
-    pt = (word.portuguese or "").strip()
+    return _is_rotated(word.ipa or "", word.portuguese or "")
+
+
+@functools.lru_cache(maxsize=65536)
+def _is_rotated(ipa: str, pt: str) -> bool:
+    ipa = ipa.strip()
+    pt = pt.strip()
     if not ipa or not pt:
         return False
 
@@ -387,6 +829,143 @@ def is_probably_rotated_import_row(word: Word) -> bool:
     return False
 
 
+def needs_dictionary_api(word: Word) -> bool:
+    """Só chama a API quando realmente precisa de algo que ela pode fornecer.
+
+    (Exemplos/definições PT/notas podem ser preenchidos localmente.)
+    """
+    return (
+        not (word.word_type or "").strip()
+        or not (word.definition_en or "").strip()
+        or not (word.synonyms or "").strip()
+        or not (word.antonyms or "").strip()
+        or not (word.collocations or "").strip()
+        or not (word.ipa or "").strip()
+    )
+
+
+def _should_query_dictionary(word: Word) -> bool:
+    return (
+        not is_probably_rotated_import_row(word)
+        and is_headword_candidate_for_english_dictionary(word.english or "")
+        and needs_dictionary_api(word)
+    )
+
+
+# Campos copiados da API como estão, apenas quando vazios na palavra
+API_SCALAR_FIELDS = ("word_type", "definition_en", "synonyms", "antonyms", "ipa", "audio_url")
+
+
+def apply_api_fields(word: Word, api_data: dict) -> bool:
+    """Preenche os campos simples vazios com os dados da API; True se algo mudou.
+
+    Cada atributo é lido uma vez e só os campos alterados são atribuídos
+    (cada atribuição passa pelo rastreamento de mudanças do SQLAlchemy).
+    """
+    changes = {}
+    for field in API_SCALAR_FIELDS:
+        value = api_data.get(field)
+        if value and not getattr(word, field):
+            changes[field] = value
+    for field, value in changes.items():
+        setattr(word, field, value)
+    return bool(changes)
+
+
+def translation_jobs(word: Word, api_data: Optional[dict]) -> list:
+    """Prevê as traduções que enrich_all_words vai pedir para esta palavra.
+
+    Usado para buscá-las em paralelo antes de processar a página; uma previsão
+    errada só custa uma chamada a mais (o loop traduz na hora o que faltar).
+    """
+    if is_probably_rotated_import_row(word) or not is_headword_candidate_for_english_dictionary(word.english or ""):
+        return []
+
+    api_data = api_data or {}
+    jobs = []
+    example_en = word.example_en
+    if not word.example_sentences and api_data.get("example_sentences"):
+        examples = api_data["example_sentences"]
+        jobs.extend(("en-pt", ex.get("en")) for ex in examples[:3] if not ex.get("pt"))
+        example_en = example_en or examples[0].get("en")
+
+    definition_en = word.definition_en or api_data.get("definition_en")
+    if not word.definition_pt and (definition_en or "").strip():
+        jobs.append(("en-pt", definition_en))
+    elif not definition_en and (word.definition_pt or "").strip():
+        jobs.append(("pt-en", word.definition_pt))
+
+    if (example_en or "").strip() and not (word.example_pt or "").strip():
+        jobs.append(("en-pt", example_en))
+    elif (word.example_pt or "").strip() and not (example_en or "").strip():
+        jobs.append(("pt-en", word.example_pt))
+    return jobs
+
+
+# Colunas que enrich_all_words pode gravar
+WRITE_FIELDS = (
+    "word_type",
+    "definition_en",
+    "definition_pt",
+    "synonyms",
+    "antonyms",
+    "ipa",
+    "audio_url",
+    "example_sentences",
+    "example_en",
+    "example_pt",
+    "collocations",
+    "usage_notes",
+    "tags",
+    "dict_en_404",
+)
+
+
+# Colunas lidas por enrich_all_words (todas menos level)
+READ_COLUMNS = ("id", "english", "portuguese") + WRITE_FIELDS
+
+
+def _write_snapshot(word: Word) -> tuple:
+    return tuple(getattr(word, field) for field in WRITE_FIELDS)
+
+
+def changed_mappings(words: list, snapshots: list) -> list:
+    """Mapeamentos p/ bulk_update_mappings: id + só os campos que mudaram."""
+    mappings = []
+    for word, before in zip(words, snapshots):
+        changes = {
+            field: value
+            for field, old, value in zip(WRITE_FIELDS, before, _write_snapshot(word))
+            if value != old
+        }
+        if changes:
+            changes["id"] = word.id
+            mappings.append(changes)
+    return mappings
+
+
+def iter_word_pages(query, page_size: int, limit: Optional[int] = None):
+    """Percorre a query em páginas por id (keyset), sem carregar tudo na memória.
+
+    Diferente de yield_per/stream_results, continua válido com commits entre as
+    páginas (o cursor do servidor não sobrevive ao fim da transação).
+    """
+    last_id = None
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = page_size if remaining is None else min(page_size, remaining)
+        page_query = query.order_by(Word.id)
+        if last_id is not None:
+            page_query = page_query.filter(Word.id > last_id)
+        page = page_query.limit(size).all()
+        if not page:
+            return
+        last_id = page[-1].id
+        if remaining is not None:
+            remaining -= len(page)
+        yield page
+
+
 def enrich_all_words(
     db: Session,
     limit: int = None,
@@ -400,6 +979,9 @@ def enrich_all_words(
     tts_delay: float = 0.0,
     only_audio: bool = False,
     include_examples: bool = False,
+    concurrency: int = 8,
+    max_rate: float = 10.0,
+    verbose: bool = False,
 ):
     """
     Enriquece todas as palavras do banco usando APIs.
@@ -408,12 +990,20 @@ def enrich_all_words(
         db: Sessão do banco de dados
         limit: Limite de palavras a processar (None = todas)
         skip_existing: Se True, pula palavras já enriquecidas
-        delay: Delay entre requisições (rate limiting)
+        delay: Intervalo mínimo entre chamadas de TTS no modo only_audio
+            (rate limiting; as gerações de cada página rodam em paralelo)
+        concurrency: Palavras consultadas em paralelo nas APIs de dicionário
+            (e traduções em paralelo por página)
+        max_rate: Máximo de requisições/s às APIs de dicionário (a taxa
+            efetiva cai em 429/5xx e volta a subir, ao longo de toda a execução)
+        verbose: Uma linha por palavra; senão barra de progresso (tqdm, se
+            instalado) ou uma linha por página
     """
     print("🚀 Iniciando enriquecimento via API...\n")
 
-    # Construir query
-    query = db.query(Word)
+    # Construir query (só as colunas usadas; as linhas viram SimpleNamespace,
+    # sem objetos ORM na sessão)
+    query = db.query(*(getattr(Word, column) for column in READ_COLUMNS))
 
     if min_id is not None:
         query = query.filter(Word.id >= min_id)
@@ -426,15 +1016,8 @@ def enrich_all_words(
         # Pular palavras que já têm todos os campos de enriquecimento preenchidos.
         # Importante: mesmo que já tenha definição, pode estar faltando exemplos,
         # colocações, notas de uso, etc.
-        missing_filters = [
-            (Word.word_type == None) | (Word.word_type == ""),
-            (Word.definition_en == None) | (Word.definition_en == ""),
-            (Word.synonyms == None) | (Word.synonyms == ""),
-            (Word.antonyms == None) | (Word.antonyms == ""),
-            (Word.collocations == None) | (Word.collocations == ""),
-            (Word.usage_notes == None) | (Word.usage_notes == ""),
-            (Word.ipa == None) | (Word.ipa == ""),
-        ]
+        # Mesmo predicado do índice parcial ix_words_needs_enrichment.
+        missing_filters = missing_enrichment_filters()
 
         # Exemplos são preferencialmente preenchidos via generate_examples.py.
         if include_examples:
@@ -448,20 +1031,29 @@ def enrich_all_words(
         query = query.filter(or_(*missing_filters))
 
         # Evita ficar repetindo chamadas para headwords que já deram 404 no dicionário.
-        query = query.filter(func.coalesce(Word.tags, "").notlike("%dict_en_404%"))
+        query = query.filter(not_dict_404_filter())
 
-    if limit:
-        query = query.limit(limit)
+    # No PostgreSQL as entradas inválidas p/ o dicionário (frases, PT, notas)
+    # nem saem do banco (índice parcial ix_words_dictionary_candidates);
+    # nos demais bancos o loop continua descartando em Python.
+    if not only_audio and db.get_bind().dialect.name == "postgresql":
+        query = query.filter(headword_candidate_filter())
 
-    words = query.all()
-    total = len(words)
+    # COUNT direto (query.count() embrulharia a seleção de colunas numa subquery)
+    total = query.with_entities(func.count(Word.id)).scalar()
+    if limit:
+        total = min(total, limit)
 
     if total == 0:
         print("✅ Todas as palavras já estão enriquecidas!")
         return
 
     print(f"📊 Total de palavras a processar: {total}")
-    print(f"⏱️  Tempo estimado: ~{int(total * delay / 60)} minutos\n")
+    if only_audio:
+        print(f"⏱️  Tempo estimado: ~{int(total * delay / 60)} minutos\n")
+    else:
+        # ~2 requisições por palavra (dicionário + Datamuse), limitadas por max_rate
+        print(f"⏱️  Tempo estimado: ~{int(total * 2 / max(max_rate, 0.1) / 60)} minutos\n")
 
     success_count = 0
     error_count = 0
@@ -470,85 +1062,137 @@ def enrich_all_words(
     rotated_count = 0
     tts_generated_count = 0
 
-    for i, word in enumerate(words, 1):
-        print(f"[{i}/{total}] {word.english}...", end=" ")
+    # Palavras carregadas página a página (uma página por intervalo de commit).
+    # Os dados da API e as traduções de cada página são buscados em paralelo,
+    # numa thread de fundo e uma página à frente: enquanto a página N é
+    # processada, a N+1 já está sendo buscada. O processamento (e todo acesso
+    # ao banco) continua sequencial na thread principal. As palavras são
+    # objetos simples (sem autoflush/rastreamento do ORM) e as mudanças da
+    # página vão num único bulk_update_mappings antes do commit.
+    page_size = commit_every or 50
+    prefetched: dict = {}
+    translations: dict = {}
+    tts_urls: dict = {}
+    api_rate = AdaptiveRate(max_rate) if max_rate and max_rate > 0 else None
+
+    def fetch_page_data(page: list) -> tuple:
+        api_data = enrich_words_from_api(
+            [w.english for w in page if _should_query_dictionary(w)],
+            concurrency=concurrency,
+            max_rate=max_rate,
+            rate=api_rate,
+        )
+        page_translations = translate_texts(
+            (
+                job
+                for w in page
+                for job in translation_jobs(
+                    w, api_data.get(w.english) if needs_dictionary_api(w) else None
+                )
+            ),
+            concurrency=concurrency,
+        )
+        return api_data, page_translations
+
+    def iter_pages():
+        """(página, snapshots, future dos dados da API), com a próxima já em busca."""
+        with ThreadPoolExecutor(max_workers=1) as fetcher:
+            ahead = None
+            for rows in iter_word_pages(query, page_size, limit):
+                page = [SimpleNamespace(**row._asdict()) for row in rows]
+                future = None if only_audio else fetcher.submit(fetch_page_data, page)
+                if ahead is not None:
+                    yield ahead
+                ahead = (page, [_write_snapshot(w) for w in page], future)
+            if ahead is not None:
+                yield ahead
+            # Único worker: roda na mesma thread que usou o loop
+            fetcher.submit(close_thread_loop)
+
+    def iter_words():
+        nonlocal prefetched, translations, tts_urls
+        for page, snapshots, future in iter_pages():
+            if only_audio and tts_missing_audio:
+                tts_urls = generate_words_tts_audio_urls(
+                    db,
+                    [w for w in page if not (w.audio_url or "").strip()],
+                    voice=tts_voice,
+                    concurrency=concurrency,
+                    min_interval=delay,
+                    delay_after=tts_delay,
+                )
+            if future is not None:
+                prefetched, translations = future.result()
+            try:
+                yield from page
+            finally:
+                # Grava só o que mudou; também quando Ctrl-C/erro interrompe a página.
+                mappings = changed_mappings(page, snapshots)
+                if mappings:
+                    db.bulk_update_mappings(Word, mappings)
+                db.commit()
+            if only_audio:
+                note(f"💾 Salvando progresso... ({tts_generated_count} áudios TTS)")
+            else:
+                note(f"💾 Salvando progresso... ({success_count} atualizadas)")
+
+    progress = tqdm(total=total, unit="w") if (tqdm is not None and not verbose) else None
+
+    def word_status(i: int, word: Word, status: str) -> None:
+        if verbose:
+            print(f"[{i}/{total}] {word.english}... {status}")
+
+    def note(message: str) -> None:
+        (progress.write if progress is not None else print)(message)
+
+    def to_pt(text: str) -> Optional[str]:
+        key = ("en-pt", (text or "").strip())
+        return translations[key] if key in translations else translate_en_to_pt_br(text)
+
+    def to_en(text: str) -> Optional[str]:
+        key = ("pt-en", (text or "").strip())
+        return translations[key] if key in translations else translate_pt_br_to_en(text)
+
+    for i, word in enumerate(iter_words(), 1):
+        if progress is not None:
+            progress.update(1)
+            progress.set_postfix(ok=success_count, fail=error_count, refresh=False)
+        elif not verbose and i % page_size == 0:
+            print(f"⏳ Processadas: {i}/{total}")
 
         if only_audio:
-            url = None
-            if tts_missing_audio and not (word.audio_url or "").strip():
-                url = maybe_generate_word_tts_audio_url(db, word, voice=tts_voice)
+            url = tts_urls.get(word.id)
             if url:
                 word.audio_url = url
                 tts_generated_count += 1
-                print("✓")
-                if tts_delay:
-                    sleep(tts_delay)
+                word_status(i, word, "✓")
             else:
-                print("⊘")
-
-            if commit_every and i % commit_every == 0:
-                db.commit()
-                print(f"\n💾 Salvando progresso... ({tts_generated_count} áudios TTS)\n")
-
-            sleep(delay)
+                word_status(i, word, "⊘")
             continue
 
         if is_probably_rotated_import_row(word):
-            print("⊘ (registro rotacionado/duplicado - revisar)")
+            word_status(i, word, "⊘ (registro rotacionado/duplicado - revisar)")
             rotated_count += 1
-            sleep(delay)
             continue
 
         if not is_headword_candidate_for_english_dictionary(word.english or ""):
-            print("⊘ (entrada inválida p/ dicionário EN)")
+            word_status(i, word, "⊘ (entrada inválida p/ dicionário EN)")
             invalid_count += 1
-            sleep(delay)
             continue
 
         updated = False
         api_tried = False
         api_data = None
 
-        # Só chama a API quando realmente precisa de algo que ela pode fornecer.
-        # (Exemplos/definições PT/notas podem ser preenchidos localmente.)
-        needs_api = (
-            not (word.word_type or "").strip()
-            or not (word.definition_en or "").strip()
-            or not (word.synonyms or "").strip()
-            or not (word.antonyms or "").strip()
-            or not (word.collocations or "").strip()
-            or not (word.ipa or "").strip()
-        )
-
-        if needs_api:
+        # Fora de `prefetched` = consulta falhou (429/5xx/rede): não marca 404,
+        # tenta de novo na próxima execução.
+        if needs_dictionary_api(word) and word.english in prefetched:
             api_tried = True
-            api_data = enrich_word_from_api(word.english)
+            api_data = prefetched[word.english]
 
         if api_data:
             # Atualizar palavra com dados da API
-
-            if (not word.word_type) and api_data.get("word_type"):
-                word.word_type = api_data["word_type"]
-                updated = True
-
-            if (not word.definition_en) and api_data.get("definition_en"):
-                word.definition_en = api_data["definition_en"]
-                updated = True
-
-            if (not word.synonyms) and api_data.get("synonyms"):
-                word.synonyms = api_data["synonyms"]
-                updated = True
-
-            if (not word.antonyms) and api_data.get("antonyms"):
-                word.antonyms = api_data["antonyms"]
-                updated = True
-
-            if api_data.get("ipa") and not word.ipa:
-                word.ipa = api_data["ipa"]
-                updated = True
-
-            if api_data.get("audio_url") and not word.audio_url:
-                word.audio_url = api_data["audio_url"]
+            if apply_api_fields(word, api_data):
                 updated = True
 
             # Exemplos
@@ -559,11 +1203,11 @@ def enrich_all_words(
                     # Mantém fallback simples caso não haja chave/configuração.
                     for ex in examples[:3]:
                         if not ex.get("pt"):
-                            translated = translate_en_to_pt_br(ex.get("en") or "")
+                            translated = to_pt(ex.get("en") or "")
                             if translated:
                                 ex["pt"] = translated
 
-                    word.example_sentences = json.dumps(examples)
+                    word.example_sentences = dumps_json_text(examples)
                     updated = True
 
                     # Preencher campos simples usados no frontend (fallback do example_sentences)
@@ -576,7 +1220,7 @@ def enrich_all_words(
 
             # Colocações
             if (not word.collocations) and api_data.get("collocations"):
-                word.collocations = json.dumps(api_data["collocations"])
+                word.collocations = dumps_json_text(api_data["collocations"])
                 updated = True
 
             # Gerar notas de uso
@@ -591,14 +1235,14 @@ def enrich_all_words(
 
         # Definição em PT (traduz definição EN quando faltar)
         if (not word.definition_pt) and (word.definition_en or "").strip():
-            pt = translate_en_to_pt_br(word.definition_en or "")
+            pt = to_pt(word.definition_en or "")
             if pt:
                 word.definition_pt = pt
                 updated = True
 
         # Definição em EN (fallback: traduz PT->EN quando faltar)
         if (not word.definition_en) and (word.definition_pt or "").strip():
-            en = translate_pt_br_to_en(word.definition_pt or "")
+            en = to_en(word.definition_pt or "")
             if en:
                 word.definition_en = en
                 updated = True
@@ -617,38 +1261,31 @@ def enrich_all_words(
 
         # Exemplo simples: se existir um lado, tenta traduzir o outro
         if (word.example_en or "").strip() and not (word.example_pt or "").strip():
-            pt_ex = translate_en_to_pt_br(word.example_en or "")
+            pt_ex = to_pt(word.example_en or "")
             if pt_ex:
                 word.example_pt = pt_ex
                 updated = True
         if (word.example_pt or "").strip() and not (word.example_en or "").strip():
-            en_ex = translate_pt_br_to_en(word.example_pt or "")
+            en_ex = to_en(word.example_pt or "")
             if en_ex:
                 word.example_en = en_ex
                 updated = True
 
         # Se tentou API e não achou, marca 404 para não insistir.
         if api_tried and not api_data:
-            tags = (word.tags or "").strip()
-            if "dict_en_404" not in tags:
-                word.tags = (tags + "," if tags else "") + "dict_en_404"
+            word.dict_en_404 = True
             error_count += 1
 
         if updated:
-            print("✓")
+            word_status(i, word, "✓")
             success_count += 1
         else:
             if api_tried and not api_data:
-                print("✗ (não encontrada)")
+                word_status(i, word, "✗ (não encontrada)")
             else:
-                print("⊘ (sem novos dados)")
+                word_status(i, word, "⊘ (sem novos dados)")
             skipped_count += 1
 
-        # Commit a cada N palavras
-        if commit_every and i % commit_every == 0:
-            db.commit()
-            print(f"\n💾 Salvando progresso... ({success_count} atualizadas)\n")
-
         # TTS fallback: gerar áudio local se ainda não tiver audio_url
         if tts_missing_audio and not (word.audio_url or "").strip():
             url = maybe_generate_word_tts_audio_url(db, word, voice=tts_voice)
@@ -658,11 +1295,10 @@ def enrich_all_words(
                 if tts_delay:
                     sleep(tts_delay)
 
-        # Rate limiting
-        sleep(delay)
-
     # Commit final
     db.commit()
+    if progress is not None:
+        progress.close()
 
     print("\n" + "=" * 50)
     print("✅ ENRIQUECIMENTO CONCLUÍDO!\n")
@@ -676,54 +1312,47 @@ def enrich_all_words(
     print("=" * 50)
 
 
+# Traduções comuns (usadas por translate_example)
+_COMMON_TRANSLATIONS = {
+    "I": "Eu",
+    "you": "você",
+    "he": "ele",
+    "she": "ela",
+    "we": "nós",
+    "they": "eles/elas",
+    "am": "sou",
+    "is": "é/está",
+    "are": "são/estão",
+    "was": "era/estava",
+    "were": "eram/estavam",
+    "have": "tenho",
+    "has": "tem",
+    "do": "faço",
+    "does": "faz",
+    "did": "fiz/fez",
+    "can": "posso/pode",
+    "will": "vou/vai",
+    "every day": "todos os dias",
+    "today": "hoje",
+    "yesterday": "ontem",
+    "a": "um/uma",
+    "the": "o/a",
+    "very": "muito",
+}
+
+
 def translate_example(english_example: str, target_word_pt: str) -> str:
     """
     Tradução básica de exemplos.
     Substitui a palavra principal e mantém estrutura simples.
     """
-    # Traduções comuns
-    common_translations = {
-        "I": "Eu",
-        "you": "você",
-        "he": "ele",
-        "she": "ela",
-        "we": "nós",
-        "they": "eles/elas",
-        "am": "sou",
-        "is": "é/está",
-        "are": "são/estão",
-        "was": "era/estava",
-        "were": "eram/estavam",
-        "have": "tenho",
-        "has": "tem",
-        "do": "faço",
-        "does": "faz",
-        "did": "fiz/fez",
-        "can": "posso/pode",
-        "will": "vou/vai",
-        "every day": "todos os dias",
-        "today": "hoje",
-        "yesterday": "ontem",
-        "a": "um/uma",
-        "the": "o/a",
-        "very": "muito",
-    }
-
-    # Tradução palavra por palavra (limitada)
-    words = english_example.lower().split()
-    translated = []
-
-    for word in words:
-        clean_word = word.strip(".,!?")
-        if clean_word in common_translations:
-            translated.append(common_translations[clean_word])
-        else:
-            # Manter original entre colchetes
-            translated.append(f"[{word}]")
-
-    # Retornar tradução simplificada
+    # Tradução palavra por palavra (limitada); desconhecidas ficam entre colchetes.
     # (Idealmente, usar uma API de tradução real aqui)
-    return " ".join(translated)
+    lookup = _COMMON_TRANSLATIONS.get
+    return " ".join(
+        lookup(word.strip(".,!?")) or f"[{word}]"
+        for word in english_example.lower().split()
+    )
 
 
 def generate_usage_notes(word: str, word_type: str) -> str:
@@ -746,14 +1375,27 @@ def enrich_specific_words(
     tts_missing_audio: bool = False,
     tts_voice: str = "nova",
     tts_delay: float = 0.0,
+    concurrency: int = 8,
 ):
     """Enriquece apenas uma lista específica de palavras."""
     print(f"🎯 Enriquecendo {len(words_list)} palavras específicas...\n")
 
-    for word_str in words_list:
-        word = db.query(Word).filter(
-            func.lower(Word.english) == word_str.lower()
-        ).first()
+    # Uma única consulta para todas as palavras (usa ix_words_lower_english)
+    lowered = [w.lower() for w in words_list]
+    by_lower: dict = {}
+    for row in db.query(Word).filter(func.lower(Word.english).in_(set(lowered))):
+        by_lower.setdefault(row.english.lower(), row)
+
+    # Consultas à API em paralelo (I/O; requests libera o GIL). 429/5xx já têm
+    # retry com backoff no cliente. As gravações seguem na thread principal.
+    lems = [lem for lem in dict.fromkeys(lowered) if lem in by_lower]
+    api_results: dict = {}
+    if lems:
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(lems)))) as pool:
+            api_results = dict(zip(lems, pool.map(enrich_word_from_api, lems)))
+
+    for word_str, lem in zip(words_list, lowered):
+        word = by_lower.get(lem)
 
         if not word:
             print(f"⚠️  Palavra '{word_str}' não encontrada no banco")
@@ -761,31 +1403,15 @@ def enrich_specific_words(
 
         print(f"📖 {word.english}...", end=" ")
 
-        api_data = enrich_word_from_api(word.english.lower())
+        api_data = api_results.get(lem)
 
         updated = False
 
         if api_data:
-            if (not word.definition_en) and api_data.get("definition_en"):
-                word.definition_en = api_data["definition_en"]
-                updated = True
-            if (not word.word_type) and api_data.get("word_type"):
-                word.word_type = api_data["word_type"]
-                updated = True
-            if (not word.synonyms) and api_data.get("synonyms"):
-                word.synonyms = api_data["synonyms"]
-                updated = True
-            if (not word.antonyms) and api_data.get("antonyms"):
-                word.antonyms = api_data["antonyms"]
-                updated = True
-            if (not word.ipa) and api_data.get("ipa"):
-                word.ipa = api_data["ipa"]
-                updated = True
-            if (not word.audio_url) and api_data.get("audio_url"):
-                word.audio_url = api_data["audio_url"]
+            if apply_api_fields(word, api_data):
                 updated = True
             if (not word.collocations) and api_data.get("collocations"):
-                word.collocations = json.dumps(api_data["collocations"])
+                word.collocations = dumps_json_text(api_data["collocations"])
                 updated = True
             if (not word.example_sentences) and api_data.get("example_sentences"):
                 examples = api_data["example_sentences"]
@@ -794,7 +1420,7 @@ def enrich_specific_words(
                         translated = translate_en_to_pt_br(ex.get("en") or "")
                         if translated:
                             ex["pt"] = translated
-                word.example_sentences = json.dumps(examples)
+                word.example_sentences = dumps_json_text(examples)
                 updated = True
                 if (not word.example_en) and examples and examples[0].get("en"):
                     word.example_en = examples[0]["en"]
@@ -844,8 +1470,6 @@ def enrich_specific_words(
 
         print("✓" if updated else "⊘ (sem novos dados)")
 
-        sleep(0.3)
-
     db.commit()
     print("\n✅ Palavras específicas enriquecidas!")
 
@@ -869,7 +1493,35 @@ def main():
             "--delay",
             type=float,
             default=0.3,
-            help="Delay entre requisições (rate limiting). Default: 0.3"
+            help="Intervalo mínimo (s) entre chamadas de TTS no modo --only-audio. Default: 0.3"
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=8,
+            help="Palavras consultadas em paralelo nas APIs (e áudios TTS gerados em paralelo). Default: 8"
+        )
+        parser.add_argument(
+            "--max-rate",
+            type=float,
+            default=10.0,
+            help="Máximo de requisições/s às APIs de dicionário. Default: 10"
+        )
+        parser.add_argument(
+            "--verbose",
+            action="store_true",
+            help="Mostrar uma linha por palavra (padrão: barra de progresso)"
+        )
+        parser.add_argument(
+            "--api-cache",
+            type=str,
+            default=None,
+            help="Arquivo SQLite do cache de respostas das APIs e traduções. Default: $DICT_API_CACHE_PATH ou ~/.cache/idiomabr_dict.sqlite"
+        )
+        parser.add_argument(
+            "--no-api-cache",
+            action="store_true",
+            help="Não usar o cache persistente (sempre consultar as APIs e tradutores)"
         )
         parser.add_argument(
             "--commit-every",
@@ -928,6 +1580,10 @@ def main():
 
         args = parser.parse_args()
 
+        if not args.no_api_cache:
+            # Mesmo arquivo para respostas das APIs e traduções
+            enable_translation_cache(enable_disk_cache(args.api_cache))
+
         if args.words:
             # Modo específico
             enrich_specific_words(
@@ -936,6 +1592,7 @@ def main():
                 tts_missing_audio=args.tts_missing_audio,
                 tts_voice=args.tts_voice,
                 tts_delay=args.tts_delay,
+                concurrency=args.concurrency,
             )
         else:
             # Modo em massa
@@ -952,6 +1609,9 @@ def main():
                 tts_delay=args.tts_delay,
                 only_audio=args.only_audio,
                 include_examples=args.include_examples,
+                concurrency=args.concurrency,
+                max_rate=args.max_rate,
+                verbose=args.verbose,
             )
 
     except KeyboardInterrupt:
@@ -964,6 +1624,7 @@ def main():
         db.rollback()
     finally:
         db.close()
+        close_thread_loop()
 
 
 if __name__ == "__main__":
@@ -3,9 +3,11 @@
 """
 Script para corrigir traduções usando APIs de dicionário
 """
+import asyncio
+import httpx
 import psycopg2
+import psycopg2.extras
 import requests
-import time
 import json
 from typing import Optional, Dict, List
 import sys
@@ -17,6 +19,10 @@ if sys.platform == 'win32':
 
 # Configurações do banco de dados
 import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.dictionary_api import AsyncRateLimiter, get_with_limiter
+
 DB_CONFIG = {
     'host': os.getenv('DB_HOST', 'postgres'),  # 'postgres' é o nome do serviço no Docker Compose
     'port': os.getenv('DB_PORT', 5432),        # Porta interna do Docker
@@ -29,14 +35,25 @@ DB_CONFIG = {
 MYMEMORY_API = "https://api.mymemory.translated.net/get"
 FREE_DICT_API = "https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
 
-def get_translation_mymemory(word: str) -> Optional[str]:
+# Requisições simultâneas ao MyMemory (antes: uma por vez + sleep)
+HTTP_CONCURRENCY = 10
+# Teto de requisições/s ao MyMemory; a taxa real cai em 429/5xx e volta a subir
+MYMEMORY_MAX_RATE = 10.0
+# Linhas por execute_batch/commit (antes: um UPDATE + commit por palavra)
+DB_BATCH_SIZE = 500
+
+async def fetch_translation(
+    client: httpx.AsyncClient, word: str, limiter: Optional[AsyncRateLimiter] = None
+) -> Optional[str]:
     """Busca tradução usando MyMemory API"""
     try:
         params = {
             'q': word,
             'langpair': 'en|pt-br'
         }
-        response = requests.get(MYMEMORY_API, params=params, timeout=10)
+        response = await get_with_limiter(client, MYMEMORY_API, params=params, limiter=limiter)
+        if response is None:
+            return None
         data = response.json()
 
         if data.get('responseStatus') == 200:
@@ -72,29 +89,44 @@ def get_definition_freedict(word: str) -> Optional[Dict]:
         print(f"  [WARN] Erro FreeDictionary para '{word}': {e}")
         return None
 
-def get_best_translation(word: str, current_translation: str) -> Optional[str]:
+async def fetch_translations(
+    words: List[str],
+    *,
+    concurrency: int = HTTP_CONCURRENCY,
+    max_rate: float = MYMEMORY_MAX_RATE,
+) -> List[Optional[str]]:
     """
-    Tenta obter a melhor tradução de múltiplas fontes
+    Busca traduções em paralelo (no máximo `concurrency` por vez, até
+    `max_rate` requisições/s). Retorna na mesma ordem de `words`; None
+    quando não encontrou.
     """
-    print(f"\n[SEARCH] Buscando traducao para: '{word}' (atual: '{current_translation}')")
-
-    # 1. Tenta MyMemory primeiro (tradução direta)
-    translation = get_translation_mymemory(word)
-    if translation and len(translation) > 0:
-        print(f"  [OK] MyMemory: {translation}")
-        time.sleep(0.5)  # Rate limiting
-        return translation
-
-    # 2. Tenta Free Dictionary (definição em inglês - não traduz)
-    # dict_data = get_definition_freedict(word)
-    # if dict_data:
-    #     print(f"  [INFO] FreeDictionary: {dict_data['meanings'][0][:100]}...")
-    #     # Não retorna definição em inglês, apenas para referência
-
-    time.sleep(0.5)  # Rate limiting
-    return None
-
-def fix_translations():
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    limiter = AsyncRateLimiter(max_rate)
+    limits = httpx.Limits(max_connections=max(1, concurrency))
+
+    async with httpx.AsyncClient(timeout=10.0, limits=limits) as client:
+        async def one(word: str) -> Optional[str]:
+            async with semaphore:
+                translation = await fetch_translation(client, word, limiter)
+                return translation or None
+
+        return await asyncio.gather(*(one(word) for word in words))
+
+def flush_translations(conn, cursor, pending: List[tuple]) -> None:
+    """Grava (portuguese, id) pendentes numa transação só e esvazia a lista."""
+    if not pending:
+        return
+    psycopg2.extras.execute_batch(
+        cursor,
+        "UPDATE words SET portuguese = %s WHERE id = %s",
+        pending,
+        page_size=DB_BATCH_SIZE,
+    )
+    conn.commit()
+    print(f"\n[FLUSH] {len(pending)} traducoes gravadas no banco")
+    pending.clear()
+
+def fix_translations(*, concurrency: int = HTTP_CONCURRENCY):
     """Corrige traduções no banco de dados"""
     conn = None
     try:
@@ -119,26 +151,29 @@ def fix_translations():
         entries = cursor.fetchall()
         print(f"[OK] Encontradas {len(entries)} entradas para corrigir\n")
 
+        # Rede em paralelo; escrita no banco continua sequencial abaixo
+        print(f"[FETCH] Buscando traducoes ({concurrency} em paralelo)...")
+        translations = asyncio.run(
+            fetch_translations([english for _, english, _, _ in entries], concurrency=concurrency)
+        )
+
         # Estatísticas
         updated = 0
         failed = 0
         skipped = 0
+        pending: List[tuple] = []
 
         # Processa cada entrada
-        for idx, (word_id, english, ipa, portuguese) in enumerate(entries, 1):
-            print(f"\n[{idx}/{len(entries)}] ID {word_id}: {english}")
-
-            # Busca tradução correta
-            new_translation = get_best_translation(english, portuguese)
+        for idx, ((word_id, english, ipa, portuguese), new_translation) in enumerate(zip(entries, translations), 1):
+            print(f"\n[{idx}/{len(entries)}] ID {word_id}: {english} (atual: '{portuguese}')")
+            if new_translation:
+                print(f"  [OK] MyMemory: {new_translation}")
 
             if new_translation and new_translation != portuguese:
-                # Atualiza no banco
-                cursor.execute("""
-                    UPDATE words
-                    SET portuguese = %s
-                    WHERE id = %s
-                """, (new_translation, word_id))
-                conn.commit()
+                # Atualiza no banco (em lote)
+                pending.append((new_translation, word_id))
+                if len(pending) >= DB_BATCH_SIZE:
+                    flush_translations(conn, cursor, pending)
 
                 print(f"  [UPDATE] ATUALIZADO: '{portuguese}' -> '{new_translation}'")
                 updated += 1
@@ -149,13 +184,12 @@ def fix_translations():
                 print(f"  [FAIL] FALHOU: Nao encontrou traducao para '{english}'")
                 failed += 1
 
-            # Rate limiting (máximo 10 requisições/segundo)
-            time.sleep(0.2)
-
             # Checkpoint a cada 20 palavras
             if idx % 20 == 0:
                 print(f"\n[CHECKPOINT] {updated} atualizadas, {failed} falhas, {skipped} mantidas")
 
+        flush_translations(conn, cursor, pending)
+
         # Resumo final
         print("\n" + "="*60)
         print("[SUMMARY] RESUMO FINAL:")
@@ -3,11 +3,12 @@
 """
 Script para gerar exemplos de frases em contexto usando APIs
 """
+import asyncio
+import httpx
 import psycopg2
-import requests
-import time
+import psycopg2.extras
 import json
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, List, Tuple
 import sys
 import io
 import argparse
@@ -18,6 +19,10 @@ if sys.platform == 'win32':
 
 # Configurações do banco de dados
 import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.dictionary_api import AsyncRateLimiter, get_with_limiter
+
 DB_CONFIG = {
     'host': os.getenv('DB_HOST', 'postgres'),
     'port': os.getenv('DB_PORT', 5432),
@@ -29,15 +34,40 @@ DB_CONFIG = {
 # API gratuita para exemplos de frases
 FREE_DICT_API = "https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
 TATOEBA_API = "https://tatoeba.org/en/api_v0/search?from=eng&to=por&query={word}"
+MYMEMORY_API = "https://api.mymemory.translated.net/get"
+
+# Palavras buscadas ao mesmo tempo (antes: uma por vez + sleep)
+HTTP_CONCURRENCY = 10
+# Teto de requisições/s por host; a taxa real cai em 429/5xx e volta a subir
+MAX_RATE_PER_HOST = 10.0
+# Linhas por lote/commit (antes: um UPDATE + commit por palavra)
+DB_BATCH_SIZE = 500
+
+# Só preenche example_sentences se ainda estiver vazio
+UPDATE_EXAMPLES_SQL = """
+    UPDATE words AS w
+    SET example_en = v.en,
+        example_pt = v.pt,
+        example_sentences = CASE
+            WHEN (w.example_sentences IS NULL OR w.example_sentences = '') THEN v.js
+            ELSE w.example_sentences
+        END
+    FROM (VALUES %s) AS v(id, en, pt, js)
+    WHERE w.id = v.id
+"""
 
-def get_example_from_freedict(word: str) -> Optional[Tuple[str, str]]:
+async def fetch_freedict(
+    client: httpx.AsyncClient, word: str, limiter: Optional[AsyncRateLimiter] = None
+) -> Optional[Tuple[str, str]]:
     """
     Busca exemplo de frase do Free Dictionary API
     Returns: (example_en, definition) ou None
     """
     try:
         url = FREE_DICT_API.format(word=word)
-        response = requests.get(url, timeout=10)
+        response = await get_with_limiter(client, url, limiter=limiter)
+        if response is None:
+            return None
 
         if response.status_code == 200:
             data = response.json()
@@ -54,17 +84,20 @@ def get_example_from_freedict(word: str) -> Optional[Tuple[str, str]]:
         print(f"  [WARN] Erro FreeDictionary para '{word}': {e}")
         return None
 
-def translate_sentence(text: str) -> Optional[str]:
+async def translate_sentence(
+    client: httpx.AsyncClient, text: str, limiter: Optional[AsyncRateLimiter] = None
+) -> Optional[str]:
     """
     Traduz frase usando MyMemory Translation API
     """
     try:
-        url = "https://api.mymemory.translated.net/get"
         params = {
             'q': text,
             'langpair': 'en|pt-br'
         }
-        response = requests.get(url, params=params, timeout=10)
+        response = await get_with_limiter(client, MYMEMORY_API, params=params, limiter=limiter)
+        if response is None:
+            return None
         data = response.json()
 
         if data.get('responseStatus') == 200:
@@ -77,7 +110,12 @@ def translate_sentence(text: str) -> Optional[str]:
         print(f"  [WARN] Erro tradução: {e}")
         return None
 
-def generate_smart_example(word: str, word_type: str = 'unknown') -> Tuple[Optional[str], Optional[str]]:
+async def generate_smart_example(
+    client: httpx.AsyncClient,
+    word: str,
+    word_type: str = 'unknown',
+    limiter: Optional[AsyncRateLimiter] = None,
+) -> Tuple[Optional[str], Optional[str]]:
     """
     Gera exemplo inteligente baseado no tipo de palavra
     Returns: (example_en, example_pt)
@@ -117,7 +155,7 @@ def generate_smart_example(word: str, word_type: str = 'unknown') -> Tuple[Optio
     example_en = template_list[0]
 
     # Traduz (pode falhar; ainda assim mantém example_en)
-    example_pt = translate_sentence(example_en)
+    example_pt = await translate_sentence(client, example_en, limiter)
 
     return (example_en, example_pt)
 
@@ -160,7 +198,100 @@ def detect_word_type(word: str, definition: str = '') -> str:
 
     return 'unknown'
 
-def populate_examples(*, limit: int = 100, min_id: int | None = None, max_id: int | None = None, delay_s: float = 0.5):
+async def build_example(
+    client: httpx.AsyncClient,
+    word: str,
+    limiters: Optional[Dict[str, AsyncRateLimiter]] = None,
+) -> Tuple[Optional[str], Optional[str], List[str]]:
+    """
+    Busca/gera o exemplo de uma palavra (só rede, sem banco).
+    `limiters`: {'freedict': ..., 'mymemory': ...}, um por host.
+    Returns: (example_en, example_pt, linhas de log para imprimir na ordem)
+    """
+    limiters = limiters or {}
+    mymemory = limiters.get('mymemory')
+    log = []
+
+    # Tenta buscar exemplo real primeiro
+    result = await fetch_freedict(client, word, limiters.get('freedict'))
+
+    if result:
+        example_en, definition = result
+        word_type = detect_word_type(word, definition)
+        log.append(f"  [INFO] Tipo detectado: {word_type}")
+        log.append(f"  [OK] Exemplo encontrado: {example_en[:60]}...")
+
+        # Traduz exemplo
+        example_pt = await translate_sentence(client, example_en, mymemory)
+
+        if example_pt:
+            log.append(f"  [OK] Traducao: {example_pt[:60]}...")
+        else:
+            log.append(f"  [WARN] Falha na traducao, gerando exemplo simples...")
+            example_en, example_pt = await generate_smart_example(client, word, word_type, mymemory)
+    else:
+        # Gera exemplo inteligente
+        log.append(f"  [INFO] Nao encontrou exemplo real, gerando...")
+        word_type = detect_word_type(word)
+        example_en, example_pt = await generate_smart_example(client, word, word_type, mymemory)
+        log.append(f"  [OK] Exemplo gerado: {example_en}")
+
+    return (example_en, example_pt, log)
+
+async def fetch_examples(
+    words: List[str],
+    *,
+    concurrency: int = HTTP_CONCURRENCY,
+    max_rate: float = MAX_RATE_PER_HOST,
+) -> List[Tuple[Optional[str], Optional[str], List[str]]]:
+    """
+    Roda build_example em paralelo (no máximo `concurrency` palavras por vez,
+    até `max_rate` requisições/s em cada API). Retorna na mesma ordem de `words`.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    limiters = {
+        'freedict': AsyncRateLimiter(max_rate),
+        'mymemory': AsyncRateLimiter(max_rate),
+    }
+    limits = httpx.Limits(max_connections=max(1, concurrency) * 2)
+
+    async with httpx.AsyncClient(timeout=10.0, limits=limits) as client:
+        async def one(word: str):
+            async with semaphore:
+                return await build_example(client, word, limiters)
+
+        return await asyncio.gather(*(one(word) for word in words))
+
+def flush_examples(conn, cursor, pending_examples: List[tuple], pending_sentences: List[tuple]) -> None:
+    """
+    Grava os lotes pendentes numa transação só e esvazia as listas.
+    pending_examples: (id, example_en, example_pt, example_sentences)
+    pending_sentences: (example_sentences, id)
+    """
+    if not pending_examples and not pending_sentences:
+        return
+    if pending_examples:
+        psycopg2.extras.execute_values(cursor, UPDATE_EXAMPLES_SQL, pending_examples, page_size=DB_BATCH_SIZE)
+    if pending_sentences:
+        psycopg2.extras.execute_batch(
+            cursor,
+            "UPDATE words SET example_sentences = %s WHERE id = %s",
+            pending_sentences,
+            page_size=DB_BATCH_SIZE,
+        )
+    conn.commit()
+    print(f"\n[FLUSH] {len(pending_examples) + len(pending_sentences)} palavras gravadas no banco")
+    pending_examples.clear()
+    pending_sentences.clear()
+
+def populate_examples(
+    *,
+    limit: int = 100,
+    min_id: int | None = None,
+    max_id: int | None = None,
+    max_rate: float = MAX_RATE_PER_HOST,
+    concurrency: int = HTTP_CONCURRENCY,
+):
     """
     Popula exemplos no banco de dados
     """
@@ -197,10 +328,30 @@ def populate_examples(*, limit: int = 100, min_id: int | None = None, max_id: in
         words = cursor.fetchall()
         print(f"[OK] Encontradas {len(words)} palavras para processar\n")
 
+        # Rede em paralelo só para quem não tem example_en; o banco é
+        # atualizado sequencialmente no loop abaixo.
+        to_fetch = [
+            (word_id, english)
+            for word_id, english, existing_example_en, _, _ in words
+            if not (existing_example_en or "").strip()
+        ]
+        fetched = {}
+        if to_fetch:
+            print(f"[FETCH] Buscando exemplos de {len(to_fetch)} palavras ({concurrency} em paralelo)...")
+            results = asyncio.run(
+                fetch_examples([english for _, english in to_fetch], concurrency=concurrency, max_rate=max_rate)
+            )
+            fetched = dict(zip((word_id for word_id, _ in to_fetch), results))
+
         updated = 0
         failed = 0
+        pending_examples: List[tuple] = []
+        pending_sentences: List[tuple] = []
 
         for idx, (word_id, english, existing_example_en, existing_example_pt, existing_example_sentences) in enumerate(words, 1):
+            if len(pending_examples) + len(pending_sentences) >= DB_BATCH_SIZE:
+                flush_examples(conn, cursor, pending_examples, pending_sentences)
+
             print(f"\n[{idx}/{len(words)}] Processando: {english}")
 
             # Caso simples: já tem example_en, mas falta o JSON example_sentences
@@ -210,69 +361,33 @@ def populate_examples(*, limit: int = 100, min_id: int | None = None, max_id: in
                 example_sentences = json.dumps([
                     {"en": example_en, "pt": example_pt}
                 ])
-                cursor.execute(
-                    "UPDATE words SET example_sentences = %s WHERE id = %s",
-                    (example_sentences, word_id),
-                )
-                conn.commit()
+                pending_sentences.append((example_sentences, word_id))
                 print("  [UPDATE] Preenchido example_sentences a partir do exemplo existente")
                 updated += 1
-                time.sleep(float(delay_s))
                 continue
 
-            # Tenta buscar exemplo real primeiro
-            result = get_example_from_freedict(english)
-
-            if result:
-                example_en, definition = result
-                word_type = detect_word_type(english, definition)
-                print(f"  [INFO] Tipo detectado: {word_type}")
-                print(f"  [OK] Exemplo encontrado: {example_en[:60]}...")
-
-                # Traduz exemplo
-                example_pt = translate_sentence(example_en)
-
-                if example_pt:
-                    print(f"  [OK] Traducao: {example_pt[:60]}...")
-                else:
-                    print(f"  [WARN] Falha na traducao, gerando exemplo simples...")
-                    example_en, example_pt = generate_smart_example(english, word_type)
-            else:
-                # Gera exemplo inteligente
-                print(f"  [INFO] Nao encontrou exemplo real, gerando...")
-                word_type = detect_word_type(english)
-                example_en, example_pt = generate_smart_example(english, word_type)
-                print(f"  [OK] Exemplo gerado: {example_en}")
+            example_en, example_pt, log = fetched[word_id]
+            for line in log:
+                print(line)
 
             # Atualiza banco (salva EN mesmo se PT falhar)
             if example_en:
                 example_sentences = json.dumps([
                     {"en": example_en, "pt": example_pt or ""}
                 ])
-                cursor.execute("""
-                    UPDATE words
-                    SET example_en = %s,
-                        example_pt = %s,
-                        example_sentences = CASE
-                            WHEN (example_sentences IS NULL OR example_sentences = '') THEN %s
-                            ELSE example_sentences
-                        END
-                    WHERE id = %s
-                """, (example_en, example_pt or "", example_sentences, word_id))
-                conn.commit()
-                print(f"  [UPDATE] Atualizado no banco de dados!")
+                pending_examples.append((word_id, example_en, example_pt or "", example_sentences))
+                print(f"  [UPDATE] Exemplo salvo (gravado no proximo lote)")
                 updated += 1
             else:
                 print(f"  [FAIL] Nao conseguiu gerar exemplo")
                 failed += 1
 
-            # Rate limiting
-            time.sleep(float(delay_s))
-
             # Checkpoint
             if idx % 20 == 0:
                 print(f"\n[CHECKPOINT] {updated} atualizadas, {failed} falhas")
 
+        flush_examples(conn, cursor, pending_examples, pending_sentences)
+
         # Resumo final
         print("\n" + "="*60)
         print("[SUMMARY] RESUMO FINAL:")
@@ -299,7 +414,14 @@ if __name__ == "__main__":
     parser.add_argument("--limit", type=int, default=100, help="Quantas palavras processar (default: 100)")
     parser.add_argument("--min-id", type=int, help="Processar apenas id >= min-id")
     parser.add_argument("--max-id", type=int, help="Processar apenas id <= max-id")
-    parser.add_argument("--delay", type=float, default=0.5, help="Delay entre palavras (default: 0.5)")
+    parser.add_argument("--max-rate", type=float, default=MAX_RATE_PER_HOST, help=f"Máx. requisições/s por API (default: {MAX_RATE_PER_HOST:g}; 0 = sem limite)")
+    parser.add_argument("--concurrency", type=int, default=HTTP_CONCURRENCY, help=f"Palavras buscadas em paralelo (default: {HTTP_CONCURRENCY})")
     args = parser.parse_args()
 
-    populate_examples(limit=args.limit, min_id=args.min_id, max_id=args.max_id, delay_s=args.delay)
+    populate_examples(
+        limit=args.limit,
+        min_id=args.min_id,
+        max_id=args.max_id,
+        max_rate=args.max_rate,
+        concurrency=args.concurrency,
+    )
@@ -0,0 +1,4 @@
+-- Índices compostos para consultas de progresso filtradas por usuário
+
+CREATE INDEX IF NOT EXISTS ix_usp_user_sentence ON user_sentence_progress(user_id, sentence_id);
+CREATE INDEX IF NOT EXISTS ix_up_user_reps ON user_progress(user_id, repetitions);
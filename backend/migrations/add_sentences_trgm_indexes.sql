@@ -0,0 +1,7 @@
+-- Índices trigram (pg_trgm) para buscas ILIKE %termo% em frases.
+-- O Postgres usa índices GIN gin_trgm_ops diretamente em ILIKE, sem mudar a consulta.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS ix_sentences_english_trgm ON sentences USING gin (english gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_sentences_portuguese_trgm ON sentences USING gin (portuguese gin_trgm_ops);
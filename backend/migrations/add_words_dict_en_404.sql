@@ -0,0 +1,18 @@
+-- Marca de 404 na Free Dictionary API como coluna booleana (antes era a tag
+-- 'dict_en_404' em words.tags, filtrada com LIKE '%...%', sem índice possível).
+-- Seguro rodar mais de uma vez.
+
+ALTER TABLE words
+    ADD COLUMN IF NOT EXISTS dict_en_404 BOOLEAN NOT NULL DEFAULT FALSE;
+
+UPDATE words SET dict_en_404 = TRUE
+WHERE NOT dict_en_404 AND tags LIKE '%dict_en_404%';
+
+COMMENT ON COLUMN words.dict_en_404 IS 'Free Dictionary API returned 404 for this headword';
+
+-- Índice parcial dos candidatos ao dicionário, agora com a coluna booleana.
+-- O predicado deve ser igual ao da query de enrich_words_api.py.
+DROP INDEX IF EXISTS ix_words_dictionary_candidates;
+CREATE INDEX ix_words_dictionary_candidates ON words (id)
+WHERE english ~ '^[[:space:]]*[A-Za-z][A-Za-z''-]{0,59}[[:space:]]*$'
+  AND dict_en_404 = false;
@@ -0,0 +1,7 @@
+-- Índice parcial com os candidatos à Free Dictionary API (filtro de
+-- enrich_words_api.py no PostgreSQL): headword ASCII de uma palavra, até 60
+-- caracteres, e sem 404 anterior. O predicado deve ser igual ao da query.
+
+CREATE INDEX IF NOT EXISTS ix_words_dictionary_candidates ON words (id)
+WHERE english ~ '^[[:space:]]*[A-Za-z][A-Za-z''-]{0,59}[[:space:]]*$'
+  AND coalesce(tags, '') NOT LIKE '%dict_en_404%';
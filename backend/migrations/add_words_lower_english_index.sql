@@ -0,0 +1,3 @@
+-- Índice funcional para buscas case-insensitive por palavra (lower(english) IN (...))
+
+CREATE INDEX IF NOT EXISTS ix_words_lower_english ON words (LOWER(english));
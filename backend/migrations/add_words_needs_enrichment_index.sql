@@ -0,0 +1,11 @@
+-- Índice parcial com as palavras pendentes de enriquecimento (filtro padrão de
+-- enrich_words_api.py). O predicado deve ser igual ao OR usado na query.
+
+CREATE INDEX IF NOT EXISTS ix_words_needs_enrichment ON words (id)
+WHERE word_type IS NULL OR word_type = ''
+   OR definition_en IS NULL OR definition_en = ''
+   OR synonyms IS NULL OR synonyms = ''
+   OR antonyms IS NULL OR antonyms = ''
+   OR collocations IS NULL OR collocations = ''
+   OR usage_notes IS NULL OR usage_notes = ''
+   OR ipa IS NULL OR ipa = '';
@@ -12,17 +12,292 @@ Robustez
 - Reutiliza conexão via requests.Session
 - Cache em memória por execução (evita reconsulta repetida)
 - Retentativas com backoff em 429/5xx (reduz falhas por rate limit)
+- Variante assíncrona (httpx) para lotes: várias palavras em paralelo com
+  limite global de requisições por segundo, ajustado por AIMD (AdaptiveRate)
+- Cache persistente opcional em SQLite (enable_disk_cache): reexecuções não
+  voltam à rede para o que já foi consultado
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
+import os
 import random
+import sqlite3
+import threading
 import time
-from typing import Dict, List, Optional
+from collections import deque
+from typing import Dict, Iterable, List, Optional
 
+import httpx
 import requests
 
+try:
+    import uvloop  # vem com uvicorn[standard]
+except Exception:  # pragma: no cover
+    uvloop = None  # type: ignore[assignment]
+
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+_HEADERS = {
+    "User-Agent": "idiomasbr2026/word-enrichment (requests)",
+    "Accept": "application/json",
+}
+
+
+class DictionaryLookupError(Exception):
+    """Consulta falhou por 429/5xx/rede depois de todas as tentativas (não é um 404)."""
+
+
+def _retry_after_seconds(resp) -> Optional[float]:
+    retry_after_hdr = resp.headers.get("Retry-After")
+    if not retry_after_hdr:
+        return None
+    try:
+        return float(retry_after_hdr)
+    except ValueError:
+        return None
+
+
+def _backoff_seconds(
+    attempt: int,
+    retry_after_s: Optional[float] = None,
+    *,
+    base_s: float = 0.6,
+    max_s: float = 8.0,
+) -> float:
+    """Espera antes da tentativa `attempt` + 1 (1-based); Retry-After tem prioridade."""
+    if retry_after_s is not None and retry_after_s > 0:
+        return min(retry_after_s, max_s)
+
+    # Exponential backoff with jitter
+    exp = min(max_s, base_s * (2 ** max(0, attempt - 1)))
+    jitter = random.uniform(0, min(0.25, exp))
+    return min(max_s, exp + jitter)
+
+
+DEFAULT_DISK_CACHE_PATH = os.path.join("~", ".cache", "idiomabr_dict.sqlite")
+DISK_CACHE_TTL_SECONDS = 30 * 86400
+
+_MISS = object()
+
+
+class DiskCache:
+    """Cache persistente (SQLite) das respostas JSON, chaveado por URL + params.
+
+    Guarda respostas 200 e também 404 (como null), para que palavras
+    inexistentes não sejam consultadas de novo a cada execução.
+    """
+
+    def __init__(self, path: str, *, ttl_seconds: float = DISK_CACHE_TTL_SECONDS):
+        path = os.path.expanduser(path)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._ttl_seconds = float(ttl_seconds)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS api_cache ("
+                "key TEXT PRIMARY KEY, payload TEXT NOT NULL, stored_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(url: str, params: Optional[dict]) -> str:
+        if not params:
+            return url
+        return url + "?" + json.dumps(params, sort_keys=True)
+
+    def get(self, key: str) -> object:
+        """Retorna o payload salvo ou _MISS."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, stored_at FROM api_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or time.time() - row[1] > self._ttl_seconds:
+            return _MISS
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            return _MISS
+
+    def set(self, key: str, payload: object) -> None:
+        try:
+            encoded = json.dumps(payload)
+        except (TypeError, ValueError):
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO api_cache (key, payload, stored_at) VALUES (?, ?, ?)",
+                (key, encoded, time.time()),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_THREAD_LOOP = threading.local()
+
+
+def run_async(coro):
+    """Como asyncio.run, mas reaproveita um event loop por thread (uvloop se houver).
+
+    Para scripts que chamam código async várias vezes (uma por página/palavra):
+    evita criar e destruir um loop a cada chamada.
+    """
+    loop = getattr(_THREAD_LOOP, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        _THREAD_LOOP.loop = loop
+    return loop.run_until_complete(coro)
+
+
+def close_thread_loop() -> None:
+    """Fecha o loop de run_async desta thread (se existir)."""
+    loop = getattr(_THREAD_LOOP, "loop", None)
+    if loop is not None and not loop.is_closed():
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+    _THREAD_LOOP.loop = None
+
+
+class AdaptiveRate:
+    """Taxa de requisições/s ajustada por AIMD.
+
+    Sobe `increase` por resposta enquanto a latência média (últimas `window`
+    respostas) fica abaixo de `target_latency_s`, até `max_rate`; cai pela
+    metade em 429/5xx/erro de rede, até `min_rate`. Um Retry-After pausa todas
+    as requisições pelo tempo pedido.
+
+    Não guarda nada ligado ao event loop, então pode ser reaproveitada entre
+    chamadas de enrich_words_from_api (ex.: uma por página).
+    """
+
+    def __init__(
+        self,
+        max_rate: float,
+        *,
+        min_rate: float = 0.5,
+        increase: float = 0.5,
+        target_latency_s: float = 1.0,
+        window: int = 20,
+    ):
+        self.max_rate = float(max_rate)
+        self.min_rate = min(float(min_rate), self.max_rate)
+        self.rate = self.max_rate
+        self.increase = float(increase)
+        self.target_latency_s = float(target_latency_s)
+        self.paused_until = 0.0
+        self._latencies: deque = deque(maxlen=max(1, window))
+
+    def on_success(self, latency_s: float) -> None:
+        self._latencies.append(latency_s)
+        if sum(self._latencies) / len(self._latencies) <= self.target_latency_s:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self, retry_after_s: Optional[float] = None) -> None:
+        self.rate = max(self.min_rate, self.rate * 0.5)
+        if retry_after_s:
+            self.paused_until = max(self.paused_until, time.monotonic() + retry_after_s)
+
+
+class AsyncRateLimiter:
+    """Espaça o início das requisições conforme a taxa atual de um AdaptiveRate.
+
+    Sem `rate`, usa um AdaptiveRate próprio começando em `max_rate`;
+    `max_rate` <= 0 desliga o limite.
+    """
+
+    def __init__(self, max_rate: float, *, rate: Optional[AdaptiveRate] = None):
+        if rate is None and max_rate and max_rate > 0:
+            rate = AdaptiveRate(max_rate)
+        self.rate = rate
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        if self.rate is None:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_at, self.rate.paused_until)
+            self._next_at = start + 1.0 / self.rate.rate
+        delay = start - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def on_success(self, latency_s: float) -> None:
+        if self.rate is not None:
+            self.rate.on_success(latency_s)
+
+    def on_throttle(self, retry_after_s: Optional[float] = None) -> None:
+        if self.rate is not None:
+            self.rate.on_throttle(retry_after_s)
+
+
+async def get_with_limiter(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    params: Optional[dict] = None,
+    limiter: Optional[AsyncRateLimiter] = None,
+    max_attempts: int = 3,
+    timeout: Optional[float] = None,
+    backoff_base_s: float = 0.6,
+    backoff_max_s: float = 8.0,
+) -> Optional[httpx.Response]:
+    """GET passando pelo `limiter` (um por host).
+
+    429/5xx e erros de rede reduzem a taxa do limiter (e um Retry-After pausa
+    o host inteiro); respostas boas a deixam subir. Repete essas falhas até
+    `max_attempts` vezes, com backoff exponencial. Retorna a última resposta
+    (pode ser um 429/5xx), ou None se a rede falhou em todas as tentativas.
+    """
+    resp: Optional[httpx.Response] = None
+    for attempt in range(1, max(1, max_attempts) + 1):
+        last = attempt >= max_attempts
+        try:
+            if limiter is not None:
+                await limiter.wait()
+            started = time.monotonic()
+            resp = await client.get(
+                url,
+                params=params,
+                timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+            )
+        except httpx.TransportError:
+            if limiter is not None:
+                limiter.on_throttle()
+            if last:
+                return None
+            await asyncio.sleep(_backoff_seconds(attempt, base_s=backoff_base_s, max_s=backoff_max_s))
+            continue
+
+        if resp.status_code in _RETRY_STATUSES:
+            retry_after_s = _retry_after_seconds(resp)
+            if limiter is not None:
+                limiter.on_throttle(retry_after_s)
+            if last:
+                return resp
+            # Com Retry-After o próprio limiter segura a próxima tentativa
+            if not retry_after_s or limiter is None or limiter.rate is None:
+                await asyncio.sleep(
+                    _backoff_seconds(attempt, retry_after_s, base_s=backoff_base_s, max_s=backoff_max_s)
+                )
+            continue
+
+        if limiter is not None:
+            limiter.on_success(time.monotonic() - started)
+        return resp
+    return resp
+
 
 class DictionaryAPI:
     """Classe principal para buscar dados de dicionários online."""
@@ -46,25 +321,34 @@ class DictionaryAPI:
 
         # Keep-alive + connection pooling
         self._session = requests.Session()
-        self._session.headers.update(
-            {
-                "User-Agent": "idiomasbr2026/word-enrichment (requests)",
-                "Accept": "application/json",
-            }
+        self._session.headers.update(_HEADERS)
+
+        # Cache persistente entre execuções (desligado por padrão; ver enable_disk_cache)
+        self.disk_cache: Optional[DiskCache] = None
+
+    def _disk_get(self, url: str, params: Optional[dict]) -> object:
+        if self.disk_cache is None:
+            return _MISS
+        return self.disk_cache.get(DiskCache.make_key(url, params))
+
+    def _disk_set(self, url: str, params: Optional[dict], payload: object) -> None:
+        if self.disk_cache is not None:
+            self.disk_cache.set(DiskCache.make_key(url, params), payload)
+
+    def _backoff_seconds(self, attempt: int, retry_after_s: Optional[float] = None) -> float:
+        return _backoff_seconds(
+            attempt, retry_after_s, base_s=self._backoff_base_s, max_s=self._backoff_max_s
         )
 
     def _sleep_backoff(self, attempt: int, retry_after_s: Optional[float] = None) -> None:
-        if retry_after_s is not None and retry_after_s > 0:
-            time.sleep(min(retry_after_s, self._backoff_max_s))
-            return
-
-        # Exponential backoff with jitter
-        exp = min(self._backoff_max_s, self._backoff_base_s * (2 ** max(0, attempt - 1)))
-        jitter = random.uniform(0, min(0.25, exp))
-        time.sleep(min(self._backoff_max_s, exp + jitter))
+        time.sleep(self._backoff_seconds(attempt, retry_after_s))
 
     def _get_json(self, url: str, *, params: Optional[dict] = None) -> Optional[object]:
         """GET com retries/backoff para erros transitórios."""
+        cached = self._disk_get(url, params)
+        if cached is not _MISS:
+            return cached
+
         last_exc: Optional[Exception] = None
 
         for attempt in range(1, self._max_retries + 1):
@@ -72,24 +356,19 @@ class DictionaryAPI:
                 resp = self._session.get(url, params=params, timeout=self._timeout_s)
 
                 if resp.status_code == 200:
-                    return resp.json()
+                    payload = resp.json()
+                    self._disk_set(url, params, payload)
+                    return payload
 
                 # Not found: não adianta retry
                 if resp.status_code == 404:
+                    self._disk_set(url, params, None)
                     return None
 
                 # Rate limit / transient server failures
-                if resp.status_code in (429, 500, 502, 503, 504):
-                    retry_after_hdr = resp.headers.get("Retry-After")
-                    retry_after_s: Optional[float] = None
-                    if retry_after_hdr:
-                        try:
-                            retry_after_s = float(retry_after_hdr)
-                        except ValueError:
-                            retry_after_s = None
-
+                if resp.status_code in _RETRY_STATUSES:
                     if attempt < self._max_retries:
-                        self._sleep_backoff(attempt, retry_after_s=retry_after_s)
+                        self._sleep_backoff(attempt, retry_after_s=_retry_after_seconds(resp))
                         continue
                     return None
 
@@ -106,6 +385,85 @@ class DictionaryAPI:
             print(f"⚠️  Erro ao buscar URL: {url} ({last_exc})")
         return None
 
+    async def _get_json_async(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        *,
+        params: Optional[dict] = None,
+        limiter: Optional[AsyncRateLimiter] = None,
+    ) -> Optional[object]:
+        """Mesma política de _get_json (retries/backoff), via httpx assíncrono.
+
+        Diferente de _get_json, falhas transitórias que esgotam as tentativas
+        levantam DictionaryLookupError em vez de virar None (None = 404/4xx).
+        """
+        cached = self._disk_get(url, params)
+        if cached is not _MISS:
+            return cached
+
+        resp = await get_with_limiter(
+            client,
+            url,
+            params=params,
+            limiter=limiter,
+            max_attempts=self._max_retries,
+            timeout=self._timeout_s,
+            backoff_base_s=self._backoff_base_s,
+            backoff_max_s=self._backoff_max_s,
+        )
+        if resp is None:
+            raise DictionaryLookupError(f"Erro de rede ao buscar URL: {url}")
+        if resp.status_code in _RETRY_STATUSES:
+            raise DictionaryLookupError(f"HTTP {resp.status_code} em {url}")
+
+        if resp.status_code == 200:
+            try:
+                payload = resp.json()
+            except ValueError as e:
+                raise DictionaryLookupError(f"Resposta inválida de {url}") from e
+            self._disk_set(url, params, payload)
+            return payload
+
+        if resp.status_code == 404:
+            self._disk_set(url, params, None)
+            return None
+
+        # Outros 4xx
+        return None
+
+    def _word_data_from_payload(self, headword: str, payload) -> Optional[Dict]:
+        if not payload:
+            return None
+
+        try:
+            data = payload[0]  # Primeira entrada
+        except Exception:
+            return None
+
+        result = self._parse_free_dict_response(data)
+
+        # Salvar em cache
+        self.cache[headword] = result
+        return result
+
+    async def get_word_data_async(
+        self,
+        client: httpx.AsyncClient,
+        word: str,
+        *,
+        limiter: Optional[AsyncRateLimiter] = None,
+    ) -> Optional[Dict]:
+        """Versão assíncrona de get_word_data (mesmo cache em memória)."""
+        headword = (word or "").strip().lower()
+        if not headword:
+            return None
+        if headword in self.cache:
+            return self.cache[headword]
+
+        payload = await self._get_json_async(client, f"{self.free_dict_url}{headword}", limiter=limiter)
+        return self._word_data_from_payload(headword, payload)
+
     def get_word_data(self, word: str) -> Optional[Dict]:
         """
         Busca dados completos de uma palavra usando Free Dictionary API.
@@ -131,19 +489,7 @@ class DictionaryAPI:
             return self.cache[headword]
 
         payload = self._get_json(f"{self.free_dict_url}{headword}")
-        if not payload:
-            return None
-
-        try:
-            data = payload[0]  # Primeira entrada
-        except Exception:
-            return None
-
-        result = self._parse_free_dict_response(data)
-
-        # Salvar em cache
-        self.cache[headword] = result
-        return result
+        return self._word_data_from_payload(headword, payload)
 
     def _parse_free_dict_response(self, data: Dict) -> Dict:
         """Parser para Free Dictionary API."""
@@ -239,15 +585,7 @@ class DictionaryAPI:
             return []
 
         payload = self._get_json(self.datamuse_url, params={"rel_syn": headword, "max": 10})
-        if not payload or not isinstance(payload, list):
-            return []
-
-        out: list[str] = []
-        for item in payload[:5]:
-            w = item.get("word") if isinstance(item, dict) else None
-            if isinstance(w, str) and w:
-                out.append(w)
-        return out
+        return _datamuse_words(payload, 5)
 
     def get_collocations_datamuse(self, word: str) -> List[str]:
         """
@@ -258,15 +596,41 @@ class DictionaryAPI:
             return []
 
         payload = self._get_json(self.datamuse_url, params={"lc": headword, "max": 10})
-        if not payload or not isinstance(payload, list):
+        return _datamuse_words(payload, 6)
+
+    async def get_datamuse_async(
+        self,
+        client: httpx.AsyncClient,
+        word: str,
+        relation: str,
+        *,
+        limiter: Optional[AsyncRateLimiter] = None,
+    ) -> List[str]:
+        """Sinônimos (relation="rel_syn") ou colocações (relation="lc") via Datamuse."""
+        headword = (word or "").strip().lower()
+        if not headword:
+            return []
+
+        try:
+            payload = await self._get_json_async(
+                client, self.datamuse_url, params={relation: headword, "max": 10}, limiter=limiter
+            )
+        except DictionaryLookupError:
+            # Datamuse só complementa; a falha não invalida o resto da palavra
             return []
+        return _datamuse_words(payload, 5 if relation == "rel_syn" else 6)
 
-        out: list[str] = []
-        for item in payload[:6]:
-            w = item.get("word") if isinstance(item, dict) else None
-            if isinstance(w, str) and w:
-                out.append(w)
-        return out
+
+def _datamuse_words(payload, limit: int) -> List[str]:
+    if not payload or not isinstance(payload, list):
+        return []
+
+    out: list[str] = []
+    for item in payload[:limit]:
+        w = item.get("word") if isinstance(item, dict) else None
+        if isinstance(w, str) and w:
+            out.append(w)
+    return out
 
 
 # Tradutor simples usando dicionário local
@@ -338,20 +702,7 @@ def enrich_word_from_api(word: str) -> Optional[Dict]:
     if not word_data:
         synonyms = api.get_synonyms_datamuse(word)
         collocations = api.get_collocations_datamuse(word)
-
-        if not synonyms and not collocations:
-            return None
-
-        return {
-            "word_type": None,
-            "definition_en": None,
-            "synonyms": ", ".join(synonyms) if synonyms else None,
-            "antonyms": None,
-            "example_sentences": [],
-            "ipa": None,
-            "audio_url": None,
-            "collocations": collocations or None,
-        }
+        return _datamuse_only_result(synonyms, collocations)
 
     # Complementar com sinônimos (se necessário)
     if not word_data.get("synonyms"):
@@ -367,10 +718,118 @@ def enrich_word_from_api(word: str) -> Optional[Dict]:
     return word_data
 
 
+def _datamuse_only_result(synonyms: List[str], collocations: List[str]) -> Optional[Dict]:
+    if not synonyms and not collocations:
+        return None
+
+    return {
+        "word_type": None,
+        "definition_en": None,
+        "synonyms": ", ".join(synonyms) if synonyms else None,
+        "antonyms": None,
+        "example_sentences": [],
+        "ipa": None,
+        "audio_url": None,
+        "collocations": collocations or None,
+    }
+
+
+async def enrich_word_from_api_async(
+    client: httpx.AsyncClient,
+    word: str,
+    *,
+    limiter: Optional[AsyncRateLimiter] = None,
+) -> Optional[Dict]:
+    """Versão assíncrona de enrich_word_from_api (mesmo resultado)."""
+    api = _DEFAULT_API
+
+    word_data = await api.get_word_data_async(client, word, limiter=limiter)
+
+    if not word_data:
+        synonyms, collocations = await asyncio.gather(
+            api.get_datamuse_async(client, word, "rel_syn", limiter=limiter),
+            api.get_datamuse_async(client, word, "lc", limiter=limiter),
+        )
+        return _datamuse_only_result(synonyms, collocations)
+
+    if not word_data.get("synonyms"):
+        synonyms = await api.get_datamuse_async(client, word, "rel_syn", limiter=limiter)
+        if synonyms:
+            word_data["synonyms"] = ", ".join(synonyms)
+
+    collocations = await api.get_datamuse_async(client, word, "lc", limiter=limiter)
+    if collocations:
+        word_data["collocations"] = collocations
+
+    return word_data
+
+
+async def enrich_words_from_api_async(
+    words: Iterable[str],
+    *,
+    concurrency: int = 8,
+    max_rate: float = 10.0,
+    rate: Optional[AdaptiveRate] = None,
+) -> Dict[str, Optional[Dict]]:
+    """
+    Enriquece várias palavras em paralelo.
+
+    `concurrency` limita palavras em andamento; `max_rate` limita requisições
+    por segundo somando todas as APIs (a taxa efetiva se adapta: cai em
+    429/5xx e volta a subir depois). Passe o mesmo `rate` entre chamadas
+    para manter esse ajuste. Retorna {palavra: dados ou None}; None quer dizer
+    "não encontrada". Palavras cuja consulta falhou (429/5xx/rede esgotando
+    as tentativas, ou erro inesperado) ficam fora do dict.
+    """
+    unique = list(dict.fromkeys(w for w in words if w))
+    if not unique:
+        return {}
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    limiter = AsyncRateLimiter(max_rate, rate=rate)
+    limits = httpx.Limits(max_connections=max(1, concurrency) * 2)
+    failed = object()
+
+    async with httpx.AsyncClient(headers=_HEADERS, limits=limits) as client:
+        async def one(word: str):
+            async with semaphore:
+                try:
+                    return await enrich_word_from_api_async(client, word, limiter=limiter)
+                except Exception as e:
+                    print(f"⚠️  Erro ao enriquecer '{word}': {e}")
+                    return failed
+
+        results = await asyncio.gather(*(one(word) for word in unique))
+
+    return {word: data for word, data in zip(unique, results) if data is not failed}
+
+
+def enrich_words_from_api(words: Iterable[str], **kwargs) -> Dict[str, Optional[Dict]]:
+    """Atalho síncrono para enrich_words_from_api_async (scripts)."""
+    return run_async(enrich_words_from_api_async(words, **kwargs))
+
+
 # Instância singleton por processo para cache + pooling de conexões
 _DEFAULT_API = DictionaryAPI()
 
 
+def enable_disk_cache(
+    path: Optional[str] = None,
+    *,
+    ttl_seconds: float = DISK_CACHE_TTL_SECONDS,
+) -> DiskCache:
+    """Liga o cache persistente da instância padrão (usado pelos scripts de enriquecimento).
+
+    Caminho: `path`, ou DICT_API_CACHE_PATH, ou ~/.cache/idiomabr_dict.sqlite.
+    """
+    cache = DiskCache(
+        path or os.getenv("DICT_API_CACHE_PATH") or DEFAULT_DISK_CACHE_PATH,
+        ttl_seconds=ttl_seconds,
+    )
+    _DEFAULT_API.disk_cache = cache
+    return cache
+
+
 # Teste
 if __name__ == "__main__":
     # Teste com algumas palavras
@@ -0,0 +1,59 @@
+from app.services.conversation_ai_service import ConversationAIService
+from app.services.session_store import InMemorySessionStore
+
+
+def _service(monkeypatch):
+    service = ConversationAIService()
+    service.store = InMemorySessionStore()
+    monkeypatch.setattr(service, "_chat", lambda messages, **kwargs: ("Nice!", "test-model", {}))
+    return service
+
+
+def test_messages_are_stored_apart_from_conversation_metadata(monkeypatch):
+    service = _service(monkeypatch)
+    conversation_id = service.create_conversation(user_id=1)["conversation_id"]
+
+    service.send_message(conversation_id, "Hello")
+    service.send_message(conversation_id, "How are you?")
+
+    metadata = service.store.get(service._key(conversation_id))
+    assert "messages" not in metadata
+    assert metadata["message_count"] == 4
+
+    stored = service.store.get_list(service._messages_key(conversation_id))
+    assert [m["content"] for m in stored] == ["Hello", "Nice!", "How are you?", "Nice!"]
+    assert service.get_conversation_history(conversation_id) == stored
+    assert "messages" not in service.get_conversation(conversation_id, include_messages=False)
+
+
+def test_back_to_back_turns_see_the_previous_turn_in_order(monkeypatch):
+    service = _service(monkeypatch)
+    conversation_id = service.create_conversation(user_id=1)["conversation_id"]
+    prompts = []
+    monkeypatch.setattr(
+        service,
+        "_chat",
+        lambda messages, **kwargs: prompts.append([m["content"] for m in messages[1:]])
+        or (f"reply {len(prompts)}", "test-model", {}),
+    )
+
+    service.send_message(conversation_id, "first")
+    service.send_message(conversation_id, "second")
+
+    assert prompts[1] == ["first", "reply 1", "second"]
+    history = service.get_conversation_history(conversation_id)
+    assert [m["content"] for m in history] == ["first", "reply 1", "second", "reply 2"]
+    metadata = service.store.get(service._key(conversation_id))
+    assert metadata["message_count"] == 4
+    assert metadata["last_message"].startswith("reply 2")
+
+
+def test_lesson_turns_are_saved_before_returning(monkeypatch):
+    service = _service(monkeypatch)
+    conversation_id = service.create_lesson(user_id=1, questions=["Q1?", "Q2?"])["conversation_id"]
+
+    service.send_lesson_message(conversation_id, "My answer")
+
+    conversation = service.get_conversation(conversation_id)
+    assert conversation["lesson"]["answers"] == ["My answer"]
+    assert conversation["messages"][0]["content"] == "My answer"
@@ -0,0 +1,198 @@
+import asyncio
+import smtplib
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.routes import support
+from app.schemas.support import SupportContactRequest
+from app.services import email_queue as email_queue_module
+from app.services import email_service
+from app.services.email_queue import EmailQueue
+
+
+class _FakeSmtp:
+    def __init__(self, noop_code=250):
+        self.noop_code = noop_code
+        self.sent = []
+        self.quit_called = False
+
+    def noop(self):
+        if isinstance(self.noop_code, Exception):
+            raise self.noop_code
+        return (self.noop_code, b"OK")
+
+    def send_message(self, msg):
+        self.sent.append(msg)
+
+    def quit(self):
+        self.quit_called = True
+
+    def close(self):
+        self.quit_called = True
+
+
+def _cfg():
+    return email_service._SmtpCfg(
+        host="smtp.example.com",
+        port=465,
+        ssl=True,
+        tls=False,
+        user="",
+        password="",
+        from_="admin@example.com",
+        support="support@example.com",
+        ready=True,
+    )
+
+
+def _pool_with_fake_connect(monkeypatch, **kwargs):
+    pool = email_service._SmtpPool(**kwargs)
+    opened = []
+
+    def _connect(cfg):
+        smtp = _FakeSmtp()
+        opened.append(smtp)
+        return smtp
+
+    monkeypatch.setattr(pool, "_connect", _connect)
+    return pool, opened
+
+
+def test_email_queue_sends_submissions_as_one_batch(monkeypatch):
+    batches = []
+
+    def _send_messages(messages):
+        batches.append(list(messages))
+        return [None if msg != "bad" else RuntimeError("rejected") for msg in messages]
+
+    monkeypatch.setattr(email_queue_module.email_service, "send_messages", _send_messages)
+    queue = EmailQueue(max_batch=10, max_wait=0.05)
+
+    async def _run():
+        futures = [queue.submit(msg) for msg in ("a", "bad", "c")]
+        return await asyncio.gather(*futures, return_exceptions=True)
+
+    results = asyncio.run(_run())
+
+    assert batches == [["a", "bad", "c"]]
+    assert results[0] is None and results[2] is None
+    assert isinstance(results[1], RuntimeError)
+
+
+def test_email_queue_splits_batches_at_max_batch(monkeypatch):
+    batches = []
+    monkeypatch.setattr(
+        email_queue_module.email_service,
+        "send_messages",
+        lambda messages: batches.append(list(messages)) or [None] * len(messages),
+    )
+    queue = EmailQueue(max_batch=2, max_wait=0.05)
+
+    async def _run():
+        await asyncio.gather(*(queue.submit(n) for n in range(5)))
+
+    asyncio.run(_run())
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+
+
+def test_email_queue_fails_every_future_when_the_batch_raises(monkeypatch):
+    def _send_messages(messages):
+        raise ValueError("SMTP not configured")
+
+    monkeypatch.setattr(email_queue_module.email_service, "send_messages", _send_messages)
+    queue = EmailQueue(max_batch=10, max_wait=0.01)
+
+    async def _run():
+        return await asyncio.gather(queue.submit("a"), queue.submit("b"), return_exceptions=True)
+
+    results = asyncio.run(_run())
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def _contact_support(monkeypatch, failing):
+    sent = []
+
+    def _send_messages(messages):
+        sent.extend(messages)
+        return [RuntimeError("smtp down") if msg in failing else None for msg in messages]
+
+    monkeypatch.setattr(email_queue_module.email_service, "send_messages", _send_messages)
+    monkeypatch.setattr(email_queue_module, "email_queue", EmailQueue(max_batch=10, max_wait=0.01))
+    monkeypatch.setattr(support, "is_smtp_configured", lambda: True)
+    monkeypatch.setattr(support, "build_support_message_to_team", lambda **kwargs: "team")
+    monkeypatch.setattr(support, "build_support_acknowledgement", lambda **kwargs: "ack")
+    payload = SupportContactRequest(subject="Need help", message="Something is broken here")
+    user = SimpleNamespace(name="Ana", email="ana@example.com", phone_number=None)
+    return sent, lambda: asyncio.run(support.contact_support(payload, current_user=user))
+
+
+def test_contact_support_sends_ack_after_team_email(monkeypatch):
+    sent, contact = _contact_support(monkeypatch, failing=())
+
+    assert contact() == {"message": "Mensagem enviada ao suporte com sucesso."}
+    assert sent == ["team", "ack"]
+
+
+def test_contact_support_skips_ack_when_team_email_fails(monkeypatch):
+    sent, contact = _contact_support(monkeypatch, failing=("team",))
+
+    with pytest.raises(HTTPException):
+        contact()
+    assert sent == ["team"]
+
+
+def test_smtp_pool_reuses_connection_and_retires_after_max_messages(monkeypatch):
+    pool, opened = _pool_with_fake_connect(monkeypatch, max_messages=2)
+    cfg = _cfg()
+
+    for _ in range(3):
+        with pool.get_conn(cfg) as smtp:
+            smtp.send_message("msg")
+
+    # Two messages on the first connection, which is then retired; the third opens a new one.
+    assert len(opened) == 2
+    assert len(opened[0].sent) == 2 and opened[0].quit_called
+    assert len(opened[1].sent) == 1 and not opened[1].quit_called
+
+
+def test_smtp_pool_reconnects_when_noop_fails(monkeypatch):
+    pool, opened = _pool_with_fake_connect(monkeypatch)
+    cfg = _cfg()
+
+    with pool.get_conn(cfg):
+        pass
+    opened[0].noop_code = smtplib.SMTPServerDisconnected("gone")
+    with pool.get_conn(cfg) as smtp:
+        assert smtp is not opened[0]
+
+    assert len(opened) == 2
+    assert opened[0].quit_called
+
+
+def test_smtp_pool_retires_connection_after_max_age(monkeypatch):
+    pool, opened = _pool_with_fake_connect(monkeypatch, max_age_seconds=0)
+    cfg = _cfg()
+
+    with pool.get_conn(cfg):
+        pass
+    with pool.get_conn(cfg):
+        pass
+
+    assert len(opened) == 2
+
+
+def test_smtp_pool_discards_connection_broken_mid_send(monkeypatch):
+    pool, opened = _pool_with_fake_connect(monkeypatch)
+    cfg = _cfg()
+
+    with pytest.raises(smtplib.SMTPServerDisconnected):
+        with pool.get_conn(cfg):
+            raise smtplib.SMTPServerDisconnected("dropped")
+
+    assert opened[0].quit_called
+    with pool.get_conn(cfg) as smtp:
+        assert smtp is opened[1]
@@ -0,0 +1,76 @@
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401
+import enrich_words
+from app.core.database import Base
+from app.models.word import Word
+
+
+class _FakeCursor:
+    def __init__(self):
+        self.statements = []
+        self.copied = None
+        self.closed = False
+
+    def execute(self, sql):
+        self.statements.append(sql)
+
+    def copy_expert(self, sql, buf):
+        self.statements.append(sql)
+        self.copied = buf.read()
+
+    def close(self):
+        self.closed = True
+
+
+def test_copy_text_value_escapes_copy_control_characters():
+    assert enrich_words._copy_text_value(None) == "\\N"
+    assert enrich_words._copy_text_value("a\tb\nc\rd\\e") == "a\\tb\\nc\\rd\\\\e"
+    assert enrich_words._copy_text_value(3) == "3"
+
+
+def test_copy_update_postgres_writes_one_escaped_line_per_row():
+    cursor = _FakeCursor()
+    db = SimpleNamespace(
+        connection=lambda: SimpleNamespace(connection=SimpleNamespace(cursor=lambda: cursor))
+    )
+
+    enrich_words.copy_update_postgres(
+        db,
+        [
+            {"id": 1, "example_en": "Tab\there", "tags": None},
+            {"id": 2, "example_en": "Two\nlines", "tags": "a"},
+        ],
+    )
+
+    assert cursor.copied == "1\tTab\\there\t\\N\n2\tTwo\\nlines\ta\n"
+    assert 'COPY word_enrichment_stg (id, "example_en", "tags") FROM STDIN' in cursor.statements
+    assert cursor.statements[-1].startswith("UPDATE words AS w SET")
+    assert cursor.closed
+
+
+def test_flush_updates_groups_rows_by_columns_outside_postgres():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[Word.__table__])
+    db = sessionmaker(bind=engine)()
+    for english in ("one", "two", "three"):
+        db.add(Word(english=english, portuguese="pt", level="A1"))
+    db.commit()
+    ids = [w.id for w in db.query(Word).order_by(Word.id)]
+
+    enrich_words.flush_updates(
+        db,
+        [
+            {"id": ids[0], "example_en": "First\ttab"},
+            {"id": ids[1], "tags": "x"},
+            {"id": ids[2], "example_en": "Third"},
+        ],
+    )
+
+    rows = {w.id: w for w in db.query(Word)}
+    assert rows[ids[0]].example_en == "First\ttab"
+    assert rows[ids[1]].tags == "x" and rows[ids[1]].example_en is None
+    assert rows[ids[2]].example_en == "Third"
@@ -0,0 +1,125 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401
+import enrich_words_api
+from app.core.database import Base
+from app.models.word import Word
+
+HAPPY = {
+    "word_type": "adjective",
+    "definition_en": "feeling pleasure",
+    "synonyms": "glad",
+    "ipa": "/ˈhæpi/",
+}
+
+
+@pytest.fixture()
+def session_factory(monkeypatch):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[Word.__table__])
+    factory = sessionmaker(bind=engine)
+
+    db = factory()
+    for english in ("happy", "zzz", "flaky", "quickly", "table"):
+        db.add(Word(english=english, portuguese="pt", level="A1"))
+    db.commit()
+    db.close()
+
+    monkeypatch.setattr(enrich_words_api, "translate_texts", lambda jobs, concurrency=8: {})
+    monkeypatch.setattr(enrich_words_api, "translate_en_to_pt_br", lambda text: None)
+    monkeypatch.setattr(enrich_words_api, "translate_pt_br_to_en", lambda text: None)
+    return factory
+
+
+def _fake_dictionary(pages):
+    def _enrich_words_from_api(words, **kwargs):
+        words = list(words)
+        pages.append(words)
+        # "zzz" is a real 404 (None); "flaky" failed (429/5xx) and is left out.
+        return {w: (HAPPY if w == "happy" else None) for w in words if w != "flaky"}
+
+    return _enrich_words_from_api
+
+
+def _words(factory):
+    db = factory()
+    return {w.english: w for w in db.query(Word).order_by(Word.id)}
+
+
+def test_enrich_all_words_pages_and_flags_only_real_404s(monkeypatch, session_factory):
+    pages = []
+    monkeypatch.setattr(enrich_words_api, "enrich_words_from_api", _fake_dictionary(pages))
+
+    enrich_words_api.enrich_all_words(session_factory(), commit_every=2, max_rate=0)
+
+    assert pages == [["happy", "zzz"], ["flaky", "quickly"], ["table"]]
+    words = _words(session_factory)
+    assert words["happy"].definition_en == "feeling pleasure"
+    assert words["happy"].usage_notes
+    assert words["zzz"].dict_en_404 is True
+    assert not words["flaky"].dict_en_404
+    assert words["quickly"].word_type == "adverb"
+
+
+def test_enrich_all_words_writes_only_changed_fields(monkeypatch, session_factory):
+    monkeypatch.setattr(enrich_words_api, "enrich_words_from_api", _fake_dictionary([]))
+    db = session_factory()
+    batches = []
+    original = db.bulk_update_mappings
+    monkeypatch.setattr(
+        db,
+        "bulk_update_mappings",
+        lambda mapper, mappings: batches.append(mappings) or original(mapper, mappings),
+    )
+
+    enrich_words_api.enrich_all_words(db, commit_every=2, max_rate=0)
+
+    by_id = {m["id"]: m for batch in batches for m in batch}
+    words = _words(session_factory)
+    assert set(by_id[words["zzz"].id]) == {"id", "dict_en_404"}
+    assert "portuguese" not in by_id[words["happy"].id]
+    assert "english" not in by_id[words["happy"].id]
+
+
+def test_enrich_all_words_flushes_the_page_when_interrupted(monkeypatch, session_factory):
+    monkeypatch.setattr(enrich_words_api, "enrich_words_from_api", _fake_dictionary([]))
+    original = enrich_words_api.detect_word_type_simple
+
+    def _detect(word):
+        if word == "table":
+            raise KeyboardInterrupt
+        return original(word)
+
+    monkeypatch.setattr(enrich_words_api, "detect_word_type_simple", _detect)
+
+    with pytest.raises(KeyboardInterrupt):
+        enrich_words_api.enrich_all_words(session_factory(), commit_every=3, max_rate=0)
+
+    words = _words(session_factory)
+    assert words["zzz"].dict_en_404 is True
+    # Same page as the interrupted word: processed before the interrupt, so it is saved.
+    assert words["quickly"].word_type == "adverb"
+    assert words["table"].word_type is None
+
+
+def test_words_tts_uses_one_session_per_generation(monkeypatch, tmp_path, session_factory):
+    sessions = []
+
+    class _FakeTeacher:
+        async def generate_speech(self, text, *, db=None, **kwargs):
+            sessions.append(db)
+            return b"mp3"
+
+    monkeypatch.setattr(enrich_words_api, "_get_ai_teacher_service", lambda: _FakeTeacher())
+    monkeypatch.setattr(enrich_words_api, "_words_static_dir", lambda: str(tmp_path))
+    db = session_factory()
+    words = db.query(Word).order_by(Word.id).all()
+
+    urls = enrich_words_api.generate_words_tts_audio_urls(db, words + words[:1], concurrency=4)
+
+    assert set(urls) == {w.id for w in words}
+    assert len(sessions) == len(words)
+    assert db not in sessions
+    assert len({id(s) for s in sessions}) == len(words)
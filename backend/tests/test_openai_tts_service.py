@@ -0,0 +1,91 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.openai_tts_service import OpenAITTSService
+
+
+def _lemonfox_service(handler):
+    service = OpenAITTSService()
+    service.lemonfox_enabled = True
+    service.lemonfox_api_key = "test"
+    service._http = httpx.AsyncClient(
+        base_url="https://lemonfox.test/v1",
+        transport=httpx.MockTransport(handler),
+    )
+    return service
+
+
+def _audio_handler(calls, body=b"a" * 10000, status_code=200):
+    def _handler(request):
+        calls.append(request)
+        return httpx.Response(status_code, content=body)
+
+    return _handler
+
+
+async def _collect(service, text):
+    chunks = await service.text_to_speech_stream(text=text, voice_id="nova")
+    return [chunk async for chunk in chunks]
+
+
+def test_stream_relays_chunks_and_serves_repeat_from_cache():
+    calls = []
+    service = _lemonfox_service(_audio_handler(calls))
+    service.STREAM_CHUNK_SIZE = 4096
+
+    first = asyncio.run(_collect(service, "Hello there"))
+    second = asyncio.run(_collect(service, "Hello there"))
+
+    assert len(first) > 1
+    assert b"".join(first) == b"a" * 10000
+    assert second == [b"a" * 10000]
+    assert len(calls) == 1
+
+
+def test_partially_consumed_stream_is_not_cached():
+    calls = []
+    service = _lemonfox_service(_audio_handler(calls))
+    service.STREAM_CHUNK_SIZE = 4096
+
+    async def _read_one_chunk():
+        chunks = await service.text_to_speech_stream(text="Hello", voice_id="nova")
+        await chunks.__anext__()
+        await chunks.aclose()
+
+    asyncio.run(_read_one_chunk())
+    asyncio.run(_collect(service, "Hello"))
+
+    assert len(calls) == 2
+
+
+def test_upstream_error_is_raised_before_streaming_and_not_cached():
+    calls = []
+    service = _lemonfox_service(_audio_handler(calls, body=b"nope", status_code=500))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(service.text_to_speech_stream(text="Hello", voice_id="nova"))
+
+    assert service._audio_lru == {}
+
+
+def test_in_memory_audio_cache_is_bounded():
+    service = OpenAITTSService()
+    service.AUDIO_LRU_MAX_ENTRIES = 2
+
+    async def _run():
+        await service._cache_set("k1", b"1")
+        await service._cache_set("k2", b"2")
+        assert await service._cache_get("k1") == b"1"  # k1 becomes most recent
+        await service._cache_set("k3", b"3")
+        return [await service._cache_get(key) for key in ("k1", "k2", "k3")]
+
+    assert asyncio.run(_run()) == [b"1", None, b"3"]
+
+
+def test_truncate_text_cuts_at_word_boundary(monkeypatch):
+    monkeypatch.setattr(OpenAITTSService, "MAX_INPUT_CHARS", 10)
+
+    assert OpenAITTSService._truncate_text("hello wonderful world") == "hello"
+    assert OpenAITTSService._truncate_text("  short  ") == "short"
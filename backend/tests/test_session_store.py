@@ -1,7 +1,115 @@
-from app.services.session_store import InMemorySessionStore
+import pytest
+
+from app.services.session_store import InMemorySessionStore, RedisSessionStore
+
+
+class _FakeRedis:
+    """Just enough of redis.Redis; rejects non-positive TTLs like the server does."""
+
+    def __init__(self):
+        self.data = {}
+
+    def set(self, key, value, ex=None):
+        if ex is not None and ex <= 0:
+            raise ValueError("invalid expire time")
+        self.data[key] = value
+
+    def setex(self, key, ttl, value):
+        self.set(key, value, ex=ttl)
+
+    def get(self, key):
+        value = self.data.get(key)
+        return None if isinstance(value, list) else value
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def expire(self, key, ttl):
+        if ttl <= 0:
+            self.data.pop(key, None)
+
+    def rpush(self, key, *items):
+        self.data.setdefault(key, []).extend(items)
+
+    def lrange(self, key, start, end):
+        return list(self.data.get(key, []))
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        return None
+
+
+def _redis_store():
+    store = RedisSessionStore.__new__(RedisSessionStore)
+    store.client = _FakeRedis()
+    return store
 
 
 def test_inmemory_store_expires_immediately():
     store = InMemorySessionStore()
     store.set("k", {"value": 1}, ttl_seconds=0)
     assert store.get("k") is None
+
+
+def test_inmemory_store_mget_preserves_order_and_missing_keys():
+    store = InMemorySessionStore()
+    store.set("a", {"value": 1})
+    store.set("b", {"value": 2})
+    assert store.mget(["b", "missing", "a"]) == [{"value": 2}, None, {"value": 1}]
+
+
+def test_inmemory_store_append_list_accumulates_and_deletes():
+    store = InMemorySessionStore()
+    store.append_list("msgs", [{"n": 1}], ttl_seconds=60)
+    store.append_list("msgs", [{"n": 2}, {"n": 3}], ttl_seconds=60)
+    assert store.get_list("msgs") == [{"n": 1}, {"n": 2}, {"n": 3}]
+    store.delete("msgs")
+    assert store.get_list("msgs") == []
+
+
+def test_inmemory_store_cleanup_drops_only_expired_keys():
+    store = InMemorySessionStore()
+    store.set("old", {"value": 1}, ttl_seconds=0)
+    store.set("fresh", {"value": 2}, ttl_seconds=60)
+    store.set("forever", {"value": 3})
+    store.cleanup()
+    assert "old" not in store._data
+    assert store.mget(["fresh", "forever"]) == [{"value": 2}, {"value": 3}]
+
+
+def test_inmemory_store_get_by_prefix_skips_other_and_expired_keys():
+    store = InMemorySessionStore()
+    store.set("conv:1", {"value": 1})
+    store.set("conv:2", {"value": 2}, ttl_seconds=0)
+    store.set("other:3", {"value": 3})
+    assert store.get_by_prefix("conv:") == {"conv:1": {"value": 1}}
+
+
+@pytest.mark.parametrize("make_store", [InMemorySessionStore, _redis_store], ids=["memory", "redis"])
+@pytest.mark.parametrize("ttl", [0, -5])
+def test_non_positive_ttl_expires_immediately_on_every_backend(make_store, ttl):
+    store = make_store()
+    store.set("k", {"value": 1}, ttl_seconds=ttl)
+    store.set_bytes("audio", b"mp3", ttl_seconds=ttl)
+    store.append_list("msgs", [{"n": 1}], ttl_seconds=ttl)
+    store.set("kept", {"value": 2})
+    store.expire("kept", ttl)
+
+    assert store.get("k") is None
+    assert store.get_bytes("audio") is None
+    assert store.get_list("msgs") == []
+    assert store.get("kept") is None
+
+
+@pytest.mark.parametrize("make_store", [InMemorySessionStore, _redis_store], ids=["memory", "redis"])
+def test_positive_ttl_keeps_values_on_every_backend(make_store):
+    store = make_store()
+    store.set("k", {"value": 1}, ttl_seconds=0.5)
+    store.set_bytes("audio", b"mp3", ttl_seconds=60)
+    store.append_list("msgs", [{"n": 1}], ttl_seconds=60)
+
+    assert store.get("k") == {"value": 1}
+    assert store.get_bytes("audio") == b"mp3"
+    assert store.get_list("msgs") == [{"n": 1}]
@@ -0,0 +1,53 @@
+from datetime import datetime, timezone
+from itertools import product
+from types import SimpleNamespace
+
+from app.services import spaced_repetition
+from app.services.spaced_repetition import calculate_next_review, calculate_next_review_batch
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return NOW
+
+
+def test_batch_matches_single_row_calculation(monkeypatch):
+    monkeypatch.setattr(spaced_repetition, "datetime", _FrozenDatetime)
+    # "hard" is the reset path; eases at/near 1.3 hit the minimum clamp, 2.6 the maximum.
+    grid = list(
+        product(
+            ("hard", "medium", "easy"),
+            (None, 1.3, 1.32, 1.5, 2.5, 2.6),
+            (None, -1, 0, 1, 3, 10, 40),
+            (None, 0, 1, 2, 5),
+        )
+    )
+
+    batch = calculate_next_review_batch(
+        [row[0] for row in grid],
+        [row[1] for row in grid],
+        [row[2] for row in grid],
+        [row[3] for row in grid],
+        now=NOW,
+    )
+
+    expected = [
+        calculate_next_review(
+            difficulty,
+            SimpleNamespace(ease_factor=ease, interval=interval, repetitions=reps),
+        )
+        for difficulty, ease, interval, reps in grid
+    ]
+    assert batch == expected
+
+
+def test_hard_resets_and_clamps_ease():
+    [(next_review, interval, ease, reps)] = calculate_next_review_batch(
+        ["hard"], [1.4], [10], [4], now=NOW
+    )
+
+    assert (next_review - NOW).total_seconds() == 4 * 60 * 60
+    assert (interval, ease, reps) == (0, 1.3, 0)